@@ -1,34 +1,33 @@
 #Made By Joost Boerefijn
 
-import ctypes
-import subprocess
 import sys
 import time
 import re
 from pathlib import Path
 from datetime import datetime, timedelta
-import platform
 import threading
 import queue
+from collections import deque
 import hmac
 import hashlib
 import base64
 import json
-import secrets
 import os
-import tkinter as tk
-import tkinter.font as tkfont
-from tkinter import ttk, messagebox, filedialog, simpledialog
-
-# Optional Pillow support for nicer icon resizing
-try:
-    from PIL import Image, ImageTk
-    _HAS_PIL = True
-except Exception:
-    _HAS_PIL = False
+import struct
+import atexit
+from dataclasses import dataclass, field, asdict, fields
+from abc import ABC, abstractmethod
 
+APP_SCRIPT = Path(__file__).resolve()
+LAUNCH_ARGV = sys.argv[1:]  # as started; main() pops --backend, --record, --metrics-dir etc. off sys.argv
 LOG_FILE = Path(__file__).with_suffix('.log')
-CHECK_INTERVAL = 15  # seconden
+CHECK_INTERVAL = 15  # seconden, first poll interval before a rate is known
+MIN_POLL_INTERVAL = 2  # seconden, used close to 0%
+MAX_POLL_INTERVAL = 300  # seconden, upper bound during long steady stretches
+POLL_STEP_PCT = 1.0  # aim to poll roughly once per percent of progress
+POLL_MAX_ERRORS = 5  # failed polls (or polls without a percentage for a drive) in a row before monitoring gives up
+MONITOR_WATCHDOG = 30  # seconden, how often a waiting monitor checks that the poller still runs
+MAX_PARALLEL_JOBS = 4  # drives processed at the same time
 BACKUP_DIR = Path(__file__).parent / "bitlocker_backups"
 
 COMPANY_NAME = "MenthaForce Coperation"
@@ -36,6 +35,7 @@ PRODUCT_NAME = "MenthaForce BitLocker Manager"
 VERSION = "0.1.0"
 
 LICENSE_FILE = Path(__file__).with_suffix('.lic')
+INVENTORY_FILE = Path(__file__).with_suffix('.inventory.json')  # last known volumes and backups
 TRIAL_DAYS = 7
 # NOTE: For production, use server-side signing. This local secret is only for demo/test purposes.
 LOCAL_LICENSE_SECRET = b"change-me-to-a-secure-secret"  # replace before production
@@ -59,123 +59,1047 @@ APP_ID = "MenthaForce.BitLocker.1"
 
 # ---------- Utilities ----------
 
+LOG_PANE_MAX_LINES = 5000  # scrollback kept in the GUI log pane
+LOG_PANE_TRIM_CHUNK = 500  # oldest lines are dropped in chunks of this size
+LOG_MAX_BYTES = 2 * 1024 * 1024  # rotate Bit.log when it grows past this size
+LOG_MAX_AGE = timedelta(days=7)  # ... or when it is older than this
+LOG_BACKUPS = 3  # keep Bit.log.1 .. Bit.log.N
+LOG_ROTATE_RETRY = 60  # seconds before retrying a rotation that failed (e.g. Bit.log open elsewhere)
+
+
+class LogWriter:
+    """Single background thread that drains queued log lines and writes them in batches.
+
+    Lines keep the order in which log() was called, across threads. The file stays open between
+    batches and is rotated to <name>.1 .. <name>.N on size or age. When a rotation fails, lines keep
+    going to the current file and the rotation is retried after LOG_ROTATE_RETRY seconds.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = LOG_MAX_BYTES, max_age: timedelta = LOG_MAX_AGE,
+                 backups: int = LOG_BACKUPS, echo: bool = True):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age.total_seconds()
+        self.backups = backups
+        self.echo = echo
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._file = None
+        self._opened = 0.0
+        self._rotate_after = 0.0  # monotonic time before which no rotation is tried
+
+    def write(self, entry: str) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+                    self._thread.start()
+        self._queue.put(entry)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until everything queued so far is written."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < 1000:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            lines = [e for e in batch if isinstance(e, str)]
+            if lines:
+                self._write_batch(lines)
+            for e in batch:
+                if isinstance(e, threading.Event):
+                    e.set()
+
+    def _write_batch(self, lines: list[str]) -> None:
+        text = '\n'.join(lines) + '\n'
+        if self.echo and sys.stdout is not None:
+            try:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            except Exception:
+                pass
+        try:
+            self._maybe_rotate()
+        except Exception:
+            self._rotate_after = time.monotonic() + LOG_ROTATE_RETRY
+        try:
+            if self._file is None:
+                self._open()
+            self._file.write(text)
+            self._file.flush()
+        except Exception:
+            pass
+
+    def _open(self, created: float | None = None) -> None:
+        """Open the log for appending. created: when the file was started, if this writer knows it."""
+        self._file = self.path.open('a', encoding='utf-8')
+        if created is not None:
+            # not from stat: on Windows a file recreated under the same name inherits the old
+            # creation time (file-system tunneling), so every batch would look too old
+            self._opened = created
+            return
+        try:
+            st = self.path.stat()
+            self._opened = getattr(st, 'st_birthtime', st.st_ctime)
+        except OSError:
+            self._opened = time.time()
+
+    def _maybe_rotate(self) -> None:
+        if self._file is None:
+            if not self.path.exists():
+                return
+            self._open()
+        too_big = self._file.tell() >= self.max_bytes
+        too_old = time.time() - self._opened >= self.max_age
+        if not (too_big or too_old) or time.monotonic() < self._rotate_after:
+            return
+        self._file.close()
+        self._file = None
+        for i in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._open(created=time.time())
+
+
+_log_writer = LogWriter(LOG_FILE)
+atexit.register(_log_writer.close)
+
+
 def log(msg: str) -> None:
     timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
-    entry = f"[{timestamp}] {msg}"
-    print(entry)
-    try:
-        with LOG_FILE.open('a', encoding='utf-8') as f:
-            f.write(entry + '\n')
-    except Exception:
-        pass
+    _log_writer.write(f"[{timestamp}] {msg}")
 
 
 def is_windows() -> bool:
-    return platform.system() == 'Windows'
+    return sys.platform == 'win32'
 
 
 def is_admin() -> bool:
     try:
+        import ctypes
         return ctypes.windll.shell32.IsUserAnAdmin()  # type: ignore
     except Exception:
         return False
 
 
-def run_cmd(cmd: list[str]) -> tuple[int, str]:
+# seconds per command type, keyed by (program, first argument); a hung call is killed after this long
+CMD_TIMEOUTS = {
+    ('manage-bde', '-status'): 60,
+    ('manage-bde', '-protectors'): 60,
+    ('manage-bde', '-off'): 120,
+}
+CMD_DEFAULT_TIMEOUT = 300
+RC_TIMEOUT = 124
+RC_CANCELLED = 130
+
+_cmd_context = threading.local()
+_cmd_hook = None  # CommandRecorder / CommandPlayer: sees every run_cmd and run_powershell call
+
+
+class CommandCancelled(Exception):
+    """The cancel event was set while a command was running."""
+
+
+class cancel_scope:
+    """Make a CancelEvent the default for run_cmd/run_powershell calls on this thread:
+
+        with cancel_scope(stop_event):
+            backup_recovery_key(drive)   # setting stop_event kills the running manage-bde
+    """
+
+    def __init__(self, event: 'CancelEvent | None'):
+        self.event = event
+
+    def __enter__(self):
+        self._previous = getattr(_cmd_context, 'cancel', None)
+        _cmd_context.cancel = self.event
+        return self.event
+
+    def __exit__(self, *exc):
+        _cmd_context.cancel = self._previous
+
+
+def current_cancel_event() -> 'CancelEvent | None':
+    return getattr(_cmd_context, 'cancel', None)
+
+
+def _cmd_timeout(cmd: list[str]) -> float:
+    program = re.split(r'[\\/]', cmd[0])[-1].lower().removesuffix('.exe') if cmd else ''
+    return CMD_TIMEOUTS.get((program, cmd[1].lower() if len(cmd) > 1 else ''), CMD_DEFAULT_TIMEOUT)
+
+
+def _kill_process_tree(pid: int) -> None:
+    """Kill a process and everything it started. POSIX children run in their own session for this."""
     try:
-        p = subprocess.run(cmd, capture_output=True, text=True)
-        out = p.stdout + p.stderr
-        return p.returncode, out
+        if is_windows():
+            import subprocess
+            subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], capture_output=True)
+        else:
+            import signal
+            os.killpg(pid, signal.SIGKILL)
+    except (OSError, ProcessLookupError):
+        pass
+
+
+def run_cmd(cmd: list[str], timeout: float | None = None, cancel: 'CancelEvent | None' = None,
+            on_output=None) -> tuple[int, str]:
+    """Run a command and return (returncode, stdout + stderr).
+
+    The process is killed, with its children, when it runs longer than timeout (default: CMD_TIMEOUTS
+    for its type; rc RC_TIMEOUT) or when cancel is set (default: the thread's cancel_scope; rc
+    RC_CANCELLED). on_output(stream, line) is called for every line as it arrives.
+    """
+    if cancel is None:
+        cancel = current_cancel_event()
+    t0 = time.perf_counter()
+    if _cmd_hook is not None:
+        rc, out = _cmd_hook(cmd, lambda: _run_cmd(cmd, timeout, cancel, on_output), cancel, on_output)
+    else:
+        rc, out = _run_cmd(cmd, timeout, cancel, on_output)
+    record_command(cmd, rc, time.perf_counter() - t0)
+    return rc, out
+
+
+def _run_cmd(cmd: list[str], timeout: float | None, cancel, on_output) -> tuple[int, str]:
+    import asyncio  # lazy: license/dev-code commands never start a process
+    if cancel is not None and cancel.is_set():
+        return RC_CANCELLED, f"Geannuleerd: {' '.join(cmd)}"
+    return asyncio.run(_run_cmd_async(cmd, timeout or _cmd_timeout(cmd), cancel, on_output))
+
+
+async def _run_cmd_async(cmd: list[str], timeout: float, cancel, on_output) -> tuple[int, str]:
+    import asyncio
+    import locale
+    encoding = locale.getpreferredencoding(False)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, limit=1 << 20,
+            **({} if is_windows() else {'start_new_session': True}))
     except FileNotFoundError:
         return 127, f"Command not found: {cmd[0]}"
+    captured = {'stdout': [], 'stderr': []}
+
+    async def pump(stream, name):
+        while True:
+            line = await stream.readline()
+            if not line:
+                return
+            text = line.decode(encoding, errors='replace')
+            captured[name].append(text)
+            if on_output:
+                on_output(name, text)
+
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+
+    def on_cancel():
+        loop.call_soon_threadsafe(stopped.set)
+
+    finished = asyncio.ensure_future(asyncio.gather(pump(proc.stdout, 'stdout'), pump(proc.stderr, 'stderr'), proc.wait()))
+    stop_wait = asyncio.ensure_future(stopped.wait())
+    if cancel is not None:
+        cancel.add_listener(on_cancel)
+        if cancel.is_set():
+            stopped.set()
+    try:
+        done, _ = await asyncio.wait({finished, stop_wait}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if cancel is not None:
+            cancel.remove_listener(on_cancel)
+        stop_wait.cancel()
+    note = None
+    if finished in done:
+        rc = proc.returncode
+    else:
+        if stop_wait in done:
+            rc, note = RC_CANCELLED, f"Geannuleerd: {' '.join(cmd)}"
+        else:
+            rc, note = RC_TIMEOUT, f"Timeout na {timeout:g}s: {' '.join(cmd)}"
+        log(note)
+        _kill_process_tree(proc.pid)
+        try:
+            await asyncio.wait_for(finished, 5)  # collect what the process wrote before it died
+        except Exception:
+            finished.cancel()
+    out = ''.join(captured['stdout']) + ''.join(captured['stderr'])
+    if note:
+        out += ('' if not out or out.endswith('\n') else '\n') + note
+    return rc, out
+
+
+# ---------- Metrics ----------
+
+METRICS_DIR_ENV = 'BIT_METRICS_DIR'  # same as --metrics-dir DIR; e.g. node_exporter's textfile collector folder
+METRICS_EXPORT_INTERVAL = 15  # seconds between exports while the app runs
+METRICS_PROM_NAME = 'bit.prom'
+METRICS_JSON_NAME = 'bit_metrics.json'
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)  # seconds
+STAGE_BUCKETS = (1, 5, 15, 30, 60, 300, 900, 1800, 3600, 7200, 14400, 28800, 86400)  # seconds; monitor runs for hours
+HISTOGRAM_BUCKETS = {'bit_stage_seconds': STAGE_BUCKETS}  # default: LATENCY_BUCKETS
+
+METRIC_HELP = {
+    'bit_commands_total': ('counter', 'manage-bde / PowerShell calls by operation and outcome.'),
+    'bit_command_seconds': ('histogram', 'Wall time of manage-bde / PowerShell calls.'),
+    'bit_powershell_fallbacks_total': ('counter', 'Times manage-bde failed and PowerShell was used instead.'),
+    'bit_status_polls_total': ('counter', 'Status poller ticks.'),
+    'bit_status_poll_errors_total': ('counter', 'Status poller ticks that raised an error.'),
+    'bit_stage_seconds': ('histogram', 'Duration of job stages per drive chain.'),
+    'bit_percentage_encrypted': ('gauge', 'Last polled percentage encrypted per drive.'),
+    'bit_decrypt_percent_per_minute': ('gauge', 'Estimated decryption rate per drive.'),
+}
+
+
+class Metrics:
+    """Process-wide counters, gauges and fixed-bucket histograms, keyed by name and labels. Thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}  # (name, labels) -> value; labels is a sorted tuple of (key, value)
+        self.gauges = {}
+        self.histograms = {}  # (name, labels) -> [bucket counts..., +Inf count, sum]
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels) -> None:
+        with self._lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            buckets = HISTOGRAM_BUCKETS.get(name, LATENCY_BUCKETS)
+            h = self.histograms.get(key)
+            if h is None:
+                h = self.histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    h[i] += 1
+            h[-2] += 1
+            h[-1] += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'generated': datetime.now().isoformat(timespec='seconds'),
+                'counters': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in sorted(self.counters.items())],
+                'gauges': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in sorted(self.gauges.items())],
+                'histograms': [{'name': n, 'labels': dict(l),
+                                'buckets': dict(zip(map(str, HISTOGRAM_BUCKETS.get(n, LATENCY_BUCKETS)), h[:-2])),
+                                'count': h[-2], 'sum': round(h[-1], 6)} for (n, l), h in sorted(self.histograms.items())],
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (cumulative buckets, as the format expects)."""
+        snap = self.snapshot()
+        families = {}
+        for kind in ('counters', 'gauges', 'histograms'):
+            for m in snap[kind]:
+                families.setdefault(m['name'], []).append(m)
+        lines = []
+        for name in sorted(families):
+            kind, text = METRIC_HELP.get(name, ('untyped', name))
+            lines.append(f'# HELP {name} {text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for m in families[name]:
+                labels = m['labels']
+                if 'buckets' not in m:
+                    lines.append(f"{name}{_prom_labels(labels)} {_prom_value(m['value'])}")
+                    continue
+                for le, count in m['buckets'].items():
+                    lines.append(f"{name}_bucket{_prom_labels({**labels, 'le': le})} {count}")
+                lines.append(f"{name}_bucket{_prom_labels({**labels, 'le': '+Inf'})} {m['count']}")
+                lines.append(f"{name}_sum{_prom_labels(labels)} {_prom_value(m['sum'])}")
+                lines.append(f"{name}_count{_prom_labels(labels)} {m['count']}")
+        return '\n'.join(lines) + '\n'
+
+
+def _prom_value(value: float) -> str:
+    # full precision: the :g format rounds to 6 significant digits (1234567 -> 1.23457e+06)
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _prom_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    esc = lambda v: str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{k}="{esc(v)}"' for k, v in labels.items()) + '}'
+
+
+metrics = Metrics()
+
+
+def _command_outcome(rc: int) -> str:
+    return {0: 'ok', RC_TIMEOUT: 'timeout', RC_CANCELLED: 'cancelled', 127: 'not_found'}.get(rc, 'error')
+
+
+def record_command(args: list[str], rc: int, seconds: float) -> None:
+    op = _op_name(args)
+    metrics.inc('bit_commands_total', op=op, outcome=_command_outcome(rc))
+    metrics.observe('bit_command_seconds', seconds, op=op)
+
+
+def export_metrics(directory: Path) -> None:
+    """Write bit.prom and bit_metrics.json atomically, so a scraper never reads half a file."""
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        write_file_atomic(directory / METRICS_PROM_NAME, metrics.to_prometheus())
+        write_file_atomic(directory / METRICS_JSON_NAME, json.dumps(metrics.snapshot(), indent=1))
+    except OSError as e:
+        log(f"Fout bij exporteren metrics naar {directory}: {e}")
+
+
+def start_metrics_export(directory: Path, interval: float = METRICS_EXPORT_INTERVAL) -> None:
+    """Export every interval seconds on a daemon thread, and once more at exit."""
+    def loop():
+        while True:
+            time.sleep(interval)
+            export_metrics(directory)
+
+    threading.Thread(target=loop, name='metrics-export', daemon=True).start()
+    atexit.register(export_metrics, directory)
+
+
+# ---------- Profiling ----------
+
+PROFILE_ENV = 'BIT_PROFILE'  # BIT_PROFILE=1 is the same as --profile
+DIAGNOSTICS_DIR = APP_SCRIPT.parent / 'diagnostics'
+PROFILE_TOP_FUNCTIONS = 40
+PROFILE_TOP_ALLOCATIONS = 25
+
+_profile_dir = None  # session folder while profiling is on
+_profile_seq = 0
+_profile_lock = threading.Lock()
+_profile_active = threading.local()
+
+
+def enable_profiling(base_dir: Path = DIAGNOSTICS_DIR) -> Path:
+    """Start tracemalloc and make profile_phase() write reports into a new folder under base_dir."""
+    global _profile_dir
+    import tracemalloc
+    tracemalloc.start(10)
+    _profile_dir = base_dir / datetime.now().strftime('%Y%m%d-%H%M%S')
+    _profile_dir.mkdir(parents=True, exist_ok=True)
+    log(f"Profiling aan; rapporten in {_profile_dir}")
+    return _profile_dir
+
+
+class profile_phase:
+    """cProfile + tracemalloc around one phase, written as NN-<phase>.pstats and NN-<phase>.txt
+    (top functions by cumulative time, top allocations). A no-op unless profiling is enabled.
+
+    Usable as context manager or decorator. cProfile follows one thread and, from Python 3.12, only one
+    profiler can run at a time: a phase nested in another, or overlapping one on another thread, gets
+    the allocation report only.
+    """
+
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __call__(self, func):
+        import functools
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_phase(self.phase):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def __enter__(self):
+        self._profiler = None
+        if _profile_dir is None:
+            return self
+        import tracemalloc
+        self._before = tracemalloc.take_snapshot()
+        self._t0 = time.perf_counter()
+        if not getattr(_profile_active, 'on', False):
+            import cProfile
+            try:
+                profiler = cProfile.Profile()
+                profiler.enable()
+                self._profiler = profiler
+                _profile_active.on = True
+            except ValueError:
+                pass  # another phase holds the profiler
+        return self
+
+    def __exit__(self, *exc):
+        if _profile_dir is None:
+            return
+        global _profile_seq
+        import io
+        import pstats
+        import tracemalloc
+        seconds = time.perf_counter() - self._t0
+        if self._profiler is not None:
+            self._profiler.disable()
+            _profile_active.on = False
+        after = tracemalloc.take_snapshot()
+        with _profile_lock:
+            _profile_seq += 1
+            base = _profile_dir / f"{_profile_seq:02d}-{re.sub(r'[^A-Za-z0-9_-]+', '_', self.phase)}"
+        try:
+            report = io.StringIO()
+            report.write(f"{self.phase}: {seconds:.3f}s wall, thread {threading.current_thread().name}\n\n")
+            if self._profiler is not None:
+                self._profiler.dump_stats(str(base) + '.pstats')
+                stats = pstats.Stats(self._profiler, stream=report)
+                stats.sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+            else:
+                report.write('(geen cProfile: overlapt met een andere fase)\n')
+            current, peak = tracemalloc.get_traced_memory()
+            report.write(f"\nTop {PROFILE_TOP_ALLOCATIONS} allocaties in deze fase "
+                         f"(traced nu {current / 1024:.0f} KiB, piek {peak / 1024:.0f} KiB):\n")
+            for diff in after.compare_to(self._before, 'lineno')[:PROFILE_TOP_ALLOCATIONS]:
+                report.write(f"  {diff}\n")
+            Path(str(base) + '.txt').write_text(report.getvalue(), encoding='utf-8')
+        except Exception as e:
+            log(f"Fout bij schrijven profiel {base}: {e}")
+
+
+# ---------- PowerShell worker ----------
+
+POWERSHELL_TIMEOUT = 60  # seconds per command sent to the worker
+POWERSHELL_START_TIMEOUT = 30
+
+# Reads {"id", "command"} lines from stdin, answers {"id", "rc", "out"} lines on stdout.
+_POWERSHELL_WORKER_SCRIPT = r'''
+$ProgressPreference = 'SilentlyContinue'
+[Console]::OutputEncoding = [Text.Encoding]::UTF8
+[Console]::Out.WriteLine('{"id": 0, "rc": 0, "out": "ready"}')
+[Console]::Out.Flush()
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($line -eq $null) { break }
+    $req = $line | ConvertFrom-Json
+    $Error.Clear()
+    try {
+        $out = Invoke-Expression $req.command 2>&1 | Out-String
+        $rc = if ($Error.Count) { 1 } else { 0 }
+    } catch {
+        $out = $_ | Out-String
+        $rc = 1
+    }
+    [Console]::Out.WriteLine((@{ id = $req.id; rc = $rc; out = $out } | ConvertTo-Json -Compress))
+    [Console]::Out.Flush()
+}
+'''
+
+# Same protocol in Python, for exercising the worker machinery without PowerShell. The command text
+# is echoed back; 'exit' ends the process without answering, 'sleep N' answers after N seconds.
+POWERSHELL_STAND_IN = r'''
+import json, sys, time
+print(json.dumps({"id": 0, "rc": 0, "out": "ready"}), flush=True)
+for line in sys.stdin:
+    req = json.loads(line)
+    cmd = req["command"]
+    if cmd == "exit":
+        sys.exit(3)
+    if cmd.startswith("sleep "):
+        time.sleep(float(cmd.split()[1]))
+    print(json.dumps({"id": req["id"], "rc": 0, "out": cmd + "\n"}), flush=True)
+'''
+
+
+def powershell_worker_argv() -> list[str]:
+    encoded = base64.b64encode(_POWERSHELL_WORKER_SCRIPT.encode('utf-16-le')).decode('ascii')
+    return ["powershell", "-NoProfile", "-NonInteractive", "-EncodedCommand", encoded]
+
+
+def stand_in_worker_argv() -> list[str]:
+    return [sys.executable, "-c", POWERSHELL_STAND_IN]
+
+
+class PowerShellWorker:
+    """One long-lived PowerShell process that runs commands sent as JSON lines, so callers pay the
+    PowerShell startup cost once instead of per call.
+
+    Commands run one at a time. A worker that has exited is restarted on the next call; a worker that
+    dies, times out or is cancelled (the thread's cancel_scope) during a command is killed and that
+    command returns an error rather than being sent twice (Disable-BitLocker is not something to retry
+    blindly).
+    """
+
+    def __init__(self, argv: list[str] | None = None):
+        self.argv = argv or powershell_worker_argv()
+        self.restarts = 0
+        self._proc = None
+        self._lines = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: float = POWERSHELL_TIMEOUT) -> tuple[int, str]:
+        cancel = current_cancel_event()
+        if cancel is not None and cancel.is_set():
+            return RC_CANCELLED, f"Geannuleerd: {command}"
+        with self._lock:
+            try:
+                proc = self._ensure_started()
+            except FileNotFoundError:
+                return 127, f"Command not found: {self.argv[0]}"
+            except (OSError, ValueError, EOFError, queue.Empty) as e:
+                self._kill()
+                return 1, f"PowerShell worker start mislukt: {e}"
+            self._next_id += 1
+            lines = self._lines
+
+            def on_cancel():
+                lines.put(_WORKER_CANCELLED)
+
+            if cancel is not None:
+                cancel.add_listener(on_cancel)
+            try:
+                proc.stdin.write(json.dumps({'id': self._next_id, 'command': command}) + '\n')
+                proc.stdin.flush()
+                resp = self._read_response(timeout)
+                if resp.get('id') != self._next_id:
+                    raise ValueError(f"antwoord voor verzoek {resp.get('id')}, verwacht {self._next_id}")
+                return int(resp.get('rc', 1)), resp.get('out') or ''
+            except CommandCancelled:
+                log(f"PowerShell commando geannuleerd; worker wordt herstart: {command}")
+                self._kill()
+                return RC_CANCELLED, f"Geannuleerd: {command}"
+            except queue.Empty:
+                log(f"PowerShell worker reageert niet na {timeout}s; wordt herstart")
+                self._kill()
+                return RC_TIMEOUT, f"Timeout na {timeout}s: {command}"
+            except (OSError, ValueError, EOFError) as e:
+                log(f"PowerShell worker gestopt tijdens commando: {e}")
+                self._kill()
+                return 1, f"PowerShell worker fout: {e}"
+            finally:
+                if cancel is not None:
+                    cancel.remove_listener(on_cancel)
+
+    def _ensure_started(self):
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        import subprocess
+        if self._proc is not None:
+            self.restarts += 1
+            log(f"PowerShell worker herstarten (exit code {self._proc.returncode})")
+        self._proc = subprocess.Popen(
+            self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='replace', bufsize=1,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._proc.stdout, self._lines),
+                         name='powershell-worker', daemon=True).start()
+        self._read_response(POWERSHELL_START_TIMEOUT)  # ready line
+        return self._proc
+
+    @staticmethod
+    def _pump(stream, lines: queue.Queue) -> None:
+        # readline blocks without a timeout, so a thread feeds a queue that can be waited on with one
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _read_response(self, timeout: float) -> dict:
+        deadline = time.monotonic() + timeout
+        while True:
+            line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            if line is None:
+                raise EOFError('worker afgesloten')
+            if line is _WORKER_CANCELLED:
+                raise CommandCancelled()
+            line = line.strip()
+            if line.startswith('{'):
+                return json.loads(line)
+            # anything else on stdout (profile noise, warnings) is not part of the protocol
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            try:
+                if is_windows():
+                    _kill_process_tree(self._proc.pid)  # also whatever the command started
+                else:
+                    self._proc.kill()
+                self._proc.wait(timeout=5)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                try:
+                    self._proc.stdin.close()
+                    self._proc.wait(timeout=5)
+                except Exception:
+                    self._kill()
+            self._proc = None
+
+
+_WORKER_CANCELLED = object()  # queued by the cancel listener to interrupt a wait for a response
+_powershell_worker = None
+_powershell_worker_lock = threading.Lock()
+
+
+def run_powershell(command: str, timeout: float = POWERSHELL_TIMEOUT) -> tuple[int, str]:
+    """Run a PowerShell command in the shared worker process. Same (rc, output) contract as run_cmd."""
+    t0 = time.perf_counter()
+    if _cmd_hook is not None:
+        rc, out = _cmd_hook(["powershell", command], lambda: _run_powershell(command, timeout), current_cancel_event(), None)
+    else:
+        rc, out = _run_powershell(command, timeout)
+    record_command(["powershell", command], rc, time.perf_counter() - t0)
+    return rc, out
+
+
+def _run_powershell(command: str, timeout: float) -> tuple[int, str]:
+    global _powershell_worker
+    with _powershell_worker_lock:
+        if _powershell_worker is None:
+            _powershell_worker = PowerShellWorker()
+            atexit.register(_powershell_worker.close)
+    return _powershell_worker.run(command, timeout)
 
 
 # ---------- Licensing helpers ----------
 
+_LICENSE_MAC = hmac.new(LOCAL_LICENSE_SECRET, digestmod=hashlib.sha256)  # keyed once; copy() per license
+_RE_LICENSE_EXPIRY = re.compile(r'expiry=(\S+)')
+_license_cache = None  # (mtime_ns, size, expiry or None) of LICENSE_FILE
+
+
 def _hmac_for_payload(payload: bytes) -> str:
-    return hmac.new(LOCAL_LICENSE_SECRET, payload, hashlib.sha256).hexdigest()
+    mac = _LICENSE_MAC.copy()
+    mac.update(payload)
+    return mac.hexdigest()
+
 
+def _local_naive(dt: datetime) -> datetime:
+    """Expiries are naive local time; an expiry with a UTC offset is converted so comparisons with now() work."""
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo is not None else dt
 
-def validate_license_content(content: str) -> bool:
+
+def license_expiry(content: str) -> datetime | None:
+    """Expiry of a correctly signed license, or None if the signature or expiry field is bad.
+    Does not look at the clock, so the result can be cached."""
     try:
         sig, payload = content.split(':', 1)
-        expected = hmac.new(LOCAL_LICENSE_SECRET, payload.encode('utf-8'), hashlib.sha256).hexdigest()
-        if not hmac.compare_digest(sig, expected):
-            return False
-        m = re.search(r'expiry=([^\s]+)', payload)
+        if not hmac.compare_digest(sig, _hmac_for_payload(payload.encode('utf-8'))):
+            return None
+        m = _RE_LICENSE_EXPIRY.search(payload)
         if not m:
-            return False
-        expiry = datetime.fromisoformat(m.group(1))
-        return expiry >= datetime.now()
+            return None
+        return _local_naive(datetime.fromisoformat(m.group(1)))
     except Exception:
-        return False
+        return None
+
+
+def validate_license_content(content: str, now: datetime | None = None) -> bool:
+    expiry = license_expiry(content)
+    return expiry is not None and expiry >= _local_naive(now or datetime.now())
 
 
 def load_license() -> bool:
-    if not LICENSE_FILE.exists():
-        return False
+    """Validate LICENSE_FILE. The file is only read and checked again when its mtime or size changes."""
+    global _license_cache
     try:
-        txt = LICENSE_FILE.read_text(encoding='utf-8')
-        return validate_license_content(txt.strip())
-    except Exception:
+        st = LICENSE_FILE.stat()
+    except OSError:
         return False
+    key = (st.st_mtime_ns, st.st_size)
+    if _license_cache is None or _license_cache[:2] != key:
+        try:
+            expiry = license_expiry(LICENSE_FILE.read_text(encoding='utf-8').strip())
+        except Exception:
+            expiry = None
+        _license_cache = key + (expiry,)
+    expiry = _license_cache[2]
+    return expiry is not None and expiry >= datetime.now()
 
 
 def write_license_file(content: str) -> bool:
+    global _license_cache
     try:
         with LICENSE_FILE.open('w', encoding='utf-8') as f:
             f.write(content)
+        _license_cache = None  # same-second rewrites can keep mtime on coarse filesystems
         return True
     except Exception as e:
         log(f"Fout bij schrijven licentiebestand: {e}")
         return False
 
 
-def generate_demo_license(days: int = TRIAL_DAYS) -> str:
-    expiry = datetime.now() + timedelta(days=days)
-    payload = f"expiry={expiry.isoformat()}"
-    sig = _hmac_for_payload(payload.encode('utf-8'))
-    return sig + ":" + payload
+def generate_license(expiry: datetime, license_id: str | None = None) -> str:
+    payload = f"expiry={_local_naive(expiry).isoformat()}"
+    if license_id:
+        payload = f"id={license_id} " + payload
+    return _hmac_for_payload(payload.encode('utf-8')) + ":" + payload
 
 
-# ---------- Dev Mode helpers ----------
+def generate_demo_license(days: int = TRIAL_DAYS) -> str:
+    return generate_license(datetime.now() + timedelta(days=days))
 
-DEV_FILE = Path(__file__).with_suffix('.dev')
 
-try:
-    import win32crypt  # type: ignore
-    _HAS_DPAPI = True
-except Exception:
-    _HAS_DPAPI = False
+# ---------- Cipher backends ----------
+
+CIPHER_CHUNK_SIZE = 1 << 20  # plaintext bytes per frame in encrypt_stream
+CIPHER_PREFERENCE = ('dpapi', 'aesgcm')  # first available one encrypts new records
+_STREAM_FRAME = struct.Struct('>IB')  # sealed length, final flag
+_STREAM_AAD = struct.Struct('>QB')    # frame index, final flag
+_win32crypt = None  # loaded on first use; False once known to be unavailable
 
 
-def _dpapi_encrypt(data: bytes) -> bytes:
-    if _HAS_DPAPI:
+def _load_win32crypt():
+    """Import pywin32's DPAPI wrapper lazily; only the DPAPI backend needs it."""
+    global _win32crypt
+    if _win32crypt is None:
         try:
-            return win32crypt.CryptProtectData(data, None, None, None, None, 0)[1]
+            import win32crypt  # type: ignore
+            _win32crypt = win32crypt
         except Exception:
-            pass
-    # fallback: simple XOR with key derived from LOCAL_LICENSE_SECRET
-    key = hashlib.sha256(LOCAL_LICENSE_SECRET).digest()
-    out = bytearray()
-    for i, b in enumerate(data):
-        out.append(b ^ key[i % len(key)])
-    return bytes(out)
+            _win32crypt = False
+    return _win32crypt or None
+
+
+class CipherError(Exception):
+    """Decryption failed: wrong key, tampered or truncated data, or backend unavailable."""
 
 
-def _dpapi_decrypt(blob: bytes) -> bytes | None:
-    if _HAS_DPAPI:
+def _dpapi_ctypes(data: bytes, entropy: bytes, protect: bool) -> bytes:
+    """CryptProtectData / CryptUnprotectData through ctypes, for Pythons without pywin32.
+    Produces and reads the same blobs as win32crypt."""
+    import ctypes
+    from ctypes import wintypes
+
+    class DATA_BLOB(ctypes.Structure):
+        _fields_ = [('cbData', wintypes.DWORD), ('pbData', ctypes.POINTER(ctypes.c_char))]
+
+    def blob(b: bytes):
+        buf = ctypes.create_string_buffer(b, len(b))
+        return DATA_BLOB(len(b), ctypes.cast(buf, ctypes.POINTER(ctypes.c_char))), buf
+
+    data_in, _keep_in = blob(data)
+    extra, _keep_extra = blob(entropy) if entropy else (None, None)
+    data_out = DATA_BLOB()
+    crypt32 = ctypes.windll.crypt32  # type: ignore
+    func = crypt32.CryptProtectData if protect else crypt32.CryptUnprotectData
+    if not func(ctypes.byref(data_in), None, ctypes.byref(extra) if extra is not None else None,
+                None, None, 0, ctypes.byref(data_out)):
+        raise CipherError(f'DPAPI: {ctypes.FormatError()}')  # type: ignore
+    try:
+        return ctypes.string_at(data_out.pbData, data_out.cbData)
+    finally:
+        ctypes.windll.kernel32.LocalFree(data_out.pbData)  # type: ignore
+
+
+def _xor_bytes(data: bytes, key: bytes) -> bytes:
+    """XOR data with an equally long key as one big-integer operation instead of a per-byte loop."""
+    n = len(data)
+    return (int.from_bytes(data, 'little') ^ int.from_bytes(key[:n], 'little')).to_bytes(n, 'little')
+
+
+def _read_full(src, n: int) -> bytes:
+    """Read up to n bytes, looping over short reads from pipes; fewer than n only at end of stream."""
+    buf = src.read(n)
+    while buf and len(buf) < n:
+        more = src.read(n - len(buf))
+        if not more:
+            break
+        buf += more
+    return buf
+
+
+class CipherBackend(ABC):
+    """Base for cipher backends: one-shot encrypt/decrypt plus chunked streaming on top of them.
+
+    Streams start with a random 16-byte stream id; every frame is (length, final flag, sealed chunk) and
+    the chunk is sealed with the stream id, its index and the final flag as associated data, so frames
+    cannot be reordered, dropped or cut off without decrypt_stream noticing.
+    """
+
+    name = ''
+    can_encrypt = True  # False for backends kept only to read old data
+    needs_key = False  # True: the caller must supply the key (e.g. derived from a passphrase)
+
+    def __init__(self, key: bytes | None = None):
+        if self.needs_key and not key:
+            raise CipherError(f'{self.name} heeft een sleutel nodig')
+        self.key = key
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    @abstractmethod
+    def encrypt(self, data: bytes, aad: bytes = b'') -> bytes:
+        ...
+
+    @abstractmethod
+    def decrypt(self, blob: bytes, aad: bytes = b'') -> bytes:
+        ...
+
+    def encrypt_stream(self, src, dst, chunk_size: int = CIPHER_CHUNK_SIZE) -> int:
+        """Encrypt file object src into dst. Returns the number of plaintext bytes."""
+        stream_id = os.urandom(16)
+        dst.write(stream_id)
+        total = index = 0
+        chunk = _read_full(src, chunk_size)
+        while True:
+            nxt = _read_full(src, chunk_size) if len(chunk) == chunk_size else b''
+            final = not nxt
+            sealed = self.encrypt(chunk, stream_id + _STREAM_AAD.pack(index, final))
+            dst.write(_STREAM_FRAME.pack(len(sealed), final))
+            dst.write(sealed)
+            total += len(chunk)
+            if final:
+                return total
+            chunk, index = nxt, index + 1
+
+    def decrypt_stream(self, src, dst) -> int:
+        """Decrypt a stream written by encrypt_stream into dst. Returns the number of plaintext bytes."""
+        stream_id = _read_full(src, 16)
+        total = index = 0
+        while True:
+            head = _read_full(src, _STREAM_FRAME.size)
+            if len(stream_id) != 16 or len(head) != _STREAM_FRAME.size:
+                raise CipherError('versleutelde stream is afgekapt')
+            length, final = _STREAM_FRAME.unpack(head)
+            sealed = _read_full(src, length)
+            if len(sealed) != length:
+                raise CipherError('versleutelde stream is afgekapt')
+            chunk = self.decrypt(sealed, stream_id + _STREAM_AAD.pack(index, final))
+            dst.write(chunk)
+            total += len(chunk)
+            if final:
+                return total
+            index += 1
+
+
+class DpapiCipher(CipherBackend):
+    """Windows DPAPI: bound to the current user account, ignores the key. aad goes in as DPAPI entropy.
+    Uses pywin32 when installed and crypt32 through ctypes otherwise."""
+
+    name = 'dpapi'
+
+    @classmethod
+    def available(cls) -> bool:
+        return is_windows()
+
+    def encrypt(self, data: bytes, aad: bytes = b'') -> bytes:
+        win32crypt = _load_win32crypt()
+        if win32crypt is None:
+            return _dpapi_ctypes(data, aad, True)
+        return win32crypt.CryptProtectData(data, None, aad or None, None, None, 0)[1]
+
+    def decrypt(self, blob: bytes, aad: bytes = b'') -> bytes:
+        win32crypt = _load_win32crypt()
+        if win32crypt is None:
+            return _dpapi_ctypes(blob, aad, False)
         try:
-            return win32crypt.CryptUnprotectData(blob, None, None, None, None, 0)[1]
+            return win32crypt.CryptUnprotectData(blob, aad or None, None, None, 0)[1]
+        except Exception as e:
+            raise CipherError(f'DPAPI: {e}') from None
+
+
+class AesGcmCipher(CipherBackend):
+    """AES-256-GCM from the optional `cryptography` package, with a caller-supplied key.
+    Blob: nonce(12) + ciphertext + tag(16)."""
+
+    name = 'aesgcm'
+    needs_key = True
+
+    @classmethod
+    def available(cls) -> bool:
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # noqa: F401
+            return True
         except Exception:
-            pass
-    # fallback XOR decode
-    key = hashlib.sha256(LOCAL_LICENSE_SECRET).digest()
-    out = bytearray()
-    for i, b in enumerate(blob):
-        out.append(b ^ key[i % len(key)])
-    return bytes(out)
+            return False
+
+    def __init__(self, key: bytes | None = None):
+        super().__init__(key)
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        self._aead = AESGCM(hashlib.sha256(self.key).digest())
+
+    def encrypt(self, data: bytes, aad: bytes = b'') -> bytes:
+        nonce = os.urandom(12)
+        return nonce + self._aead.encrypt(nonce, data, aad)
+
+    def decrypt(self, blob: bytes, aad: bytes = b'') -> bytes:
+        from cryptography.exceptions import InvalidTag
+        try:
+            return self._aead.decrypt(blob[:12], blob[12:], aad)
+        except (InvalidTag, ValueError):
+            raise CipherError('authenticatie mislukt (aesgcm)') from None
+
+
+class LegacyXorCipher(CipherBackend):
+    """The old non-DPAPI fallback (repeating-key XOR, no authentication). Read-only, for old dev records."""
+
+    name = 'xor-legacy'
+    can_encrypt = False
 
+    def encrypt(self, data: bytes, aad: bytes = b'') -> bytes:
+        raise CipherError('xor-legacy kan alleen oude records lezen')
+
+    def encrypt_stream(self, src, dst, chunk_size: int = CIPHER_CHUNK_SIZE) -> int:
+        raise CipherError('xor-legacy kan alleen oude records lezen')
+
+    def decrypt(self, blob: bytes, aad: bytes = b'') -> bytes:
+        key = hashlib.sha256(LOCAL_LICENSE_SECRET).digest()
+        return _xor_bytes(blob, key * (len(blob) // len(key) + 1))
+
+    def decrypt_stream(self, src, dst) -> int:
+        raise CipherError('xor-legacy heeft geen streaming formaat')
+
+
+CIPHER_BACKENDS = {cls.name: cls for cls in (DpapiCipher, AesGcmCipher, LegacyXorCipher)}
+
+
+def get_cipher(name: str, key: bytes | None = None) -> CipherBackend:
+    cls = CIPHER_BACKENDS.get(name)
+    if cls is None or not cls.available():
+        raise CipherError(f'cipher backend niet beschikbaar: {name}')
+    return cls(key)
+
+
+def default_cipher(key: bytes | None = None) -> CipherBackend:
+    """First usable backend from CIPHER_PREFERENCE. Without a key that is DPAPI only; with a key DPAPI is
+    skipped, since that data is meant to be readable elsewhere with the same key."""
+    for name in CIPHER_PREFERENCE:
+        cls = CIPHER_BACKENDS[name]
+        if (key is None) == cls.needs_key:
+            continue
+        if cls.available():
+            return cls(key)
+    if key is None:
+        raise CipherError('geen veilige opslag beschikbaar: DPAPI bestaat alleen op Windows')
+    raise CipherError("geen cipher beschikbaar: installeer het pakket 'cryptography'")
+
+
+# ---------- Dev Mode helpers ----------
+
+DEV_FILE = Path(__file__).with_suffix('.dev')
 
 def save_dev_record(code: str, persist: bool = True, hide: bool = True, persist_state: bool = False) -> bool:
     """Saves an encrypted dev code record. If hide=True the code will not be stored in plaintext and
@@ -187,9 +1111,9 @@ def save_dev_record(code: str, persist: bool = True, hide: bool = True, persist_
             'created': datetime.now().isoformat(),
             'persist_state': bool(persist_state),
         }
-        # encrypt code
-        blob = _dpapi_encrypt(code.encode('utf-8'))
-        record['code'] = base64.b64encode(blob).decode('ascii')
+        cipher = default_cipher()
+        record['cipher'] = cipher.name
+        record['code'] = base64.b64encode(cipher.encrypt(code.encode('utf-8'))).decode('ascii')
         DEV_FILE.write_text(json.dumps(record), encoding='utf-8')
         return True
     except Exception as e:
@@ -219,918 +1143,2274 @@ def clear_dev_record() -> bool:
         return False
 
 
+def decrypt_dev_code(rec: dict) -> str | None:
+    """Stored dev code from a record, or None. Records without a 'cipher' field predate the cipher
+    backends and are DPAPI or legacy XOR, like the old fallback chain."""
+    try:
+        blob = base64.b64decode(rec['code'])
+        names = [rec['cipher']] if 'cipher' in rec else ['dpapi', 'xor-legacy']
+        for name in names:
+            try:
+                return get_cipher(name).decrypt(blob).decode('utf-8')
+            except (CipherError, UnicodeDecodeError):
+                continue
+    except Exception as e:
+        log(f"Fout bij ontcijferen dev code: {e}")
+    return None
+
+
 def verify_dev_code(input_code: str) -> bool:
     rec = load_dev_record()
     if not rec or 'code' not in rec:
         return False
-    try:
-        blob = base64.b64decode(rec['code'])
-        plain = _dpapi_decrypt(blob)
-        if plain is None:
-            return False
-        return hmac.compare_digest(plain.decode('utf-8'), input_code)
-    except Exception:
-        return False
+    plain = decrypt_dev_code(rec)
+    return plain is not None and hmac.compare_digest(plain, input_code)
 
 
 # ---------- BitLocker helpers ----------
 
+@dataclass(slots=True)
+class VolumeStatus:
+    """Parsed status of one volume, from `manage-bde -status` or `Get-BitLockerVolume | Format-List`."""
+    drive: str
+    size: str = ''
+    percentage: float | None = None
+    conversion_status: str = ''
+    protection_status: str = ''
+    protectors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'VolumeStatus':
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+    @property
+    def bitlocker_configured(self) -> bool:
+        # a "Percentage Encrypted" line means BitLocker knows the volume, also when it is fully decrypted
+        return (self.percentage is not None
+                or bool(_RE_ON.search(self.protection_status))
+                or 'fully encrypted' in self.conversion_status.lower()
+                or self.conversion_status.lower() == 'fullyencrypted')
+
+    @property
+    def has_recovery_password(self) -> bool:
+        return any(p.replace(' ', '').lower() in ('numericalpassword', 'recoverypassword') for p in self.protectors)
+
+
+# drive letter, folder mount point (C:\mnt\vhd1\) or volume GUID path (\\?\Volume{...}\)
+_RE_VOLUME_LINE = re.compile(r"\s*(?:Volume|Mount\s*Point)\s*:?\s*([A-Za-z]:(?:\\[^\s\[]*)?|\\\\\?\\Volume\{[0-9A-Fa-f-]+\}\\)")
+_RE_FIELD_LINE = re.compile(r"\s*([A-Za-z][A-Za-z ]*?)\s*:\s*(.*?)\s*$")
+_RE_PERCENT_VALUE = re.compile(r"(\d+(?:[.,]\d+)?)")
+_RE_PERCENTAGE_ENCRYPTED = re.compile(r"(?:Percentage Encrypted|EncryptionPercentage)\s*:\s*(\d+(?:[.,]\d+)?)")
+_RE_ON = re.compile(r"\bOn\b", re.I)
+_RE_VOLUME_GUID = re.compile(r"\\\\\?\\Volume\{([0-9A-Fa-f-]+)\}")
+
+# field name (lowercase, without spaces) -> VolumeStatus attribute; covers manage-bde and PowerShell names
+_STATUS_FIELDS = {
+    'size': 'size',
+    'capacitygb': 'size',
+    'conversionstatus': 'conversion_status',
+    'volumestatus': 'conversion_status',
+    'percentageencrypted': 'percentage',
+    'encryptionpercentage': 'percentage',
+    'protectionstatus': 'protection_status',
+    'keyprotectors': 'protectors',
+    'keyprotector': 'protectors',
+}
+
+
+def _parse_percentage(value: str) -> float | None:
+    m = _RE_PERCENT_VALUE.search(value)
+    if not m:
+        return None
+    try:
+        return float(m.group(1).replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def iter_volume_status(lines):
+    """Single pass over status output lines, yielding a VolumeStatus per volume."""
+    current = None
+    in_protectors = False
+    for line in lines:
+        m = _RE_VOLUME_LINE.match(line)
+        if m:
+            if current is not None:
+                yield current
+            drive = m.group(1)
+            current = VolumeStatus(drive.upper() if len(drive) == 2 else drive)
+            in_protectors = False
+            continue
+        if current is None:
+            continue
+        if not line.strip():
+            in_protectors = False
+            continue
+        m = _RE_FIELD_LINE.match(line)
+        attr = _STATUS_FIELDS.get(m.group(1).replace(' ', '').lower()) if m else None
+        if attr is None:
+            if in_protectors and not m:
+                current.protectors.append(line.strip())
+            else:
+                in_protectors = False
+            continue
+        value = m.group(2)
+        in_protectors = False
+        if attr == 'percentage':
+            current.percentage = _parse_percentage(value)
+        elif attr == 'protectors':
+            value = value.strip('{}')
+            if value and value.lower() != 'none found':
+                current.protectors.extend(p.strip() for p in value.split(',') if p.strip())
+            in_protectors = not value
+        else:
+            setattr(current, attr, value)
+    if current is not None:
+        yield current
+
+
+def parse_volume_status(out: str) -> dict:
+    """Return dictionary of drive -> VolumeStatus for every volume in the output."""
+    return {v.drive: v for v in iter_volume_status(out.splitlines())}
+
+
 def detect_drives() -> dict:
-    """Return dictionary of drives -> status text where BitLocker appears configured."""
-    rc, out = run_cmd(["manage-bde", "-status"])  # lists all volumes
-    drives = {}
-    if rc != 0 and not out:
-        return drives
-
-    # Split output into blocks per volume
-    blocks = re.split(r"\n\s*Volume\s*[A-Z]:|\n\s*Volume\s*", out)
-    # Sometimes manage-bde prints 'Volume C:' style; fallback to scanning lines
-    if len(blocks) <= 1:
-        # Fallback parse: find Mount Point lines and collect nearby lines
-        current = None
-        buf = {}
-        for line in out.splitlines():
-            m = re.match(r"\s*Volume\s*([A-Z]:)", line)
-            if m:
-                current = m.group(1)
-                buf[current] = line + '\n'
-            elif current:
-                buf[current] += line + '\n'
-        for d, b in buf.items():
-            drives[d] = b
-        return drives
-
-    # More robust parse: look for 'Mount Point' and 'Percentage Encrypted' lines
-    for match in re.finditer(r"(Mount Point|Volume)\s*:?\s*([A-Z]:).*?(?=\n\s*(Mount Point|Volume)|\Z)", out, re.S):
-        drive = match.group(2)
-        block = match.group(0)
-        drives[drive] = block
-    return drives
+    """Return dictionary of drive -> VolumeStatus for all volumes listed by the backend.
+    Raises DetectionError when the listing itself fails."""
+    return _backend.detect_drives()
 
 
 def get_drives_with_bitlocker() -> dict:
-    dr = detect_drives()
-    result = {}
-    for d, block in dr.items():
-        # Basic heuristic: presence of 'Percentage Encrypted' or 'Protection Status: On' or 'Conversion Status: Fully Encrypted'
-        if re.search(r"Percentage Encrypted:\s*\d+%", block) or re.search(r"Protection Status:\s*On", block, re.I) or re.search(r"Conversion Status:\s*Fully Encrypted", block, re.I):
-            result[d] = block
-    return result
+    return {d: v for d, v in detect_drives().items() if v.bitlocker_configured}
 
 
 def get_bitlocker_status(drive: str) -> str:
-    rc, out = run_cmd(["manage-bde", "-status", drive])
-    if rc != 0 and not out:
-        rc, out = run_cmd(["powershell", "-NoProfile", "-Command", f"Get-BitLockerVolume -MountPoint '{drive}' | Format-List | Out-String"]) 
-    return out
+    return _backend.get_bitlocker_status(drive)
+
+
+def get_volume_status(drive: str) -> VolumeStatus | None:
+    return parse_volume_status(get_bitlocker_status(drive)).get(drive.upper())
 
 
-def parse_encryption_percentage(status_output: str) -> int | None:
-    m = re.search(r"Percentage Encrypted:\s*(\d+)%", status_output)
+def parse_encryption_percentage(status_output: str) -> float | None:
+    m = _RE_PERCENTAGE_ENCRYPTED.search(status_output)
     if m:
-        try:
-            return int(m.group(1))
-        except ValueError:
-            return None
+        return _parse_percentage(m.group(1))
     return None
 
 
-def backup_recovery_key(drive: str, target_dir: Path = BACKUP_DIR) -> Path | None:
-    """Save protectors output to a local file and return path, or None on failure."""
-    target_dir.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now().strftime('%Y%m%d-%H%M%S')
-    outp = target_dir / f"recovery_{drive.replace(':','')}_{ts}.txt"
-    rc, out = run_cmd(["manage-bde", "-protectors", "-get", drive])
-    if rc == 0 and out:
+def write_file_atomic(path: Path, text: str) -> None:
+    """Write text to a temp file next to path, fsync it and rename it over path.
+    A crash leaves either no file or the complete file, never a partial one."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open('w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
         try:
-            with outp.open('w', encoding='utf-8') as f:
-                f.write(out)
-            log(f"Recovery key saved to {outp}")
-            return outp
-        except Exception as e:
-            log(f"Fout bij opslaan recovery key: {e}")
-            return None
-    else:
-        log(f"Backup mislukte voor {drive}: {out}")
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def sync_directory(path: Path) -> None:
+    """fsync a directory so renames in it survive a crash. No-op where directories cannot be opened (Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def backup_recovery_key(drive: str, target_dir: Path | None = None) -> Path | None:
+    """Save protectors output to a local file (default: BACKUP_DIR) and return path, or None on failure.
+    If the backup index already holds a file of this host with the same protectors, that file is returned instead."""
+    if target_dir is None:
+        target_dir = BACKUP_DIR
+    out = get_protectors_output(drive)
+    if out is None:
         return None
+    index = BackupIndex.for_dir(target_dir)
+    key = backup_volume_key(drive)
+    digest = protector_set_hash(out)
+    existing = index.find(key, digest)
+    if existing is not None:
+        log(f"Protectors van {drive} ongewijzigd; bestaande backup {existing}")
+        return existing
+    ts = datetime.now().strftime('%Y%m%d-%H%M%S')
+    # host in the name: several machines may share the folder
+    stem = f"recovery_{_drive_token(_host_name())}_{_drive_token(drive)}_{ts}"
+    outp = target_dir / f"{stem}.txt"
+    n = 1
+    while outp.exists():  # never replace another backup, e.g. a damaged one written the same second
+        n += 1
+        outp = target_dir / f"{stem}_{n}.txt"
+    try:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        write_file_atomic(outp, out)
+    except Exception as e:
+        log(f"Fout bij opslaan recovery key: {e}")
+        return None
+    index.add(key, digest, outp, drive)
+    log(f"Recovery key saved to {outp}")
+    return outp
+
+
+def get_protectors_output(drive: str) -> str | None:
+    """`manage-bde -protectors -get` listing for a drive, or None on failure."""
+    ok, out = _backend.get_protectors(drive)
+    if ok and out:
+        return out
+    log(f"Backup mislukte voor {drive}: {out}")
+    return None
 
 
 def disable_bitlocker(drive: str) -> tuple[bool, str]:
-    rc, out = run_cmd(["manage-bde", "-off", drive])
-    if rc == 0:
-        return True, out
-    rc, out = run_cmd(["powershell", "-NoProfile", "-Command", f"Disable-BitLocker -MountPoint '{drive}' | Out-String"]) 
-    return (rc == 0), out
+    return _backend.disable_bitlocker(drive)
 
 
-# ---------- GUI Application ----------
+# ---------- Volume backends ----------
 
-class BitLockerApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title(f"{PRODUCT_NAME} — {COMPANY_NAME} v{VERSION}")
-        self.geometry("900x600")
-        self.protocol("WM_DELETE_WINDOW", self.on_close)
+BACKEND_ENV = 'BIT_BACKEND'  # e.g. BIT_BACKEND=sim:volumes=500,rate=20,fail=0.01
 
-        # Ensure Windows shows the app icon (not Python) by setting AppUserModelID early
-        try:
-            if is_windows() and hasattr(ctypes.windll, 'shell32'):
-                try:
-                    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(APP_ID)
-                except Exception:
-                    pass
-        except Exception:
-            pass
 
-        # try load logo/icon (prefer logo.ico/logo.png then icon)
-        try:
-            base_dir = Path(__file__).parent
-            # write fallback logo files if missing
-            logo_light = base_dir / 'logo_light.png'
-            logo_dark = base_dir / 'logo_dark.png'
-            if not logo_light.exists():
-                try:
-                    logo_light.write_bytes(base64.b64decode(LOGO_PNG_B64_LIGHT))
-                except Exception:
-                    pass
-            if not logo_dark.exists():
-                try:
-                    logo_dark.write_bytes(base64.b64decode(LOGO_PNG_B64_DARK))
-                except Exception:
-                    pass
+class DetectionError(Exception):
+    """The volume listing failed or timed out (as opposed to listing no volumes)."""
+
+
+class VolumeBackend(ABC):
+    """Where detect_drives, get_bitlocker_status, get_protectors_output (and so backup_recovery_key) and
+    disable_bitlocker send their work. Writing, indexing and verifying backups stays backend independent."""
+
+    name = ''
+    needs_windows = True
+    needs_admin = True
+    needs_license = True  # for disabling from the CLI
+    clock_speed = 1.0  # session seconds per real second; the status poller runs on this clock
+    scratch_storage = False  # True: backups, backup index and inventory go to a temporary folder
+
+    @abstractmethod
+    def detect_drives(self) -> dict:
+        """drive -> VolumeStatus for every volume; raises DetectionError when the listing fails."""
+
+    @abstractmethod
+    def get_bitlocker_status(self, drive: str) -> str:
+        ...
+
+    @abstractmethod
+    def get_protectors(self, drive: str) -> tuple[bool, str]:
+        ...
+
+    @abstractmethod
+    def disable_bitlocker(self, drive: str) -> tuple[bool, str]:
+        ...
+
+    def volume_id(self, drive: str) -> str | None:
+        """Volume GUID of a drive or mount point, or None when unknown."""
+        m = _RE_VOLUME_GUID.search(drive)
+        return m.group(1) if m else None
+
+
+class ManageBdeBackend(VolumeBackend):
+    """The real thing: manage-bde, with PowerShell as fallback."""
+
+    name = 'manage-bde'
+
+    def detect_drives(self) -> dict:
+        rc, out = run_cmd(["manage-bde", "-status"])  # lists all volumes
+        volumes = parse_volume_status(out)
+        if rc != 0 and not volumes:
+            raise DetectionError(out.strip().splitlines()[-1] if out.strip() else f"manage-bde -status: exit code {rc}")
+        return volumes
+
+    def get_bitlocker_status(self, drive: str) -> str:
+        rc, out = run_cmd(["manage-bde", "-status", drive])
+        if rc != 0 and not out:
+            metrics.inc('bit_powershell_fallbacks_total', operation='status')
+            rc, out = run_powershell(f"Get-BitLockerVolume -MountPoint '{drive}' | Format-List")
+        return out
+
+    def get_protectors(self, drive: str) -> tuple[bool, str]:
+        rc, out = run_cmd(["manage-bde", "-protectors", "-get", drive])
+        return rc == 0, out
+
+    def disable_bitlocker(self, drive: str) -> tuple[bool, str]:
+        rc, out = run_cmd(["manage-bde", "-off", drive])
+        if rc == 0:
+            return True, out
+        metrics.inc('bit_powershell_fallbacks_total', operation='disable')
+        rc, out = run_powershell(f"Disable-BitLocker -MountPoint '{drive}'")
+        return (rc == 0), out
+
+    def volume_id(self, drive: str) -> str | None:
+        guid = super().volume_id(drive)
+        if guid is not None:
+            return guid
+        rc, out = run_cmd(["mountvol", drive.rstrip('\\') + '\\', "/L"], timeout=30)
+        m = _RE_VOLUME_GUID.search(out) if rc == 0 else None
+        return m.group(1) if m else None
+
+
+class SimulatedBackend(VolumeBackend):
+    """In-memory BitLocker volumes for load and concurrency tests on any OS.
+
+    Every volume starts fully encrypted and, once disabled, decrypts at about `rate` percent per minute
+    (each volume gets 0.5x-1.5x of it), with the clock running `speed` times faster than real time.
+    Each call takes `latency` seconds (0.5x-1.5x), fails with probability `fail` and hangs with
+    probability `hang` until the command's CMD_TIMEOUTS timeout. Waits end early when the thread's
+    cancel_scope is set. Output is in manage-bde format and goes through the normal parsers.
+    """
+
+    name = 'sim'
+    needs_windows = False
+    needs_admin = False
+    scratch_storage = True  # its volumes and keys are made up; keep them away from real backups
+
+    def __init__(self, volumes: int = 8, rate: float = 10.0, latency: float = 0.05, fail: float = 0.0,
+                 hang: float = 0.0, speed: float = 1.0, seed: int | None = None):
+        import random
+        self._rng = random.Random(seed)
+        self.latency = latency
+        self.fail = fail
+        self.hang = hang
+        self.speed = self.clock_speed = speed
+        self._lock = threading.Lock()
+        self._volumes = {}
+        for i in range(int(volumes)):
+            ids = [self._guid() for _ in range(2)]
+            password = '-'.join(f'{self._rng.randrange(1000000):06d}' for _ in range(8))
+            self._volumes[_drive_name(i)] = {'rate': rate * self._rng.uniform(0.5, 1.5), 'started': None,
+                                             'size': f'{self._rng.randrange(32, 4000)}.{i % 100:02d} GB',
+                                             'ids': ids, 'password': password, 'guid': self._guid()}
+
+    def _guid(self) -> str:
+        h = f'{self._rng.getrandbits(128):032X}'
+        return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+
+    def _call(self, cmd: list[str]) -> str | None:
+        """Inject latency, hangs and failures. Returns an error text, or None when the call goes through."""
+        with self._lock:
+            roll = self._rng.random()
+            delay = self.latency * self._rng.uniform(0.5, 1.5)
+        cancel = current_cancel_event() or threading.Event()
+        t0 = time.perf_counter()
+        rc, err = 0, None
+        if roll < self.hang:
+            timeout = _cmd_timeout(cmd)
+            if cancel.wait(timeout):
+                rc, err = RC_CANCELLED, f"Geannuleerd: {' '.join(cmd)}"
+            else:
+                rc, err = RC_TIMEOUT, f"Timeout na {timeout:g}s: {' '.join(cmd)}"
+        elif delay and cancel.wait(delay):
+            rc, err = RC_CANCELLED, f"Geannuleerd: {' '.join(cmd)}"
+        elif roll < self.hang + self.fail:
+            rc, err = 1, f"ERROR: gesimuleerde fout bij {' '.join(cmd)}"
+        record_command(cmd, rc, time.perf_counter() - t0)
+        return err
+
+    def _percentage(self, vol: dict) -> float:
+        if vol['started'] is None:
+            return 100.0
+        minutes = (time.monotonic() - vol['started']) * self.speed / 60
+        return max(0.0, round(100.0 - vol['rate'] * minutes, 1))
+
+    def _status_block(self, drive: str, vol: dict) -> str:
+        pct = self._percentage(vol)
+        if vol['started'] is None:
+            conv, prot, protectors = 'Fully Encrypted', 'Protection On', ['TPM', 'Numerical Password']
+        elif pct > 0:
+            conv, prot, protectors = 'Decryption in Progress', 'Protection Off', ['TPM', 'Numerical Password']
+        else:
+            conv, prot, protectors = 'Fully Decrypted', 'Protection Off', []
+        block = (f"Volume {drive} [Sim]\n[Data Volume]\n\n"
+                 f"    Size:                 {vol['size']}\n"
+                 "    BitLocker Version:    2.0\n"
+                 f"    Conversion Status:    {conv}\n"
+                 f"    Percentage Encrypted: {pct:.1f}%\n"
+                 "    Encryption Method:    XTS-AES 128\n"
+                 f"    Protection Status:    {prot}\n"
+                 "    Lock Status:          Unlocked\n")
+        if protectors:
+            return block + "    Key Protectors:\n" + ''.join(f"        {p}\n" for p in protectors) + "\n"
+        return block + "    Key Protectors:       None Found\n\n"
+
+    def detect_drives(self) -> dict:
+        err = self._call(["manage-bde", "-status"])
+        if err is not None:
+            raise DetectionError(err)
+        with self._lock:
+            text = _SYNTHETIC_HEADER + ''.join(self._status_block(d, v) for d, v in self._volumes.items())
+        return parse_volume_status(text)
+
+    def get_bitlocker_status(self, drive: str) -> str:
+        err = self._call(["manage-bde", "-status", drive])
+        if err is not None:
+            return err
+        with self._lock:
+            vol = self._volumes.get(drive.upper()) or self._volumes.get(drive)
+            if vol is None:
+                return f"ERROR: volume {drive} bestaat niet"
+            return _SYNTHETIC_HEADER + self._status_block(drive, vol)
+
+    def get_protectors(self, drive: str) -> tuple[bool, str]:
+        err = self._call(["manage-bde", "-protectors", "-get", drive])
+        if err is not None:
+            return False, err
+        with self._lock:
+            vol = self._volumes.get(drive.upper()) or self._volumes.get(drive)
+            if vol is None:
+                return False, f"ERROR: volume {drive} bestaat niet"
+            tpm_id, password_id = vol['ids']
+            return True, (f"{_SYNTHETIC_HEADER.splitlines()[0]}\n\nVolume {drive} [Sim]\nAll Key Protectors\n\n"
+                          f"    TPM:\n      ID: {{{tpm_id}}}\n      PCR Validation Profile:\n        7, 11\n\n"
+                          f"    Numerical Password:\n      ID: {{{password_id}}}\n      Password:\n"
+                          f"        {vol['password']}\n")
+
+    def disable_bitlocker(self, drive: str) -> tuple[bool, str]:
+        err = self._call(["manage-bde", "-off", drive])
+        if err is not None:
+            return False, err
+        with self._lock:
+            vol = self._volumes.get(drive.upper()) or self._volumes.get(drive)
+            if vol is None:
+                return False, f"ERROR: volume {drive} bestaat niet"
+            if vol['started'] is None:
+                vol['started'] = time.monotonic()
+        return True, "Decryption is now in progress."
+
+    def volume_id(self, drive: str) -> str | None:
+        with self._lock:
+            vol = self._volumes.get(drive.upper()) or self._volumes.get(drive)
+            return vol['guid'] if vol is not None else None
+
+
+BACKENDS = {'manage-bde': ManageBdeBackend, 'sim': SimulatedBackend}
+
+
+def make_backend(spec: str) -> VolumeBackend:
+    """'manage-bde', 'sim' or 'sim:volumes=500,rate=20,latency=0.1,fail=0.01,hang=0,speed=60,seed=1'."""
+    name, _, params = spec.partition(':')
+    cls = BACKENDS.get(name.strip())
+    if cls is None:
+        raise ValueError(f"onbekende backend {name!r}; kies uit {', '.join(BACKENDS)}")
+    kwargs = {}
+    for item in filter(None, params.split(',')):
+        key, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f"verwacht key=value, kreeg {item!r}")
+        kwargs[key.strip()] = int(value) if key.strip() in ('volumes', 'seed') else float(value)
+    try:
+        return cls(**kwargs)
+    except TypeError as e:
+        raise ValueError(str(e)) from None
+
 
-            # prefer .ico for taskbar icon; try logo.ico first
-            for ico_name in ('logo.ico', 'icon.ico'):
-                ico_path = base_dir.with_name(base_dir.name) / ico_name if False else base_dir / ico_name
-                # (above ternary keeps IDE linters happy; we simply test base_dir/ico_name)
-                ico_path = base_dir / ico_name
-                if ico_path.exists():
-                    try:
-                        self.iconbitmap(str(ico_path))
-                    except Exception:
-                        try:
-                            img = tk.PhotoImage(file=str(ico_path))
-                            self.iconphoto(True, img)
-                            self._icon_image = img
-                        except Exception:
-                            pass
-                    break
+def get_backend() -> VolumeBackend:
+    return _backend
 
-            # Header logo images (keep references). Create thumbnails for header display if PIL available
-            self._logo_light_image = None
-            self._logo_dark_image = None
-            self._logo_light_thumb = None
-            self._logo_dark_thumb = None
-            try:
-                if _HAS_PIL:
-                    # load with PIL and create both full and thumbnail versions
-                    lp = Image.open(logo_light).convert('RGBA')
-                    dp = Image.open(logo_dark).convert('RGBA')
-                    # full images for iconphoto use
-                    try:
-                        self._logo_light_image = ImageTk.PhotoImage(lp)
-                        self._logo_dark_image = ImageTk.PhotoImage(dp)
-                    except Exception:
-                        self._logo_light_image = None
-                        self._logo_dark_image = None
-                    # thumbnail for header (approx 40px height)
-                    try:
-                        thumb_size = (40, 40)
-                        lt = lp.resize(thumb_size, Image.LANCZOS)
-                        dt = dp.resize(thumb_size, Image.LANCZOS)
-                        self._logo_light_thumb = ImageTk.PhotoImage(lt)
-                        self._logo_dark_thumb = ImageTk.PhotoImage(dt)
-                    except Exception:
-                        self._logo_light_thumb = None
-                        self._logo_dark_thumb = None
-                else:
-                    try:
-                        self._logo_light_image = tk.PhotoImage(file=str(logo_light))
-                    except Exception:
-                        self._logo_light_image = None
-                    try:
-                        self._logo_dark_image = tk.PhotoImage(file=str(logo_dark))
-                    except Exception:
-                        self._logo_dark_image = None
-                        
-                    # try to subsample for a smaller header image (integer factor)
-                    try:
-                        if self._logo_light_image is not None:
-                            self._logo_light_thumb = self._logo_light_image.subsample(max(1, int(self._logo_light_image.width()/40)))
-                    except Exception:
-                        self._logo_light_thumb = None
-                    try:
-                        if self._logo_dark_image is not None:
-                            self._logo_dark_thumb = self._logo_dark_image.subsample(max(1, int(self._logo_dark_image.width()/40)))
-                    except Exception:
-                        self._logo_dark_thumb = None
 
-            except Exception:
-                self._logo_light_image = None
-                self._logo_dark_image = None
-                self._logo_light_thumb = None
-                self._logo_dark_thumb = None
-
-            # If no .ico found, ensure we have an iconphoto from logo_light (preferred) or embedded icon.png
-            if not hasattr(self, '_icon_image'):
-                icon_png = base_dir / 'icon.png'
-                if not icon_png.exists():
-                    try:
-                        icon_png.write_bytes(base64.b64decode(ICON_PNG_B64))
-                    except Exception:
-                        pass
-                try:
-                    img = tk.PhotoImage(file=str(icon_png))
-                    self.iconphoto(True, img)
-                    self._icon_image = img
-                except Exception:
-                    # fallback to logo_light image
-                    try:
-                        if self._logo_light_image is not None:
-                            self.iconphoto(True, self._logo_light_image)
-                            self._icon_image = self._logo_light_image
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+def set_backend(backend: VolumeBackend) -> None:
+    global _backend
+    _backend = backend
+    if backend.name != ManageBdeBackend.name:
+        log(f"Backend: {backend.name}")
+    if backend.scratch_storage:
+        use_scratch_storage(backend.name)
+
+
+def use_scratch_storage(label: str) -> Path:
+    """Point BACKUP_DIR and INVENTORY_FILE at a new temporary folder, removed at exit, so a session on
+    made-up volumes never writes to, indexes or prunes the real backups and inventory."""
+    global BACKUP_DIR, INVENTORY_FILE
+    import tempfile
+    import shutil
+    root = Path(tempfile.mkdtemp(prefix=f'bit-{label}-'))
+    BACKUP_DIR = root / BACKUP_DIR.name
+    INVENTORY_FILE = root / INVENTORY_FILE.name
+    atexit.register(shutil.rmtree, root, True)
+    log(f"Backups en inventaris van deze sessie in {root}")
+    return root
+
+
+def get_backup_dir() -> Path:
+    """Default backup folder; a temporary one for simulated and replayed sessions."""
+    return BACKUP_DIR
+
 
-        # Styling & fonts
-        style = ttk.Style(self)
+def has_backend_privileges() -> bool:
+    """True when the backend's operations can run: as Administrator, or on a backend that needs none."""
+    return not _backend.needs_admin or is_admin()
+
+
+_backend = ManageBdeBackend()
+
+
+# ---------- Record / replay ----------
+
+RECORD_ENV = 'BIT_RECORD'  # same as --record FILE
+REPLAY_SLACK = 0.25  # seconds added to every replay timing budget for scheduling noise
+RECORD_SECRET_OPTIONS = ('--set-dev-code',)  # command-line options whose value never goes into a recording
+
+# key protector IDs in recorded output (recovery passwords: _RE_RECOVERY_PASSWORD); volume GUIDs are kept
+_RE_RECORD_KEY_ID = re.compile(r"(?<!volume)\{[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}\}", re.I)
+
+
+def _op_name(args: list[str]) -> str:
+    """Operation type of a command for timing budgets, e.g. 'manage-bde -status' or 'powershell Get-BitLockerVolume'."""
+    program = re.split(r'[\\/]', args[0])[-1].lower().removesuffix('.exe') if args else ''
+    first = args[1].split()[0] if len(args) > 1 and args[1].strip() else ''
+    return f'{program} {first}'.strip()
+
+
+def _is_status_call(args: list[str]) -> bool:
+    # status queries are answered by time during replay; everything else in recorded order
+    return '-status' in (a.lower() for a in args) or any('Get-BitLockerVolume' in a for a in args[1:])
+
+
+class CommandRecorder:
+    """Writes every run_cmd / run_powershell call of a session to a gzipped JSON-lines file:
+    a header (argv, platform), one line per call (t since start, args, rc, out, secs) and an end line
+    (exit code, session seconds).
+
+    Recovery passwords, key protector IDs and secret option values are replaced before anything is
+    written. Each distinct value gets its own well-formed placeholder, used everywhere it appears, so a
+    replay still finds the same protectors and still passes the backup checks.
+    """
+
+    def __init__(self, path: Path, argv: list[str]):
+        import gzip
+        self.path = path
+        self._f = gzip.open(path, 'wt', encoding='utf-8', compresslevel=9)
+        self._lock = threading.Lock()
+        self._t0 = time.monotonic()
+        self.calls = 0
+        self._passwords = {}  # real value -> placeholder
+        self._key_ids = {}
+        self._write({'version': 1, 'argv': self._redact_argv(argv), 'platform': sys.platform,
+                     'started': datetime.now().isoformat(timespec='seconds'), 'redacted': True})
+
+    @staticmethod
+    def _redact_argv(argv: list[str]) -> list[str]:
+        argv = list(argv)
+        for i, arg in enumerate(argv[:-1]):
+            if arg in RECORD_SECRET_OPTIONS:
+                argv[i + 1] = '<verwijderd>'
+        return argv
+
+    def _fake_password(self, m: re.Match) -> str:
+        # eight 6-digit blocks, each a multiple of 11 like a real recovery password
+        n = self._passwords.setdefault(m.group(0), len(self._passwords) + 1)
+        return '-'.join(['000000'] * 7 + [f'{n * 11:06d}'])
+
+    def _fake_key_id(self, m: re.Match) -> str:
+        n = self._key_ids.setdefault(m.group(0).upper(), len(self._key_ids) + 1)
+        return f'{{00000000-0000-0000-0000-{n:012d}}}'
+
+    def redact(self, text: str) -> str:
+        with self._lock:
+            text = _RE_RECOVERY_PASSWORD.sub(self._fake_password, text)
+            return _RE_RECORD_KEY_ID.sub(self._fake_key_id, text)
+
+    def _write(self, obj: dict) -> None:
+        with self._lock:
+            if self._f is not None:
+                self._f.write(json.dumps(obj, separators=(',', ':')) + '\n')
+
+    def __call__(self, args: list[str], real, cancel, on_output) -> tuple[int, str]:
+        t = time.monotonic()
+        rc, out = real()
+        secs = time.monotonic() - t
+        self.calls += 1
+        self._write({'t': round(t - self._t0, 4), 'args': [self.redact(a) for a in args], 'rc': rc,
+                     'out': self.redact(out), 'secs': round(secs, 4)})
+        return rc, out
+
+    def close(self, exit_code) -> None:
+        self._write({'end': True, 'exit_code': exit_code, 'secs': round(time.monotonic() - self._t0, 4)})
+        with self._lock:
+            f, self._f = self._f, None
+        if f is not None:
+            f.close()
+            log(f"Opname opgeslagen: {self.path} ({self.calls} commando's)")
+
+
+class CommandPlayer:
+    """Answers run_cmd / run_powershell calls from a recording instead of running anything.
+
+    Status queries get the newest answer recorded at or before the current session time (scaled by
+    speed), so a decryption recorded over hours progresses the same way in minutes. Other commands get
+    their recorded answers in order. Each answer takes its recorded wall time divided by speed.
+    """
+
+    def __init__(self, path: Path, speed: float = 1.0):
+        import gzip
+        self.speed = speed
+        self.end = None
+        self._entries = {}  # tuple(args) -> recorded calls in order
+        self._cursors = {}
+        self.recorded = []
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            self.header = json.loads(f.readline())
+            for line in f:
+                obj = json.loads(line)
+                if obj.get('end'):
+                    self.end = obj
+                else:
+                    self.recorded.append(obj)
+                    self._entries.setdefault(tuple(obj['args']), []).append(obj)
+        self.argv = self.header['argv']
+        self.played = []  # (args, seconds as seen by the caller)
+        self.unmatched = []
+        self.extra = []
+        self._lock = threading.Lock()
+        self._t0 = time.monotonic()
+
+    def __call__(self, args: list[str], real, cancel, on_output) -> tuple[int, str]:
+        import bisect
+        t = time.monotonic()
+        key = tuple(args)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.unmatched.append(list(args))
+                return 1, f"Niet in opname: {' '.join(args)}"
+            if _is_status_call(args):
+                now = (t - self._t0) * self.speed
+                idx = max(0, bisect.bisect_right([e['t'] for e in entries], now) - 1)
+            else:
+                idx = self._cursors.get(key, 0)
+                self._cursors[key] = idx + 1
+                if idx >= len(entries):
+                    self.extra.append(list(args))
+                    idx = len(entries) - 1
+        entry = entries[idx]
+        if (cancel or threading.Event()).wait(entry['secs'] / self.speed):
+            return RC_CANCELLED, f"Geannuleerd: {' '.join(args)}"
+        if on_output:
+            for line in entry['out'].splitlines(keepends=True):
+                on_output('stdout', line)
+        with self._lock:
+            self.played.append((list(args), time.monotonic() - t))
+        return entry['rc'], entry['out']
+
+    def check(self, exit_code, seconds: float, budgets: dict) -> list[str]:
+        """Behaviour and timing differences from the recording. budgets: op name -> max seconds per call."""
+        from collections import Counter
+        failures = []
+        if self.end is not None and exit_code != self.end['exit_code']:
+            failures.append(f"exit code {exit_code}, opname had {self.end['exit_code']}")
+        for args in self.unmatched:
+            failures.append(f"commando niet in opname: {' '.join(args)}")
+        actions = lambda calls: Counter(tuple(a) for a in calls if not _is_status_call(a))
+        want, got = actions(e['args'] for e in self.recorded), actions(a for a, _ in self.played)
+        for key in sorted(set(want) | set(got)):
+            if want[key] != got[key]:
+                failures.append(f"{' '.join(key)}: {got[key]}x uitgevoerd, opname {want[key]}x")
+        if self.end is not None:
+            limit = self.end['secs'] / self.speed * BENCH_TOLERANCE + REPLAY_SLACK
+            if seconds > limit:
+                failures.append(f"sessie duurde {seconds:.2f}s, budget {limit:.2f}s")
+        recorded_max = {}
+        for e in self.recorded:
+            op = _op_name(e['args'])
+            recorded_max[op] = max(recorded_max.get(op, 0.0), e['secs'])
+        for op, max_secs in recorded_max.items():
+            limit = budgets.get(op, max_secs / self.speed * BENCH_TOLERANCE + REPLAY_SLACK)
+            slowest = max((secs for a, secs in self.played if _op_name(a) == op), default=0.0)
+            if slowest > limit:
+                failures.append(f"{op}: {slowest:.3f}s per aanroep, budget {limit:.3f}s")
+        return failures
+
+
+class ReplayBackend(ManageBdeBackend):
+    """manage-bde code paths fed by a CommandPlayer; needs no Windows, Administrator or license."""
+
+    name = 'replay'
+    needs_windows = False
+    needs_admin = False
+    needs_license = False
+    scratch_storage = True  # backups of recorded (redacted) keys must not land in the real backup folder
+
+    def __init__(self, speed: float = 1.0):
+        self.clock_speed = speed
+
+
+def start_recording(path: Path, argv: list[str]) -> CommandRecorder:
+    global _cmd_hook
+    _cmd_hook = CommandRecorder(path, argv)
+    return _cmd_hook
+
+
+def run_replay(path: Path, speed: float, budgets: dict, dispatch) -> int:
+    """Replay a recorded session through dispatch() (the normal command-line handling) and compare."""
+    global _cmd_hook
+    try:
+        player = CommandPlayer(path, speed)
+    except (OSError, ValueError, KeyError) as e:
+        print(f'Opname niet leesbaar: {e}')
+        return EXIT_USAGE
+    set_backend(ReplayBackend(speed))
+    _cmd_hook = player
+    sys.argv = [sys.argv[0]] + player.argv
+    while '--backup-dir' in sys.argv:  # backups of a replay go to the backend's scratch folder
+        _pop_option('--backup-dir')
+    print(f"Replay {path} x{speed:g}: Bit.py {' '.join(player.argv)} ({len(player.recorded)} commando's)")
+    t0 = time.monotonic()
+    try:
+        dispatch()
+        code = EXIT_OK
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (EXIT_OK if e.code is None else EXIT_FAILED)
+    seconds = time.monotonic() - t0
+    _log_writer.flush()
+    failures = player.check(code, seconds, budgets)
+    print(f"Replay klaar in {seconds:.2f}s (opname {player.end['secs'] if player.end else '?'}s), exit code {code}")
+    for f in failures:
+        print('REGRESSIE: ' + f)
+    return EXIT_FAILED if failures else EXIT_OK
+
+
+# ---------- Background drive detection ----------
+
+class DriveDetector:
+    """Runs drive detection on a background thread.
+
+    Requests made while a query is running share its result instead of starting another one.
+    cancel() drops the running query: its callbacks are never called, its running command is killed and
+    the next request starts fresh.
+    """
+
+    def __init__(self, detect=None):
+        self._detect = detect or get_drives_with_bitlocker
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._thread = None
+        self._generation = 0
+        self._cancel = CancelEvent()
+
+    @property
+    def busy(self) -> bool:
+        return self._thread is not None
+
+    def request(self, callback) -> bool:
+        """Call callback(found) with the next result. Returns True if this started a new query."""
+        with self._lock:
+            self._callbacks.append(callback)
+            if self._thread is not None:
+                return False
+            self._cancel = CancelEvent()
+            self._thread = threading.Thread(target=self._run, args=(self._generation, self._cancel),
+                                            name='drive-detect', daemon=True)
+            self._thread.start()
+            return True
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._callbacks = []
+            self._thread = None
+            self._cancel.set()
+
+    def _run(self, generation: int, cancel: 'CancelEvent') -> None:
         try:
-            style.theme_use('vista')
-        except Exception:
+            with cancel_scope(cancel):
+                found = self._detect()
+        except Exception as e:
+            log(f"Fout bij detecteren van schijven: {e}")
+            found = {}
+        with self._lock:
+            if generation != self._generation:
+                return
+            callbacks, self._callbacks = self._callbacks, []
+            self._thread = None
+        for cb in callbacks:
             try:
-                style.theme_use('clam')
-            except Exception:
-                pass
+                cb(found)
+            except Exception as e:
+                log(f"Fout in detectie callback: {e}")
 
-        # Base font sizing
-        self.default_font = tkfont.nametofont("TkDefaultFont")
-        try:
-            self.default_font.configure(size=10)
-        except Exception:
-            pass
 
-        # Theme state
-        self.current_theme = 'default'
-
-        # runtime threading/queue must exist before theme applies (theme logs)
-        self.task_thread = None
-        self.stop_event = threading.Event()
-        self.queue = queue.Queue()
-
-        self.apply_theme(self.current_theme)
-
-        # Runtime state
-        self.selected = {}  # drive -> tk.BooleanVar
-        self.status_labels = {}  # drive -> label widget
-        self.backup_done = {}  # drive -> bool
-
-        self.task_thread = None
-        self.stop_event = threading.Event()
-        self.queue = queue.Queue()
-
-        # Build UI and initialize
-        self._build_ui()
-        # licensing
-        self.licensed = load_license()
-        self.update_license_status()
-        # dev mode
-        self.dev_mode = False
-        rec = load_dev_record()
-        if rec and rec.get('persist_state'):
-            self.dev_mode = True
-            log('Dev Mode active from persisted state')
-        self.update_dev_ui()
-        self.refresh_drives()
-        self.after(200, self._process_queue)
-
-    def apply_theme(self, theme: str) -> None:
-        """Apply a UI theme. Supports 'default' and 'monochrome'."""
-        style = ttk.Style(self)
-        if theme == 'monochrome':
-            # Monochrome (black & white) modern look
-            bg = '#0b0b0b'
-            panel = '#111111'
-            fg = '#ffffff'
-            muted = '#bdbdbd'
-            btn_bg = '#ffffff'
-            btn_fg = '#000000'
-            style.configure('TFrame', background=bg)
-            style.configure('TLabel', background=bg, foreground=fg)
-            style.configure('Header.TLabel', font=('Segoe UI', 18, 'bold'), foreground=fg, background=bg)
-            style.configure('Subtitle.TLabel', font=('Segoe UI', 10), foreground=muted, background=bg)
-            style.configure('TLabelframe.Label', font=('Segoe UI', 11, 'bold'), foreground=muted, background=bg)
-            # Accent button: bold, larger, clear contrast (white bg / black text in monochrome)
-            style.configure('Accent.TButton', foreground=btn_fg, background=btn_bg, font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
-            style.map('Accent.TButton', 
-                background=[('!disabled', btn_bg), ('active', '#e6e6e6'), ('pressed', '#dcdcdc'), ('disabled', '#777777')],
-                foreground=[('!disabled', btn_fg), ('disabled', '#aaaaaa')]
-            )
-            # Danger button: red with clear white text and strong hover
-            style.configure('Danger.TButton', foreground=btn_bg, background='#b32d2e', font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
-            style.map('Danger.TButton', background=[('!disabled', '#b32d2e'), ('active', '#a02828'), ('pressed', '#882222'), ('disabled', '#777777')], foreground=[('!disabled', btn_bg), ('disabled', '#aaaaaa')])
-            # Generic button style: larger font and clear contrast
-            style.configure('TButton', background=panel, foreground=fg, padding=8, font=('Segoe UI', 10))
-            style.map('TButton', background=[('!disabled', panel), ('active', '#2b2b2b')], foreground=[('disabled', '#888888')])
-            style.configure('TCheckbutton', background=bg, foreground=fg, font=('Segoe UI', 9))
-            try:
-                self.configure(bg=bg)
-            except Exception:
-                pass
-            # Text widget colors
-            try:
-                self.log_text.configure(bg='#111111', fg=fg, insertbackground=fg, selectbackground='#333333')
-            except Exception:
-                pass
-            try:
-                self.status_bar.configure(background=bg, foreground=fg)
-            except Exception:
-                pass
-            # header logo (prefer thumbnail)
-            try:
-                if hasattr(self, 'logo_label') and self.logo_label is not None:
-                    if getattr(self, '_logo_dark_thumb', None) is not None:
-                        self.logo_label.configure(image=self._logo_dark_thumb)
-                        self.logo_label.image = self._logo_dark_thumb
-                    elif getattr(self, '_logo_dark_image', None) is not None:
-                        self.logo_label.configure(image=self._logo_dark_image)
-                        self.logo_label.image = self._logo_dark_image
-            except Exception:
-                pass
-            # misc foreground updates
+# ---------- Backup index ----------
+
+BACKUP_INDEX_NAME = 'index.json'
+BACKUP_INDEX_VERSION = 1
+BACKUP_KEEP_ENV = 'BIT_BACKUP_KEEP'  # e.g. BIT_BACKUP_KEEP=10 turns pruning on
+BACKUP_KEEP_SETS = 0  # protector sets kept per volume when pruning; 0 = never delete backups
+BACKUP_INDEX_LOCK_TIMEOUT = 10  # seconds to wait for another process or host updating the index
+BACKUP_INDEX_LOCK_STALE = 120  # seconds after which a lock file is treated as left behind by a crash
+
+
+def _drive_token(drive: str) -> str:
+    """Drive or mount path as used in backup file names (C: -> C)."""
+    return re.sub(r'[^A-Za-z0-9]+', '_', drive).strip('_')
+
+
+def _host_name() -> str:
+    import socket
+    return (os.environ.get('COMPUTERNAME') or socket.gethostname() or 'unknown').lower()
+
+
+def backup_volume_key(drive: str) -> str:
+    """Backup index key of a volume on this machine: host name plus volume GUID (or the drive when
+    the backend cannot tell the GUID), so hosts sharing a backup folder never share a key."""
+    volume_id = None
+    try:
+        volume_id = _backend.volume_id(drive)
+    except Exception as e:
+        log(f"Kan volume-GUID van {drive} niet bepalen: {e}")
+    return f"{_host_name()}/{(volume_id or _drive_token(drive)).lower()}"
+
+
+def backup_keep_sets() -> int:
+    """Protector sets kept per volume when pruning (BIT_BACKUP_KEEP); 0 means backups are never deleted."""
+    try:
+        return max(0, int(os.environ.get(BACKUP_KEEP_ENV, BACKUP_KEEP_SETS)))
+    except ValueError:
+        return BACKUP_KEEP_SETS
+
+
+def protector_set_hash(output: str) -> str:
+    """Hash of a `manage-bde -protectors -get` listing without the tool banner and whitespace noise,
+    so the same protectors always hash the same."""
+    lines = output.strip().splitlines()
+    for i, line in enumerate(lines):
+        if _RE_VOLUME_LINE.match(line):
+            lines = lines[i:]
+            break
+    text = '\n'.join(' '.join(line.split()) for line in lines if line.strip())
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class BackupIndexError(Exception):
+    pass
+
+
+class BackupIndex:
+    """index.json in a backup folder: volume key (see backup_volume_key) -> backups of that volume,
+    oldest first, each with its protector-set hash.
+
+    The folder may be shared by several machines. Every change re-reads the index under a lock file,
+    touches only this host's keys and replaces the file atomically, so concurrent writers merge instead
+    of overwriting each other. Files already in the folder are never adopted. Nothing is deleted unless
+    pruning is switched on (BIT_BACKUP_KEEP), and pruning only removes files this host indexed that
+    still hold the protector set recorded for them. One instance per folder per process (use for_dir).
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_dir(cls, directory: Path) -> 'BackupIndex':
+        key = os.path.normcase(os.path.abspath(directory))
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(Path(directory))
+            return cls._instances[key]
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.path = directory / BACKUP_INDEX_NAME
+        self.lock_path = directory / (BACKUP_INDEX_NAME + '.lock')
+        self._lock = threading.Lock()
+
+    def find(self, key: str, digest: str) -> Path | None:
+        """Existing backup of this exact protector set, marked as the newest; None if there is none.
+        A file that is gone or no longer holds that protector set is dropped from the index."""
+        try:
+            entries = self._read().get(key, [])
+        except BackupIndexError as e:
+            log(str(e))
+            return None
+        for i in range(len(entries) - 1, -1, -1):
+            name = entries[i]['file']
+            if entries[i]['hash'] != digest:
+                continue
+            path = self.directory / name
             try:
-                self.license_status.configure(foreground=fg)
-            except Exception:
-                pass
+                intact = protector_set_hash(path.read_text(encoding='utf-8')) == digest
+            except (OSError, UnicodeDecodeError):
+                intact = False
+            if not intact:
+                log(f"Backup {path} ontbreekt of is gewijzigd; wordt opnieuw gemaakt")
+                self._update(lambda volumes: self._remove(volumes.get(key, []), name))
+                continue
+            if i != len(entries) - 1:
+                self._update(lambda volumes: self._move_to_end(volumes.get(key, []), name))
+            return path
+        return None
+
+    def add(self, key: str, digest: str, path: Path, drive: str = '') -> None:
+        entry = {'file': path.name, 'hash': digest, 'drive': drive,
+                 'created': datetime.now().isoformat(timespec='seconds')}
+        keep = backup_keep_sets()
+
+        def change(volumes):
+            volumes.setdefault(key, []).append(entry)
+            if keep:
+                self._prune(volumes, key, keep)
+        self._update(change)
+
+    @staticmethod
+    def _move_to_end(entries: list, name: str) -> None:
+        for i, e in enumerate(entries):
+            if e['file'] == name:
+                entries.append(entries.pop(i))
+                return
+
+    @staticmethod
+    def _remove(entries: list, name: str) -> None:
+        entries[:] = [e for e in entries if e['file'] != name]
+
+    def _prune(self, volumes: dict, key: str, keep: int) -> int:
+        """Keep the newest file of each protector set, and at most `keep` sets; delete the rest."""
+        entries = volumes.get(key, [])
+        kept, seen, removed = [], set(), 0
+        for e in reversed(entries):
+            if e['hash'] not in seen and len(seen) < keep:
+                seen.add(e['hash'])
+                kept.append(e)
+                continue
+            path = self.directory / e['file']
             try:
-                self.log_text.configure(fg=fg)
-            except Exception:
+                if protector_set_hash(path.read_text(encoding='utf-8')) != e['hash']:
+                    # not the file that was indexed any more: forget it, but do not delete it
+                    log(f"Backup {path} is gewijzigd sinds hij is geïndexeerd; niet verwijderd")
+                    continue
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
                 pass
-            self._append_log('Theme set to Monochrome')
-        else:
-            # Default (green accent) modern look
-            bg = '#ffffff'
-            panel = '#ffffff'
-            fg = '#222222'
-            muted = '#4b4b4b'
-            accent = '#2b7a3a'
-            style.configure('TFrame', background=bg)
-            style.configure('TLabel', background=bg, foreground=fg)
-            style.configure('Header.TLabel', font=('Segoe UI', 18, 'bold'), foreground=accent, background=bg)
-            style.configure('Subtitle.TLabel', font=('Segoe UI', 10), foreground=muted, background=bg)
-            style.configure('TLabelframe.Label', font=('Segoe UI', 11, 'bold'), foreground=muted, background=bg)
-            # Accent button: clear white on green, bolder and responsive
-            style.configure('Accent.TButton', foreground='white', background=accent, font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
-            style.map('Accent.TButton', background=[('!disabled', accent), ('active', '#2f8c30'), ('pressed', '#276d26'), ('disabled', '#999999')], foreground=[('disabled', '#eeeeee')])
-            style.configure('Danger.TButton', foreground='white', background='#b32d2e', font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
-            style.map('Danger.TButton', background=[('!disabled', '#b32d2e'), ('active', '#9b2526'), ('pressed', '#7a1f1f')], foreground=[('disabled', '#dddddd')])
-            style.configure('TButton', background=panel, foreground=fg, padding=8, font=('Segoe UI', 10))
-            style.map('TButton', background=[('!disabled', panel), ('active', '#f0f0f0')], foreground=[('disabled', '#888888')])
-            style.configure('TCheckbutton', background=bg, foreground=fg, font=('Segoe UI', 9))
+            except OSError as err:
+                log(f"Kan oude backup {e['file']} niet verwijderen: {err}")
+                kept.append(e)
+        volumes[key] = kept[::-1]
+        return removed
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            raise BackupIndexError(f"Backup index {self.path} onleesbaar; wordt niet gebruikt of overschreven: {e}")
+        if data.get('version') != BACKUP_INDEX_VERSION:
+            raise BackupIndexError(f"Backup index {self.path} heeft onbekende versie {data.get('version')!r}; "
+                                   f"wordt niet gebruikt of overschreven")
+        return data.get('volumes', {})
+
+    def _update(self, change) -> None:
+        """Re-read the index under the lock file, apply change(volumes) and write it back atomically."""
+        with self._lock:
             try:
-                self.configure(bg='SystemButtonFace')
-            except Exception:
-                pass
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._acquire_file_lock()
+            except (OSError, BackupIndexError) as e:
+                log(f"Backup index {self.path} niet bijgewerkt: {e}")
+                return
             try:
-                self.log_text.configure(bg='#fbfbfb', fg=fg, insertbackground=fg, selectbackground='#ececec')
-            except Exception:
-                pass
+                volumes = self._read()
+                change(volumes)
+                write_file_atomic(self.path, json.dumps({'version': BACKUP_INDEX_VERSION, 'volumes': volumes}))
+            except (OSError, BackupIndexError) as e:
+                log(f"Backup index {self.path} niet bijgewerkt: {e}")
+            finally:
+                try:
+                    self.lock_path.unlink()
+                except OSError:
+                    pass
+
+    def _acquire_file_lock(self) -> None:
+        deadline = time.monotonic() + BACKUP_INDEX_LOCK_TIMEOUT
+        while True:
             try:
-                self.status_bar.configure(background='#f7f7f7', foreground='#444444')
-            except Exception:
-                pass
-            # header logo (prefer thumbnail)
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - self.lock_path.stat().st_mtime > BACKUP_INDEX_LOCK_STALE:
+                        log(f"Verouderd lock {self.lock_path} verwijderd")
+                        self.lock_path.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue  # released in the meantime
+                if time.monotonic() > deadline:
+                    raise BackupIndexError(f"{self.lock_path} bezet na {BACKUP_INDEX_LOCK_TIMEOUT}s")
+                time.sleep(0.05)
+                continue
             try:
-                if hasattr(self, 'logo_label') and self.logo_label is not None:
-                    if getattr(self, '_logo_light_thumb', None) is not None:
-                        self.logo_label.configure(image=self._logo_light_thumb)
-                        self.logo_label.image = self._logo_light_thumb
-                    elif getattr(self, '_logo_light_image', None) is not None:
-                        self.logo_label.configure(image=self._logo_light_image)
-                        self.logo_label.image = self._logo_light_image
-            except Exception:
-                pass
-            # misc foreground updates
+                os.write(fd, f"{_host_name()} {os.getpid()}\n".encode('utf-8'))
+            finally:
+                os.close(fd)
+            return
+
+
+# ---------- Backup bundles ----------
+
+BUNDLE_MAGIC = b'BLBUNDL1'
+BUNDLE_CIPHER = 'aesgcm'  # keyed from the passphrase; needs the `cryptography` package
+BUNDLE_SUFFIX = '.blb'
+BUNDLE_KDF_ITERATIONS = 200_000
+BUNDLE_PASSPHRASE_ENV = 'BIT_BUNDLE_PASSPHRASE'
+_BUNDLE_HEADER = struct.Struct('<8s16sI')    # magic, salt, kdf iterations
+_BUNDLE_TRAILER = struct.Struct('<QI32s8s')  # toc offset, toc length, toc mac, magic
+
+
+class BundleError(Exception):
+    """Not a bundle, damaged, or the passphrase is wrong."""
+
+
+def _bundle_keys(passphrase: str, salt: bytes, iterations: int) -> tuple[bytes, bytes]:
+    """(mac key, encryption key), both from one PBKDF2 run over the passphrase."""
+    key = hashlib.pbkdf2_hmac('sha256', passphrase.encode('utf-8'), salt, iterations, dklen=64)
+    return key[:32], key[32:]
+
+
+def bundles_available() -> bool:
+    return CIPHER_BACKENDS[BUNDLE_CIPHER].available()
+
+
+def bundle_path_for_session(target_dir: Path) -> Path:
+    return target_dir / f"recovery_bundle_{datetime.now().strftime('%Y%m%d-%H%M%S')}{BUNDLE_SUFFIX}"
+
+
+class BundleWriter:
+    """Streams the backups of one session into a single file.
+
+    Layout: header (magic, salt, iterations), entries back to back (zlib-compressed, then encrypted with
+    BUNDLE_CIPHER under the entry name as associated data), a JSON table of contents (cipher; name,
+    offset, length, size, sha256 per entry) and a trailer with the TOC position and an HMAC-SHA256 over
+    header + TOC. Both keys come from the passphrase. The TOC pins every entry's hash, so one entry can
+    be read and authenticated without touching the rest. add() is thread-safe; the file is
+    written under a temporary name and only appears once close() succeeds.
+    """
+
+    def __init__(self, path: Path, passphrase: str, iterations: int = BUNDLE_KDF_ITERATIONS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        salt = os.urandom(16)
+        self._key, enc_key = _bundle_keys(passphrase, salt, iterations)
+        try:
+            self._cipher = get_cipher(BUNDLE_CIPHER, enc_key)
+        except CipherError as e:
+            raise BundleError(f"Bundels vereisen het pakket 'cryptography': {e}") from None
+        self._header = _BUNDLE_HEADER.pack(BUNDLE_MAGIC, salt, iterations)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self._f = open(self._tmp, 'wb')
+        self._f.write(self._header)
+
+    def add(self, name: str, data: bytes) -> None:
+        import zlib
+        # compress and encrypt outside the lock; parallel jobs only queue for the write
+        blob = self._cipher.encrypt(zlib.compress(data, 9), name.encode('utf-8'))
+        with self._lock:
+            if name in self._entries:
+                raise ValueError(f"dubbele bundel-entry: {name}")
+            offset = self._f.tell()
+            self._f.write(blob)
+            self._entries[name] = {'name': name, 'offset': offset, 'length': len(blob), 'size': len(data),
+                                   'sha256': hashlib.sha256(blob).hexdigest()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> Path:
+        with self._lock:
+            toc = json.dumps({'created': datetime.now().isoformat(timespec='seconds'), 'cipher': self._cipher.name,
+                              'entries': list(self._entries.values())}).encode('utf-8')
+            offset = self._f.tell()
+            mac = hmac.new(self._key, self._header + toc, hashlib.sha256).digest()
+            self._f.write(toc)
+            self._f.write(_BUNDLE_TRAILER.pack(offset, len(toc), mac, BUNDLE_MAGIC))
+            self._f.flush()
+            os.fsync(self._f.fileno())
+            self._f.close()
+            os.replace(self._tmp, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        with self._lock:
+            self._f.close()
             try:
-                self.license_status.configure(foreground=fg)
-            except Exception:
+                self._tmp.unlink()
+            except OSError:
                 pass
+
+
+class BundleReader:
+    """Random access to a bundle written by BundleWriter. Raises BundleError when authentication fails."""
+
+    def __init__(self, path: Path, passphrase: str):
+        self.path = Path(path)
+        self._f = open(self.path, 'rb')
+        try:
+            header = self._f.read(_BUNDLE_HEADER.size)
+            magic, salt, iterations = _BUNDLE_HEADER.unpack(header)
+            self._f.seek(-_BUNDLE_TRAILER.size, os.SEEK_END)
+            offset, length, mac, end_magic = _BUNDLE_TRAILER.unpack(self._f.read(_BUNDLE_TRAILER.size))
+            if magic != BUNDLE_MAGIC or end_magic != magic:
+                raise BundleError(f"{self.path} is geen backup-bundel")
+            self._f.seek(offset)
+            toc = self._f.read(length)
+            mac_key, enc_key = _bundle_keys(passphrase, salt, iterations)
+            if not hmac.compare_digest(mac, hmac.new(mac_key, header + toc, hashlib.sha256).digest()):
+                raise BundleError(f"Verkeerd wachtwoord of beschadigde bundel: {self.path}")
+            data = json.loads(toc)
+            self._cipher = get_cipher(data['cipher'], enc_key)
+        except CipherError as e:
+            self._f.close()
+            raise BundleError(f"Bundel {self.path}: {e}") from None
+        except BundleError:
+            self._f.close()
+            raise
+        except (struct.error, OSError, ValueError) as e:
+            self._f.close()
+            raise BundleError(f"Beschadigde bundel {self.path}: {e}") from None
+        self.created = data.get('created')
+        self.entries = {e['name']: e for e in data['entries']}
+
+    def names(self) -> list[str]:
+        return list(self.entries)
+
+    def read(self, name: str) -> bytes:
+        import zlib
+        e = self.entries.get(name)
+        if e is None:
+            raise BundleError(f"{name} staat niet in {self.path}")
+        self._f.seek(e['offset'])
+        blob = self._f.read(e['length'])
+        if hashlib.sha256(blob).hexdigest() != e['sha256']:
+            raise BundleError(f"Entry {name} in {self.path} is beschadigd")
+        try:
+            blob = self._cipher.decrypt(blob, name.encode('utf-8'))
+        except CipherError as err:
+            raise BundleError(f"Entry {name} in {self.path}: {err}") from None
+        return zlib.decompress(blob)
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------- Shared status poller ----------
+
+class CancelEvent(threading.Event):
+    """threading.Event that also notifies listeners on set(), so blocked waiters can wake at once."""
+
+    def __init__(self):
+        super().__init__()
+        self._listeners = []
+
+    def add_listener(self, callback) -> None:
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def set(self) -> None:
+        super().set()
+        for cb in list(self._listeners):
             try:
-                self.log_text.configure(fg=fg)
+                cb()
             except Exception:
                 pass
-            self._append_log('Theme set to Default')
 
-    def set_theme(self, theme: str) -> None:
-        self.current_theme = theme
-        self.apply_theme(theme)
 
-    def set_app_icon(self) -> None:
-        """Ensure the application window and taskbar show the app icon (logo.ico or embedded image)."""
-        try:
-            base_dir = Path(__file__).parent
-            ico = base_dir / 'logo.ico'
-            if ico.exists():
-                try:
-                    self.iconbitmap(str(ico))
-                except Exception:
-                    pass
-            # also ensure iconphoto uses the full logo image if available
-            if hasattr(self, '_logo_light_image') and self._logo_light_image is not None:
+class ThroughputEstimator:
+    """Keeps recent (time, percentage) samples for one drive and estimates decrypt rate, ETA and poll interval."""
+
+    def __init__(self, window: int = 10):
+        self.samples = deque(maxlen=window)
+        self.interval = CHECK_INTERVAL
+
+    def add(self, pct: float, now: float | None = None) -> None:
+        self.samples.append((time.monotonic() if now is None else now, pct))
+        self.interval = self._next_interval()
+
+    def rate(self) -> float | None:
+        """Percentage points per second (positive while decrypting), or None without progress."""
+        if len(self.samples) < 2:
+            return None
+        (t0, p0), (t1, p1) = self.samples[0], self.samples[-1]
+        if t1 <= t0 or p0 <= p1:
+            return None
+        return (p0 - p1) / (t1 - t0)
+
+    def eta(self) -> float | None:
+        rate = self.rate()
+        if rate is None:
+            return None
+        return self.samples[-1][1] / rate
+
+    def _next_interval(self) -> float:
+        rate = self.rate()
+        if rate is None:
+            # no measurable progress yet (or stalled): back off gradually
+            interval = self.interval * 1.5 if len(self.samples) >= 2 else CHECK_INTERVAL
+        else:
+            interval = POLL_STEP_PCT / rate
+            # near the end poll more often so completion is noticed quickly
+            interval = min(interval, self.eta() / 2)
+        return max(MIN_POLL_INTERVAL, min(MAX_POLL_INTERVAL, interval))
+
+
+def format_eta(seconds: float | None) -> str:
+    if seconds is None:
+        return 'onbekend'
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}u {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
+
+
+class StatusPoller:
+    """Runs one all-volumes `manage-bde -status` per tick and hands each subscriber its drive's block.
+
+    Callbacks are called from the poller thread as callback(drive, VolumeStatus or None). A failing poll is
+    logged and retried on the next tick; after POLL_MAX_ERRORS failures in a row every subscriber gets
+    callback(drive, exception) once. The thread starts on
+    the first subscription and exits once the last subscriber is gone. The wait between ticks follows
+    the most urgent drive's ThroughputEstimator. Rates and intervals are in the backend's session time
+    (clock_speed), so simulated and replayed sessions poll as if they ran at real speed.
+    """
+
+    def __init__(self, interval: float = CHECK_INTERVAL):
+        self.interval = interval
+        self._subscribers = {}  # drive -> list of callbacks
+        self.estimators = {}  # drive -> ThroughputEstimator
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self.errors = 0  # failed polls in a row
+
+    def subscribe(self, drive: str, callback) -> None:
+        with self._lock:
+            self._subscribers.setdefault(drive, []).append(callback)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='status-poller', daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def unsubscribe(self, drive: str, callback) -> None:
+        with self._lock:
+            cbs = self._subscribers.get(drive, [])
+            if callback in cbs:
+                cbs.remove(callback)
+            if not cbs:
+                self._subscribers.pop(drive, None)
+                self.estimators.pop(drive, None)
+        self._wake.set()
+
+    def next_interval(self) -> float:
+        with self._lock:
+            intervals = [self.estimators[d].interval for d in self._subscribers if d in self.estimators]
+        return min(intervals) if intervals else self.interval
+
+    def is_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def poll_once(self) -> dict:
+        """Take one snapshot and deliver it. Returns drive -> VolumeStatus (or None) for the subscribed drives."""
+        with self._lock:
+            subs = {d: list(cbs) for d, cbs in self._subscribers.items()}
+        if not subs:
+            return {}
+        metrics.inc('bit_status_polls_total')
+        volumes = detect_drives()
+        snapshot = {}
+        for drive, cbs in subs.items():
+            vol = volumes.get(drive)
+            if vol is None:
+                # not in the all-volumes listing; ask for this drive alone
+                vol = get_volume_status(drive)
+            snapshot[drive] = vol
+            if vol is not None and vol.percentage is not None:
+                with self._lock:
+                    est = self.estimators.setdefault(drive, ThroughputEstimator())
+                est.add(vol.percentage, time.monotonic() * _backend.clock_speed)
+                metrics.set('bit_percentage_encrypted', vol.percentage, drive=drive)
+                rate = est.rate()
+                if rate is not None:
+                    metrics.set('bit_decrypt_percent_per_minute', round(rate * 60, 4), drive=drive)
+            for cb in cbs:
                 try:
-                    self.iconphoto(True, self._logo_light_image)
-                except Exception:
-                    pass
-            elif hasattr(self, '_icon_image') and self._icon_image is not None:
+                    cb(drive, vol)
+                except Exception as e:
+                    log(f"Fout in status subscriber voor {drive}: {e}")
+        return snapshot
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            self._wake.clear()
+            try:
+                self.poll_once()
+                self.errors = 0
+            except Exception as e:
+                self.errors += 1
+                metrics.inc('bit_status_poll_errors_total')
+                log(f"Statuspoll mislukt ({self.errors}x): {e}")
+                if self.errors >= POLL_MAX_ERRORS:
+                    self.errors = 0
+                    self._deliver_error(e)
+            self._wake.wait(self.next_interval() / _backend.clock_speed)
+
+    def _deliver_error(self, error: Exception) -> None:
+        with self._lock:
+            subs = {d: list(cbs) for d, cbs in self._subscribers.items()}
+        for drive, cbs in subs.items():
+            for cb in cbs:
                 try:
-                    self.iconphoto(True, self._icon_image)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+                    cb(drive, error)
+                except Exception as e:
+                    log(f"Fout in status subscriber voor {drive}: {e}")
 
-    def toggle_theme(self) -> None:
-        self.set_theme('monochrome' if self.current_theme != 'monochrome' else 'default')
-
-    def _build_ui(self):
-        # Header with app title
-        header = ttk.Frame(self, padding=(12, 10))
-        header.pack(fill='x')
-        # Header logo + title
-        self.logo_label = None
-        # choose thumbnail for header (smaller size)
-        logo_img = getattr(self, '_logo_light_thumb', None) if self.current_theme != 'monochrome' else getattr(self, '_logo_dark_thumb', None)
-        # fallback to full image if thumbnail not available
-        if not logo_img:
-            logo_img = getattr(self, '_logo_light_image', None) if self.current_theme != 'monochrome' else getattr(self, '_logo_dark_image', None)
-        if logo_img:
-            # use a plain tk.Label for image
-            self.logo_label = tk.Label(header, image=logo_img)
-            self.logo_label.image = logo_img
-            self.logo_label.pack(side='left', padx=(0,8))
-        title = ttk.Label(header, text=PRODUCT_NAME, style='Header.TLabel')
-        title.pack(side='left')
-        subtitle = ttk.Label(header, text=f"{COMPANY_NAME} — v{VERSION}", style='Subtitle.TLabel')
-        subtitle.pack(side='left', padx=8)
-
-        # Menus (View: themes + Help docs)
-        menubar = tk.Menu(self)
-        viewmenu = tk.Menu(menubar, tearoff=0)
-        viewmenu.add_radiobutton(label='Default theme', command=lambda: self.set_theme('default'))
-        viewmenu.add_radiobutton(label='Monochrome (zwart/wit)', command=lambda: self.set_theme('monochrome'))
-        menubar.add_cascade(label='View', menu=viewmenu)
-
-        helpmenu = tk.Menu(menubar, tearoff=0)
-        helpmenu.add_command(label='View README', command=self.show_readme)
-        helpmenu.add_command(label='View EULA', command=self.show_eula)
-        helpmenu.add_command(label='View Terms', command=self.show_terms)
-        menubar.add_cascade(label='Help', menu=helpmenu)
-        self.config(menu=menubar)
-
-        top = ttk.Frame(self)
-        top.pack(fill='x', padx=10, pady=6)
-
-        refresh_btn = ttk.Button(top, text='Refresh drives', command=self.refresh_drives, style='TButton')
-        refresh_btn.pack(side='left')
-
-        # License controls
-        self.license_status = ttk.Label(top, text='License: unknown')
-        self.license_status.pack(side='right', padx=6)
-        self.license_btn = ttk.Button(top, text='Enter License', command=self.enter_license, style='Accent.TButton')
-        self.license_btn.pack(side='right')
-        self.demo_btn = ttk.Button(top, text='Demo license', command=self.generate_demo_license_ui, style='Accent.TButton')
-        self.demo_btn.pack(side='right', padx=6)
-
-        self.relaunch_btn = ttk.Button(top, text='Relaunch as Admin', command=self.relaunch_as_admin, style='TButton')
-        self.relaunch_btn.pack(side='right')
-
-        theme_btn = ttk.Button(top, text='Monochrome', command=self.toggle_theme, style='TButton')
-        theme_btn.pack(side='right', padx=6)
-
-        about_btn = ttk.Button(top, text='About', command=self.show_about, style='TButton')
-        about_btn.pack(side='right', padx=6)
-
-        mid = ttk.Frame(self)
-        mid.pack(fill='both', expand=True, padx=10, pady=6)
-
-        left = ttk.LabelFrame(mid, text='Drives (selecteer)')
-        left.pack(side='left', fill='y', padx=6, pady=6)
-
-        self.drive_container = ttk.Frame(left)
-        self.drive_container.pack(fill='both', expand=True)
-
-        right = ttk.Frame(mid)
-        right.pack(side='right', fill='both', expand=True)
-
-        agree_frame = ttk.Frame(right)
-        agree_frame.pack(fill='x')
-        self.agree_var = tk.BooleanVar(value=False)
-        cb = ttk.Checkbutton(agree_frame, text='Ik begrijp de risico\'s en heb een backup gemaakt van mijn recovery keys', variable=self.agree_var, command=self._update_start_state)
-        cb.pack(side='left', fill='x', expand=True)
-
-        btns = ttk.Frame(right)
-        btns.pack(fill='x', pady=6)
-        self.backup_btn = ttk.Button(btns, text='Backup geselecteerde', command=self.backup_selected, style='Accent.TButton')
-        self.backup_btn.pack(side='left', padx=4)
-        self.start_btn = ttk.Button(btns, text='Start', command=self.start_selected, state='disabled', style='Accent.TButton')
-        self.start_btn.pack(side='left', padx=4)
-        self.cancel_btn = ttk.Button(btns, text='Annuleer', command=self.cancel, state='disabled', style='Danger.TButton')
-        self.cancel_btn.pack(side='left', padx=4)
-
-        # Dev Mode Controls
-        dev_frame = ttk.LabelFrame(right, text='Dev Mode')
-        dev_frame.pack(fill='x', pady=6)
-        self.dev_label = ttk.Label(dev_frame, text='Dev Mode: Off')
-        self.dev_label.pack(side='left', padx=6)
-        self.dev_unlock_btn = ttk.Button(dev_frame, text='Unlock Dev Mode', command=self.enter_dev_code_ui, style='TButton')
-        self.dev_unlock_btn.pack(side='left', padx=4)
-        self.dev_gen_btn = ttk.Button(dev_frame, text='Set/Generate Code', command=self.generate_dev_code_ui, style='Accent.TButton')
-        self.dev_gen_btn.pack(side='left', padx=4)
-        self.dev_clear_btn = ttk.Button(dev_frame, text='Clear saved code', command=self.clear_dev_code_ui, style='TButton')
-        self.dev_clear_btn.pack(side='left', padx=4)
-        self.dev_reveal_btn = ttk.Button(dev_frame, text='Reveal saved code', command=self.reveal_dev_code_ui, style='TButton')
-        self.dev_reveal_btn.pack(side='left', padx=4)
-
-        self.progress_box = ttk.LabelFrame(right, text='Voortgang / Log')
-        self.progress_box.pack(fill='both', expand=True, pady=6)
-        self.log_text = tk.Text(self.progress_box, height=18, state='disabled')
-        self.log_text.pack(fill='both', expand=True)
-        self.status_bar = ttk.Label(self, text='Ready', relief='sunken', anchor='w')
-        self.status_bar.pack(side='bottom', fill='x')
-
-    def _append_log(self, message: str):
-        log(message)
-        self.queue.put(('log', message))
-
-    def _process_queue(self):
-        try:
-            while True:
-                item = self.queue.get_nowait()
-                typ, msg = item
-                if typ == 'log':
-                    self.log_text.configure(state='normal')
-                    self.log_text.insert('end', msg + '\n')
-                    self.log_text.see('end')
-                    self.log_text.configure(state='disabled')
-                    try:
-                        self.status_bar.configure(text=msg[:120])
-                    except Exception:
-                        pass
-                elif typ == 'status':
-                    drive, text = msg
-                    if drive in self.status_labels:
-                        self.status_labels[drive].configure(text=text)
-        except queue.Empty:
-            pass
-        self.after(200, self._process_queue)
-
-    def update_dev_ui(self):
-        rec = load_dev_record()
-        text = 'Dev Mode: On' if getattr(self, 'dev_mode', False) else 'Dev Mode: Off'
-        if rec:
-            if rec.get('persist'):
-                text += ' (saved)'
-            if rec.get('hide'):
-                text += ' [hidden]'
-        self.dev_label.configure(text=text)
-        # Reveal button only enabled if saved and not hidden
-        if rec and not rec.get('hide'):
-            self.dev_reveal_btn.configure(state='normal')
-        else:
-            self.dev_reveal_btn.configure(state='disabled')
-        self._update_start_state()
 
-    def enter_dev_code_ui(self):
-        # masked input prompt
-        code = simpledialog.askstring('Enter dev code', 'Voer je dev-code in:', show='*', parent=self)
-        if not code:
-            return
-        ok = verify_dev_code(code)
-        if ok:
-            self.dev_mode = True
-            self._append_log('Dev Mode ontgrendeld (sessie).')
-            messagebox.showinfo('Dev Mode', 'Dev Mode is nu actief voor deze sessie.')
-            self.update_dev_ui()
-        else:
-            messagebox.showerror('Dev Mode', 'Onjuiste code of geen dev code ingesteld.')
+# ---------- Job engine ----------
 
-    def generate_dev_code_ui(self):
-        # ask whether to generate or enter custom
-        if messagebox.askyesno('Generate', 'Wil je een willekeurige code genereren? (Nee = voer eigen code in)'):
-            code = secrets.token_urlsafe(10)
-        else:
-            code = simpledialog.askstring('Custom code', 'Voer gewenste dev-code in:', parent=self)
-            if not code:
-                return
-        hide = messagebox.askyesno('Hide code', 'Wil je dat de code verborgen wordt (niet later zichtbaar)?')
-        persist_state = messagebox.askyesno('Persist dev', 'Moet Dev Mode actief blijven na herstart tot je het wist?')
-        ok = save_dev_record(code, persist=True, hide=hide, persist_state=persist_state)
-        if ok:
-            # show code once if it was generated or if user didn't hide
-            if not hide:
-                messagebox.showinfo('Dev Code', f'De code is opgeslagen en is: {code}\nBewaar deze veilig.')
-            else:
-                # show once and warn
-                messagebox.showinfo('Dev Code', f'De code is opgeslagen en wordt verborgen; sla hem nu op. Code: {code}')
-            self._append_log('Dev code opgeslagen (verborgen: %s; persistent: %s)' % (hide, persist_state))
-            # if user wants to keep dev mode active now, set it
-            if persist_state:
-                self.dev_mode = True
-            self.update_dev_ui()
-        else:
-            messagebox.showerror('Dev', 'Kon dev code niet opslaan.')
+_RE_PROTECTOR_ID = re.compile(r"ID:\s*\{[0-9A-Fa-f-]+\}")
+_RE_RECOVERY_PASSWORD = re.compile(r"\b\d{6}(?:-\d{6}){7}\b")
 
-    def clear_dev_code_ui(self):
-        if not messagebox.askyesno('Clear', 'Weet je zeker dat je de opgeslagen dev-code wilt verwijderen?'):
-            return
-        ok = clear_dev_record()
-        if ok:
-            self.dev_mode = False
-            self._append_log('Dev code verwijderd.')
-            messagebox.showinfo('Clear', 'Dev code verwijderd.')
-            self.update_dev_ui()
-        else:
-            messagebox.showerror('Clear', 'Kon dev code niet verwijderen.')
 
-    def reveal_dev_code_ui(self):
-        rec = load_dev_record()
-        if not rec:
-            messagebox.showinfo('Reveal', 'Geen opgeslagen dev code gevonden.')
-            return
-        if rec.get('hide'):
-            messagebox.showwarning('Reveal', 'De opgeslagen code is gemarkeerd als verborgen en kan niet worden onthuld via de UI.')
-            return
-        try:
-            blob = base64.b64decode(rec['code'])
-            plain = _dpapi_decrypt(blob)
-            if plain is None:
-                messagebox.showerror('Reveal', 'Kon code niet ontcijferen.')
-                return
-            code = plain.decode('utf-8')
-            # show code once
-            messagebox.showinfo('Stored dev code', f'De opgeslagen code is: {code}')
-        except Exception as e:
-            messagebox.showerror('Reveal', f'Fout: {e}')
+def verify_backup_file(path: Path | None, volume: VolumeStatus | None = None) -> bool:
+    """Check that a backup file exists, is readable and contains at least one key protector.
+    If the volume is known to have a recovery password, the backup must contain it."""
+    if path is None:
+        return False
+    try:
+        txt = path.read_text(encoding='utf-8')
+    except Exception as e:
+        log(f"Backup niet leesbaar {path}: {e}")
+        return False
+    return verify_backup_text(txt, volume, str(path))
 
-    def refresh_drives(self):
-        """Detect drives and rebuild checkbuttons"""
-        # Ensure correct app icon is set while we search
-        try:
-            self.set_app_icon()
-        except Exception:
-            pass
-        self.status_bar.configure(text='Zoeken naar schijven...')
-        self._append_log("Drives detecteren...")
-        found = get_drives_with_bitlocker()
-        # restore status
-        try:
-            self.set_app_icon()
-            self.status_bar.configure(text='Ready')
-        except Exception:
-            pass
-        # Clear existing
-        for child in self.drive_container.winfo_children():
-            child.destroy()
-        self.selected.clear()
-        self.status_labels.clear()
-        self.backup_done.clear()
-
-        if not found:
-            lbl = ttk.Label(self.drive_container, text='Geen BitLocker-geschakelde volumes gevonden')
-            lbl.pack()
-            self._append_log('Geen schijven met BitLocker gevonden.')
-            return
 
-        for d, block in sorted(found.items()):
-            var = tk.BooleanVar(value=False)
-            frame = ttk.Frame(self.drive_container)
-            frame.pack(fill='x', pady=2)
-            cb = ttk.Checkbutton(frame, text=d, variable=var, command=self._update_start_state)
-            cb.pack(side='left')
-            stat = ttk.Label(frame, text='Status onbekend')
-            stat.pack(side='left', padx=8)
-            self.selected[d] = var
-            self.status_labels[d] = stat
-            self.backup_done[d] = False
-            # initialize label with current percentage if available
-            pct = parse_encryption_percentage(block)
-            if pct is not None:
-                stat.configure(text=f'Encrypted: {pct}%')
-
-        self._update_start_state()
-
-    def _update_start_state(self):
-        # Start is enabled only if: at least one drive selected, agree checked, and backups done for all selected drives
-        any_selected = any(v.get() for v in self.selected.values())
-        if not any_selected or not self.agree_var.get():
-            self.start_btn.configure(state='disabled')
-            return
-        # ensure backups done
-        for d, v in self.selected.items():
-            if v.get() and not self.backup_done.get(d, False):
-                self.start_btn.configure(state='disabled')
-                return
-        if not is_admin():
-            self.start_btn.configure(state='disabled')
-            self._append_log('Script is niet als Administrator gestart; Start uitgeschakeld.')
-            return
-        # Require a valid license to perform disabling operations, unless Dev Mode is active
-        if not getattr(self, 'licensed', False) and not getattr(self, 'dev_mode', False):
-            self.start_btn.configure(state='disabled')
-            self._append_log('Geen geldige licentie gevonden; start uitgeschakeld. (Of activeer Dev Mode)')
-            return
-        self.start_btn.configure(state='normal')
+def verify_backup_text(txt: str, volume: VolumeStatus | None = None, source: str = '') -> bool:
+    """verify_backup_file for a protectors listing already in memory; source is only used in the log."""
+    if not _RE_PROTECTOR_ID.search(txt):
+        return False
+    if volume is not None and volume.has_recovery_password and not _RE_RECOVERY_PASSWORD.search(txt):
+        log(f"Backup {source} mist het recovery password van {volume.drive}")
+        return False
+    return True
+
+
+class DriveJob:
+    """A chain of stages for one drive. Stages are (name, func) pairs; func(job) returns True to continue."""
+
+    def __init__(self, drive: str, stages: list, backup_dir: Path | None = None, volume: VolumeStatus | None = None,
+                 bundle: 'BundleWriter | None' = None):
+        self.drive = drive
+        self.stages = stages
+        self.backup_dir = backup_dir or BACKUP_DIR
+        self.volume = volume
+        self.bundle = bundle  # BundleWriter: add the backup to it instead of writing a file per drive
+        self.backup_path = None
+        self.backup_text = None
+        self.timings = {}  # stage -> seconds
+        self.failed_stage = None
+        self.stop_event = None
+        self.on_status = None
+        self.poller = None
+        self.executor = None
+
+    def report(self, text: str) -> None:
+        if self.on_status:
+            self.on_status(self.drive, text)
+
+    @property
+    def ok(self) -> bool:
+        return self.failed_stage is None and len(self.timings) == len(self.stages)
+
+
+def stage_backup(job: DriveJob) -> bool:
+    job.report('Backup bezig')
+    if job.bundle is not None:
+        job.backup_text = get_protectors_output(job.drive)
+        if job.backup_text is None:
+            return False
+        job.bundle.add(job.drive, job.backup_text.encode('utf-8'))
+        job.backup_path = job.bundle.path
+        job.report('Backup in bundel')
+        return True
+    job.backup_path = backup_recovery_key(job.drive, job.backup_dir)
+    if job.backup_path:
+        job.executor.mark_dirty(job.backup_dir)
+        job.report('Backup aanwezig')
+    return job.backup_path is not None
 
-    def relaunch_as_admin(self):
-        if is_admin():
-            messagebox.showinfo('Admin', 'Je draait al als Administrator.')
-            return
-        try:
-            # Relaunch this script elevated
-            params = ' '.join([f'"{arg}"' for arg in sys.argv[1:]])
-            ctypes.windll.shell32.ShellExecuteW(None, 'runas', sys.executable, f'"{__file__}" {params}', None, 1)  # type: ignore
-            self._append_log('Script wordt opnieuw gestart als Administrator...')
-            self.destroy()
-        except Exception as e:
-            messagebox.showerror('Fout', f'Kan niet opnieuw starten als Administrator: {e}')
 
-    def update_license_status(self):
-        self.licensed = load_license()
-        if self.licensed:
-            self.license_status.configure(text=f'License: Licensed')
-            self._append_log('Licentie: actief')
-        else:
-            self.license_status.configure(text=f'License: Demo/Unlicensed')
-            self._append_log('Licentie: niet gevonden of verlopen')
-        self._update_start_state()
+def stage_verify(job: DriveJob) -> bool:
+    if job.bundle is not None:
+        ok = verify_backup_text(job.backup_text or '', job.volume, f"{job.backup_path} [{job.drive}]")
+    else:
+        ok = verify_backup_file(job.backup_path, job.volume)
+    if not ok:
+        log(f"Backup voor {job.drive} bevat geen key protector: {job.backup_path}")
+    return ok
 
-    def enter_license(self):
-        key = simpledialog.askstring('Licentie invoeren', 'Plak je licentiesleutel (of inhoud van .lic bestand):', parent=self)
-        if not key:
-            return
-        if validate_license_content(key.strip()):
-            if write_license_file(key.strip()):
-                self._append_log('Licentie opgeslagen en geactiveerd.')
-                messagebox.showinfo('Licentie', 'Licentie geaccepteerd. Herstart de app indien nodig.')
-                self.update_license_status()
-            else:
-                messagebox.showerror('Licentie', 'Kan licentiebestand niet opslaan.')
-        else:
-            messagebox.showerror('Licentie', 'Ongeldige of verlopen licentiesleutel.')
 
-    def generate_demo_license_ui(self):
-        if not messagebox.askyesno('Demo licentie', f'Maak een demo-licentie voor {TRIAL_DAYS} dagen? (alleen voor testen)'):
-            return
-        content = generate_demo_license(TRIAL_DAYS)
-        ok = write_license_file(content)
-        if ok:
-            self._append_log(f'Demo licentie gemaakt (geldigheid {TRIAL_DAYS} dagen).')
-            messagebox.showinfo('Demo', f'Demo licentie aangemaakt: {LICENSE_FILE}')
-            self.update_license_status()
-        else:
-            messagebox.showerror('Demo', 'Kon demo licentie niet schrijven.')
+def stage_disable(job: DriveJob) -> bool:
+    # the backup's directory entry must be durable before the drive is touched
+    job.executor.sync_dirty_dirs()
+    job.report('Uitschakelen gestart')
+    ok, out = disable_bitlocker(job.drive)
+    log(f'Uitschakel commando uitgevoerd voor {job.drive}. Succes={ok}')
+    if not ok:
+        log(f'Fout tijdens uitschakelen {job.drive}: {out}')
+    return ok
 
-    def backup_selected(self):
-        to_backup = [d for d, v in self.selected.items() if v.get()]
-        if not to_backup:
-            messagebox.showinfo('Backup', 'Selecteer eerst één of meerdere schijven om te backuppen.')
-            return
-        # Ask where to save (optional)
-        target = filedialog.askdirectory(title='Kies map om backups op te slaan (annuleren = default)', initialdir=str(BACKUP_DIR))
-        target_dir = Path(target) if target else BACKUP_DIR
-        self._append_log(f'Backup starten voor: {to_backup} -> map: {target_dir}')
-
-        def do_backup():
-            for d in to_backup:
-                if self.stop_event.is_set():
-                    self._append_log('Backup geannuleerd door gebruiker')
-                    return
-                path = backup_recovery_key(d, target_dir)
-                if path:
-                    self.backup_done[d] = True
-                    self._append_log(f'Backup gelukt: {d} -> {path}')
-                    self.queue.put(('status', (d, 'Backup aanwezig')))
-                else:
-                    self._append_log(f'Backup mislukt voor {d}')
-            self._update_start_state()
 
-        threading.Thread(target=do_backup, daemon=True).start()
+def stage_monitor(job: DriveJob) -> bool:
+    updates = queue.Queue()
 
-    def start_selected(self):
-        to_start = [d for d, v in self.selected.items() if v.get()]
-        if not to_start:
-            messagebox.showinfo('Start', 'Selecteer eerst één of meerdere schijven om uit te schakelen.')
-            return
-        if not self.agree_var.get():
-            messagebox.showwarning('Overeenkomst', 'Je moet akkoord gaan met de risico\'s en backups hebben gemaakt.')
-            return
-        # Ensure backups done for each
-        missing = [d for d in to_start if not self.backup_done.get(d, False)]
-        if missing:
-            messagebox.showwarning('Backup', f'Make backups first for: {missing}')
-            return
+    def callback(drive, vol):
+        updates.put(vol)
 
-        if not messagebox.askyesno('Bevestig', f'Weet je zeker dat je BitLocker wilt uitschakelen voor: {to_start}? Dit decrypt de schijven.'):
-            return
+    def wake():
+        updates.put(False)
 
-        self.stop_event.clear()
-        self.start_btn.configure(state='disabled')
-        self.cancel_btn.configure(state='normal')
-        self._append_log(f'Start uitschakelen voor: {to_start}')
+    job.stop_event.add_listener(wake)
+    job.poller.subscribe(job.drive, callback)
+    misses = 0  # ticks in a row without a percentage for this drive (failed or timed-out status call)
+    try:
+        while not job.stop_event.is_set():
+            try:
+                vol = updates.get(timeout=MONITOR_WATCHDOG)
+            except queue.Empty:
+                if not job.poller.is_running():
+                    log(f'Statuspoller gestopt; monitoren van {job.drive} afgebroken')
+                    return False
+                continue
+            if vol is False:
+                continue
+            if isinstance(vol, Exception):
+                log(f'Status van {job.drive} kan niet meer worden opgevraagd: {vol}')
+                return False
+            pct = vol.percentage if vol is not None else None
+            if pct is None:
+                misses += 1
+                if misses >= POLL_MAX_ERRORS:
+                    log(f'Kan encryptiepercentage niet bepalen voor {job.drive} ({misses}x); bekijk status handmatig')
+                    return False
+                log(f'Geen encryptiepercentage voor {job.drive} ({misses}x); volgende poll opnieuw')
+                continue
+            misses = 0
+            if pct == 0:
+                job.report('Encrypted: 0%')
+                log(f'Decryptie voltooid voor {job.drive}')
+                return True
+            est = job.poller.estimators.get(job.drive)
+            job.report(f'Encrypted: {pct:g}% (nog {format_eta(est.eta() if est else None)})')
+        return False
+    finally:
+        job.poller.unsubscribe(job.drive, callback)
+        job.stop_event.remove_listener(wake)
 
-        def worker():
-            for d in to_start:
-                if self.stop_event.is_set():
-                    self._append_log('Proces geannuleerd door gebruiker')
-                    break
-                self.queue.put(('status', (d, 'Uitschakelen gestart')))
-                ok, out = disable_bitlocker(d)
-                self._append_log(f'Uitschakel commando uitgevoerd voor {d}. Succes={ok}')
-                if not ok:
-                    self._append_log(f'Fout tijdens uitschakelen {d}: {out}')
-                    continue
-                # Monitor progress
-                while not self.stop_event.is_set():
-                    st = get_bitlocker_status(d)
-                    pct = parse_encryption_percentage(st)
-                    if pct is not None:
-                        self.queue.put(('status', (d, f'Encrypted: {pct}%')))
-                        if pct == 0:
-                            self._append_log(f'Decryptie voltooid voor {d}')
-                            break
-                    else:
-                        self._append_log(f'Kan encryptiepercentage niet bepalen voor {d}; bekijk status handmatig')
-                        break
-                    time.sleep(CHECK_INTERVAL)
-            self._append_log('Alle geselecteerde schijven verwerkt of proces gestopt.')
-            self.cancel_btn.configure(state='disabled')
-            self._update_start_state()
-
-        self.task_thread = threading.Thread(target=worker, daemon=True)
-        self.task_thread.start()
-
-    def cancel(self):
-        if messagebox.askyesno('Annuleer', 'Weet je zeker dat je wilt annuleren?'):
-            self.stop_event.set()
-            self._append_log('Annuleerverzoek ingediend...')
-            self.cancel_btn.configure(state='disabled')
-
-    def on_close(self):
-        if self.task_thread and self.task_thread.is_alive():
-            if not messagebox.askyesno('Afsluiten', 'Er loopt een proces. Wil je echt afsluiten (dit annuleert het proces)?'):
-                return
-            self.stop_event.set()
-        self.destroy()
 
-    def show_about(self):
-        info = f"{PRODUCT_NAME} - {COMPANY_NAME}\nVersion: {VERSION}\n\nLicence: see EULA.txt"
-        if messagebox.askyesno('About', info + '\n\nBekijk EULA?'):
+BACKUP_STAGES = [('backup', stage_backup), ('verify', stage_verify)]
+DISABLE_STAGES = [('disable', stage_disable), ('monitor', stage_monitor)]
+FULL_STAGES = BACKUP_STAGES + DISABLE_STAGES
+
+
+class JobExecutor:
+    """Runs DriveJobs concurrently, at most max_parallel drives at a time.
+
+    Stages of one drive always run in order; a failed stage stops that drive's chain only.
+    on_event(drive, stage, state, seconds) is called with state 'start', 'done' or 'failed'.
+    """
+
+    def __init__(self, max_parallel: int = MAX_PARALLEL_JOBS, stop_event: CancelEvent | None = None,
+                 on_status=None, on_event=None, poller: StatusPoller | None = None):
+        self.max_parallel = max(1, int(max_parallel))
+        self.stop_event = stop_event or CancelEvent()
+        self.poller = poller or StatusPoller()
+        self._dirty_dirs = set()  # backup folders with renames not yet synced
+        self._dirty_lock = threading.Lock()
+        self.on_status = on_status
+        self.on_event = on_event
+
+    def _emit(self, drive: str, stage: str, state: str, seconds: float | None = None) -> None:
+        if self.on_event:
+            try:
+                self.on_event(drive, stage, state, seconds)
+            except Exception as e:
+                log(f"Fout in job event handler: {e}")
+
+    def mark_dirty(self, directory: Path) -> None:
+        with self._dirty_lock:
+            self._dirty_dirs.add(directory)
+
+    def sync_dirty_dirs(self) -> None:
+        """One directory fsync per backup folder for all backups written since the last sync.
+
+        The lock is held until the fsyncs are done: a job that calls this right before disabling must not
+        see an empty set while another job is still syncing its folder.
+        """
+        with self._dirty_lock:
+            for d in list(self._dirty_dirs):
+                sync_directory(d)
+                self._dirty_dirs.discard(d)
+
+    def _run_job(self, job: DriveJob) -> DriveJob:
+        job.stop_event = self.stop_event
+        job.on_status = self.on_status
+        job.poller = self.poller
+        job.executor = self
+        for name, func in job.stages:
+            if self.stop_event.is_set():
+                job.failed_stage = name
+                break
+            self._emit(job.drive, name, 'start')
+            t0 = time.perf_counter()
             try:
-                subprocess.Popen(['notepad.exe', str(Path(__file__).with_name('EULA.txt'))])
+                with cancel_scope(self.stop_event), profile_phase(f'{name}-{_drive_token(job.drive)}'):
+                    # cancelling kills the stage's running command
+                    ok = func(job)
             except Exception as e:
-                messagebox.showerror('Fout', f'Kan EULA niet openen: {e}')
+                log(f"Stage {name} voor {job.drive} gaf een fout: {e}")
+                ok = False
+            elapsed = time.perf_counter() - t0
+            job.timings[name] = elapsed
+            metrics.observe('bit_stage_seconds', elapsed, stage=name)
+            if not ok:
+                job.failed_stage = name
+                self._emit(job.drive, name, 'failed', elapsed)
+                break
+            self._emit(job.drive, name, 'done', elapsed)
+        return job
+
+    def run(self, jobs: list[DriveJob]) -> list[DriveJob]:
+        if not jobs:
+            return []
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(jobs)), thread_name_prefix='drivejob') as pool:
+            futures = [pool.submit(self._run_job, j) for j in jobs]
+            try:
+                for f in as_completed(futures):
+                    f.result()
+            except BaseException:
+                # let the remaining stages see the cancel before the pool waits for them
+                self.stop_event.set()
+                raise
+            finally:
+                self.sync_dirty_dirs()
+        return jobs
+
+
+def format_job_timings(job: DriveJob) -> str:
+    parts = [f"{name}={job.timings[name]:.1f}s" for name, _ in job.stages if name in job.timings]
+    return f"{job.drive} " + ', '.join(parts)
+
+
+# ---------- Inventory snapshot ----------
+
+def make_backup_entry(path: Path, volume: VolumeStatus | None, bundled: bool = False) -> dict:
+    """Describe a verified backup so a later session can check it is still the same file."""
+    return {
+        'path': str(path),
+        'sha256': hashlib.sha256(path.read_bytes()).hexdigest(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'protectors': list(volume.protectors) if volume is not None else None,
+        'bundle': bundled,
+    }
+
+
+def backup_still_valid(entry: dict | None, volume: VolumeStatus | None) -> bool:
+    """True if the recorded backup file is unchanged, still verifies, and the drive's protectors
+    are the ones that were backed up."""
+    if not entry:
+        return False
+    path = Path(entry.get('path', ''))
+    try:
+        if hashlib.sha256(path.read_bytes()).hexdigest() != entry.get('sha256'):
+            return False
+    except OSError:
+        return False
+    if volume is not None and entry.get('protectors') is not None and sorted(volume.protectors) != sorted(entry['protectors']):
+        return False
+    if entry.get('bundle'):
+        # contents were verified when the bundle was written; reading them again needs the passphrase
+        return True
+    return verify_backup_file(path, volume)
 
-    def _show_text_file(self, title: str, file_path: Path) -> None:
-        if not file_path.exists():
-            messagebox.showerror(title, f'Bestand niet gevonden: {file_path}')
-            return
+
+def save_inventory(volumes: dict, backups: dict) -> bool:
+    """Write drive -> VolumeStatus and drive -> backup entry to INVENTORY_FILE (atomically)."""
+    data = {
+        'saved': datetime.now().isoformat(timespec='seconds'),
+        'volumes': {d: v.to_dict() for d, v in volumes.items()},
+        'backups': backups,
+    }
+    try:
+        write_file_atomic(INVENTORY_FILE, json.dumps(data, indent=1))
+        return True
+    except Exception as e:
+        log(f"Fout bij opslaan inventaris: {e}")
+        return False
+
+
+def load_inventory() -> dict | None:
+    """Return {'saved': datetime, 'volumes': {drive: VolumeStatus}, 'backups': {drive: entry}} or None."""
+    if not INVENTORY_FILE.exists():
+        return None
+    try:
+        data = json.loads(INVENTORY_FILE.read_text(encoding='utf-8'))
+        return {
+            'saved': datetime.fromisoformat(data['saved']),
+            'volumes': {d: VolumeStatus.from_dict(v) for d, v in data.get('volumes', {}).items()},
+            'backups': dict(data.get('backups', {})),
+        }
+    except Exception as e:
+        log(f"Fout bij lezen inventaris: {e}")
+        return None
+
+
+# ---------- Benchmarks ----------
+
+BENCH_BASELINE_FILE = Path(__file__).with_suffix('.bench.json')
+BENCH_TOLERANCE = 1.5  # fail when slower than baseline * tolerance
+BENCH_SIZES = (1, 10, 100, 1000, 2000)
+
+_SYNTHETIC_HEADER = (
+    "BitLocker Drive Encryption: Configuration Tool version 10.0.19041\n"
+    "Copyright (C) 2013 Microsoft Corporation. All rights reserved.\n\n"
+    "Disk volumes that can be protected with\nBitLocker Drive Encryption:\n"
+)
+
+
+def _drive_name(i: int) -> str:
+    # C: .. Z: first; beyond that, volumes without a letter show up by GUID path (mounted VHDX etc.)
+    if i < 24:
+        return chr(ord('C') + i) + ':'
+    return f"\\\\?\\Volume{{{i:08x}-0000-4000-8000-{i:012x}}}\\"
+
+
+def synthetic_status_output(volumes: int) -> str:
+    """Build a realistic `manage-bde -status` listing with the given number of volumes."""
+    kinds = [
+        ("[OS]\n[OS Volume]", "Fully Encrypted", "100.0%", "Protection On", ["TPM", "Numerical Password"]),
+        ("[Data]\n[Data Volume]", "Decryption in Progress", "47.3%", "Protection Off", ["Numerical Password"]),
+        ("[Backup]\n[Data Volume]", "Fully Decrypted", "0.0%", "Protection Off", []),
+        ("[VHDX]\n[Data Volume]", "Encryption in Progress", "12.8%", "Protection Off", ["Numerical Password", "External Key"]),
+    ]
+    parts = [_SYNTHETIC_HEADER]
+    for i in range(volumes):
+        label, conv, pct, prot, protectors = kinds[i % len(kinds)]
+        parts.append(
+            f"Volume {_drive_name(i)} {label}\n\n"
+            f"    Size:                 {100 + i % 900}.{i % 100:02d} GB\n"
+            "    BitLocker Version:    2.0\n"
+            f"    Conversion Status:    {conv}\n"
+            f"    Percentage Encrypted: {pct}\n"
+            "    Encryption Method:    XTS-AES 128\n"
+            f"    Protection Status:    {prot}\n"
+            "    Lock Status:          Unlocked\n"
+            "    Identification Field: Unknown\n"
+        )
+        if protectors:
+            parts.append("    Key Protectors:\n" + ''.join(f"        {p}\n" for p in protectors) + "\n")
+        else:
+            parts.append("    Key Protectors:       None Found\n\n")
+    return ''.join(parts)
+
+
+def _bench(func, arg, repeat: int) -> tuple[float, int]:
+    """Best-of-repeat wall time in seconds and peak traced memory in bytes for func(arg)."""
+    import tracemalloc
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    func(arg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def _check_against_baseline(name: str, results: dict, argv: list[str]) -> list[str]:
+    """Compare {case: seconds} with the stored baseline, or store it with --record-baseline.
+
+    The baseline is Bit.bench.json next to the script unless --baseline <file> is given. Returns
+    regression messages.
+    """
+    path = BENCH_BASELINE_FILE
+    if '--baseline' in argv:
+        try:
+            path = Path(argv[argv.index('--baseline') + 1])
+        except IndexError:
+            return ['--baseline zonder bestand']
+    baseline = {}
+    if path.exists():
         try:
-            txt = file_path.read_text(encoding='utf-8')
+            baseline = json.loads(path.read_text(encoding='utf-8'))
         except Exception as e:
-            messagebox.showerror(title, f'Kan bestand niet openen: {e}')
-            return
-        win = tk.Toplevel(self)
-        win.title(title)
-        win.geometry('700x500')
-        frm = ttk.Frame(win, padding=8)
-        frm.pack(fill='both', expand=True)
-        text = tk.Text(frm, wrap='word')
-        text.insert('1.0', txt)
-        text.configure(state='disabled')
-        text.pack(fill='both', expand=True, side='left')
-        sb = ttk.Scrollbar(frm, orient='vertical', command=text.yview)
-        sb.pack(side='right', fill='y')
-        text['yscrollcommand'] = sb.set
-        btn_frame = ttk.Frame(win)
-        btn_frame.pack(fill='x')
-        ttk.Button(btn_frame, text='Open in Notepad', command=lambda: subprocess.Popen(['notepad.exe', str(file_path)])).pack(side='left', padx=4)
-        ttk.Button(btn_frame, text='Close', command=win.destroy).pack(side='right', padx=4)
-
-    def show_eula(self):
-        self._show_text_file('EULA', Path(__file__).with_name('EULA.txt'))
-
-    def show_terms(self):
-        self._show_text_file('Terms of Service', Path(__file__).with_name('TERMS.txt'))
-
-    def show_readme(self):
-        self._show_text_file('README', Path(__file__).with_name('README.md'))
+            return [f'baseline {path} niet leesbaar: {e}']
+    if '--record-baseline' in argv:
+        baseline[name] = results
+        path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+        print(f'Baseline opgeslagen in {path}')
+        return []
+    if name not in baseline:
+        print(f'Geen baseline voor {name} in {path}; alleen gemeten, niet vergeleken')
+    failures = []
+    for case, secs in results.items():
+        ref = baseline.get(name, {}).get(case)
+        if ref and secs > ref * BENCH_TOLERANCE:
+            failures.append(f'{name}/{case}: {secs * 1000:.2f} ms > {ref * 1000:.2f} ms x {BENCH_TOLERANCE}')
+    return failures
+
+
+def run_parser_benchmark(argv: list[str]) -> int:
+    """Benchmark the status parsers on synthetic listings and optional recorded outputs (*.txt in --corpus)."""
+    corpus = {f'synthetic-{n}': synthetic_status_output(n) for n in BENCH_SIZES}
+    if '--corpus' in argv:
+        try:
+            corpus_dir = Path(argv[argv.index('--corpus') + 1])
+        except IndexError:
+            print('Usage: --bench-parser [--corpus <map>] [--record-baseline] [--baseline <bestand>]')
+            return 2
+        for f in sorted(corpus_dir.glob('*.txt')):
+            corpus[f'recorded-{f.stem}'] = f.read_text(encoding='utf-8', errors='replace')
+
+    funcs = {
+        'parse_volume_status': parse_volume_status,
+        'bitlocker_filter': lambda out: [v for v in parse_volume_status(out).values() if v.bitlocker_configured],
+        'parse_encryption_percentage': parse_encryption_percentage,
+    }
+    results = {}
+    per_volume = {}
+    print(f"{'case':<46}{'volumes':>8}{'ms':>10}{'peak KiB':>10}")
+    for case, out in corpus.items():
+        volumes = len(parse_volume_status(out))
+        repeat = max(3, min(200, 20000 // max(1, volumes)))
+        for fname, func in funcs.items():
+            secs, peak = _bench(func, out, repeat)
+            key = f'{fname}/{case}'
+            results[key] = secs
+            if fname == 'parse_volume_status' and case.startswith('synthetic-') and volumes:
+                per_volume[volumes] = secs / volumes
+            print(f"{key:<46}{volumes:>8}{secs * 1000:>10.3f}{peak / 1024:>10.1f}")
+
+    failures = _check_against_baseline('parser', results, argv)
+    # machine independent guard: per-volume cost must stay roughly flat as the listing grows
+    if len(per_volume) >= 2:
+        sizes = sorted(per_volume)
+        small = per_volume[sizes[1] if len(sizes) > 2 else sizes[0]]
+        large = per_volume[sizes[-1]]
+        if large > small * 3:
+            failures.append(f'parse_volume_status schaalt niet lineair: {small * 1e6:.1f} us/volume -> {large * 1e6:.1f} us/volume')
+    for f in failures:
+        print('REGRESSIE: ' + f)
+    return 1 if failures else 0
+
+
+LICENSE_BENCH_COUNT = 20000
+
+
+def run_license_benchmark(argv: list[str]) -> int:
+    """Licenses per second for generate_license and license_expiry, and repeated load_license calls (served from the mtime cache)."""
+    count = LICENSE_BENCH_COUNT
+    expiry = datetime.now() + timedelta(days=365)
+    licenses = [generate_license(expiry, f'bench{i}') for i in range(count)]
+    cases = {
+        'generate': lambda n: [generate_license(expiry, f'bench{i}') for i in range(n)],
+        'verify': lambda n: [license_expiry(lic) for lic in licenses[:n]],
+        'verify-invalid': lambda n: [license_expiry('0' * 64 + lic[64:]) for lic in licenses[:n]],
+        'load_license': lambda n: [load_license() for _ in range(n)],
+    }
+    results = {}
+    print(f"{'case':<24}{'n':>8}{'ms':>10}{'per sec':>12}")
+    for case, func in cases.items():
+        secs, _ = _bench(func, count, 3)
+        results[case] = secs
+        print(f"{case:<24}{count:>8}{secs * 1000:>10.1f}{count / secs:>12,.0f}")
+    failures = _check_against_baseline('license', results, argv)
+    for f in failures:
+        print('REGRESSIE: ' + f)
+    return 1 if failures else 0
+
+
+CIPHER_BENCH_MB = 16
+
+
+def run_cipher_benchmark(argv: list[str]) -> int:
+    """MB/s of encrypt_stream/decrypt_stream per available backend, plus legacy XOR decryption."""
+    import io
+    size = CIPHER_BENCH_MB << 20
+    data = os.urandom(size)
+    results = {}
+    print(f"{'case':<28}{'MB':>6}{'ms':>10}{'MB/s':>10}")
+
+    def report(case, secs):
+        results[case] = secs
+        print(f"{case:<28}{CIPHER_BENCH_MB:>6}{secs * 1000:>10.1f}{CIPHER_BENCH_MB / secs:>10.1f}")
+
+    for name, cls in CIPHER_BACKENDS.items():
+        if not cls.available():
+            print(f'{name:<28}niet beschikbaar')
+            continue
+        cipher = cls(os.urandom(32))
+        if not cls.can_encrypt:
+            report(f'{name}/decrypt', _bench(cipher.decrypt, data, 3)[0])
+            continue
+        sealed = io.BytesIO()
+        cipher.encrypt_stream(io.BytesIO(data), sealed)
+        report(f'{name}/encrypt_stream', _bench(lambda d: cipher.encrypt_stream(io.BytesIO(d), io.BytesIO()), data, 3)[0])
+        report(f'{name}/decrypt_stream', _bench(lambda b: cipher.decrypt_stream(io.BytesIO(b), io.BytesIO()), sealed.getvalue(), 3)[0])
+    failures = _check_against_baseline('cipher', results, argv)
+    for f in failures:
+        print('REGRESSIE: ' + f)
+    return 1 if failures else 0
+
+
+POWERSHELL_BENCH_CALLS = 20
+
+
+def run_powershell_benchmark(argv: list[str]) -> int:
+    """Per-call latency of a fresh process per command versus the persistent worker.
+    Uses the Python stand-in with --stand-in or when PowerShell is not available."""
+    stand_in = '--stand-in' in argv or not is_windows()
+    if stand_in:
+        worker = PowerShellWorker(stand_in_worker_argv())
+        cold = [sys.executable, '-c', 'print("x")']
+    else:
+        worker = PowerShellWorker()
+        cold = ["powershell", "-NoProfile", "-Command", "Get-Date | Out-String"]
+    n = POWERSHELL_BENCH_CALLS
+    results = {}
+    print(f"{'case':<28}{'calls':>6}{'ms/call':>10}")
+    t0 = time.perf_counter()
+    for _ in range(n):
+        run_cmd(cold)
+    results['process-per-call'] = (time.perf_counter() - t0) / n
+    t0 = time.perf_counter()
+    rc, out = worker.run('Get-Date')
+    results['worker-first-call'] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(n):
+        worker.run('Get-Date')
+    results['worker-per-call'] = (time.perf_counter() - t0) / n
+    worker.close()
+    for case, secs in results.items():
+        print(f"{case:<28}{1 if case == 'worker-first-call' else n:>6}{secs * 1000:>10.2f}")
+    failures = [] if rc == 0 else [f'worker gaf rc={rc}: {out.strip()}']
+    failures += _check_against_baseline('powershell-stand-in' if stand_in else 'powershell', results, argv)
+    for f in failures:
+        print('REGRESSIE: ' + f)
+    return 1 if failures else 0
+
+
+STARTUP_FORBIDDEN_MODULES = ('tkinter', 'PIL', 'win32crypt', 'subprocess', 'concurrent.futures')
+STARTUP_COMMANDS = {
+    'demo-license': ['--demo-license'],
+    'set-dev-code': ['--set-dev-code', 'bench-code', '--hide'],
+    'clear-dev': ['--clear-dev'],
+    'disable-help': ['disable', '--help'],
+    'license-help': ['license', '--help'],
+}
+STARTUP_WINDOWS_ONLY = ('demo-license', 'set-dev-code', 'clear-dev')  # stop at the Windows check elsewhere
+
+
+def run_startup_benchmark(argv: list[str]) -> int:
+    """Measure import time and time-to-exit of the CLI commands in fresh interpreters.
+
+    Runs against a copy of this script in a temporary folder, so license and dev files of the real
+    installation are never touched. Also fails when a headless import pulls in GUI/DPAPI modules.
+    """
+    import subprocess
+    import tempfile
+    import shutil
+    repeat = 5
+    results = {}
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / APP_SCRIPT.name
+        shutil.copy2(APP_SCRIPT, script)
+        probe = ("import sys, time, json; t = time.perf_counter(); import Bit; dt = time.perf_counter() - t; "
+                 f"print(json.dumps([dt, [m for m in {STARTUP_FORBIDDEN_MODULES!r} if m in sys.modules]]))")
+        best = float('inf')
+        for _ in range(repeat):
+            p = subprocess.run([sys.executable, '-c', probe], cwd=tmp, capture_output=True, text=True)
+            if p.returncode != 0:
+                print(p.stderr)
+                return 1
+            dt, loaded = json.loads(p.stdout.strip().splitlines()[-1])
+            best = min(best, dt)
+        results['import'] = best
+        if loaded:
+            failures.append(f'import Bit laadt onnodig: {loaded}')
+        for name, args in STARTUP_COMMANDS.items():
+            if name in STARTUP_WINDOWS_ONLY and not is_windows():
+                print(f'exit/{name}: overgeslagen, alleen op Windows')
+                continue
+            best = float('inf')
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                p = subprocess.run([sys.executable, str(script), *args], cwd=tmp, capture_output=True, text=True)
+                best = min(best, time.perf_counter() - t0)
+                if p.returncode != 0:
+                    failures.append(f'{name} gaf rc={p.returncode}: {(p.stderr or p.stdout).strip()[-200:]}')
+                    break
+            else:
+                results[f'exit/{name}'] = best
+    for case, secs in results.items():
+        print(f'{case:<28}{secs * 1000:>10.1f} ms')
+    failures += _check_against_baseline('startup', results, argv)
+    for f in failures:
+        print('REGRESSIE: ' + f)
+    return 1 if failures else 0
 
 
 # ---------- Main ----------
 
+# Exit codes of the headless commands, for deployment tooling
+EXIT_OK = 0
+EXIT_FAILED = 1  # one or more drives did not finish all stages
+EXIT_USAGE = 2
+EXIT_NOT_ADMIN = 3
+EXIT_NOT_CONFIRMED = 4
+EXIT_NO_VOLUME = 5
+EXIT_UNSUPPORTED = 6  # not running on Windows
+EXIT_UNLICENSED = 7
+EXIT_CANCELLED = 130
+
+
+class JsonEventWriter:
+    """Writes one JSON object per line to stdout; safe to call from job threads."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields) -> None:
+        fields = {'event': event, 'ts': datetime.now().isoformat(timespec='seconds'), **fields}
+        line = json.dumps(fields, default=str)
+        with self._lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+
+
+_RE_DRIVE_ARG = re.compile(r"[A-Z]:|\\\\\?\\Volume\{[0-9A-Fa-f-]+\}\\")
+
+
+def run_disable_cli(argv: list[str]) -> int:
+    """Headless: backup -> verify -> disable -> monitor for the given drives. Returns an EXIT_* code."""
+    import argparse
+    parser = argparse.ArgumentParser(prog='Bit.py disable', description='Back up recovery keys and disable BitLocker without the GUI.')
+    parser.add_argument('drives', nargs='*', help='drive letters (e.g. C: D:) or \\\\?\\Volume{GUID}\\ paths')
+    parser.add_argument('--all', action='store_true', help='every volume with BitLocker configured')
+    parser.add_argument('--backup-dir', type=Path, default=BACKUP_DIR)
+    parser.add_argument('--max-parallel', type=int, default=MAX_PARALLEL_JOBS)
+    parser.add_argument('--yes-i-have-backups', action='store_true',
+                        help='acknowledge the risks without an interactive prompt (required when stdin is not a terminal)')
+    parser.add_argument('--json', action='store_true', help='stream JSON-lines progress events to stdout')
+    args = parser.parse_args(argv)  # exits with EXIT_USAGE on bad arguments
+
+    events = JsonEventWriter() if args.json else None
+    if events:
+        # keep stdout machine-readable; log lines still go to Bit.log (main() already did this for sys.argv)
+        _log_writer.echo = False
+
+    def fail(code: int, message: str) -> int:
+        if events:
+            events.emit('error', code=code, message=message)
+        else:
+            print(message)
+        return code
+
+    drives = [d.upper() if len(d) == 2 else d for d in args.drives]
+    bad = [d for d in drives if not _RE_DRIVE_ARG.fullmatch(d)]
+    if bad:
+        return fail(EXIT_USAGE, f'Ongeldige schijfletter(s): {bad}')
+    if bool(drives) == args.all:
+        return fail(EXIT_USAGE, 'Geef schijven op of gebruik --all (niet allebei).')
+    if _backend.needs_windows and not is_windows():
+        return fail(EXIT_UNSUPPORTED, 'Dit script is alleen voor Windows.')
+    if not has_backend_privileges():
+        return fail(EXIT_NOT_ADMIN, 'Dit commando vereist Administrator-rechten.')
+    rec = load_dev_record()
+    if _backend.needs_license and not load_license() and not (rec and rec.get('persist_state')):
+        return fail(EXIT_UNLICENSED, 'Geen geldige licentie gevonden (of activeer Dev Mode met --persist-state).')
+    try:
+        volumes = get_drives_with_bitlocker()
+    except DetectionError as e:
+        return fail(EXIT_FAILED, f'Schijfdetectie mislukt: {e}')
+    if args.all:
+        drives = list(volumes)
+        if not drives:
+            return fail(EXIT_NO_VOLUME, 'Geen BitLocker-volumes gevonden.')
+    unknown = [d for d in drives if d not in volumes]
+    if unknown:
+        return fail(EXIT_NO_VOLUME, f'Geen BitLocker-volume gevonden voor: {unknown}')
+    if not args.yes_i_have_backups:
+        if not sys.stdin or not sys.stdin.isatty():
+            return fail(EXIT_NOT_CONFIRMED, 'Geen terminal voor bevestiging; gebruik --yes-i-have-backups.')
+        answer = input(f'BitLocker uitschakelen voor {drives}? Backups gaan naar {args.backup_dir}. Typ JA om door te gaan: ')
+        if answer.strip() != 'JA':
+            return fail(EXIT_NOT_CONFIRMED, 'Afgebroken.')
+
+    def on_status(drive, text):
+        if events:
+            events.emit('status', drive=drive, text=text)
+        else:
+            log(f'{drive}: {text}')
+
+    def on_event(drive, stage, state, seconds):
+        if events:
+            events.emit('stage', drive=drive, stage=stage, state=state,
+                        seconds=None if seconds is None else round(seconds, 3))
+        elif seconds is None:
+            log(f'{drive}: {stage} gestart')
+        else:
+            log(f'{drive}: {stage} {state} ({seconds:.1f}s)')
+
+    stop_event = CancelEvent()
+    executor = JobExecutor(args.max_parallel, stop_event, on_status=on_status, on_event=on_event)
+    jobs = [DriveJob(d, FULL_STAGES, args.backup_dir, volumes[d]) for d in drives]
+    if events:
+        events.emit('start', drives=drives, backup_dir=str(args.backup_dir), max_parallel=executor.max_parallel)
+    try:
+        executor.run(jobs)
+    except KeyboardInterrupt:
+        stop_event.set()
+    for job in jobs:
+        if events:
+            events.emit('result', drive=job.drive, ok=job.ok, failed_stage=job.failed_stage,
+                        backup=job.backup_path, timings={k: round(v, 3) for k, v in job.timings.items()})
+        else:
+            log('Tijden ' + format_job_timings(job))
+    if stop_event.is_set():
+        code = EXIT_CANCELLED
+    else:
+        code = EXIT_OK if all(job.ok for job in jobs) else EXIT_FAILED
+    if events:
+        events.emit('done', exit_code=code)
+    elif code == EXIT_CANCELLED:
+        print('Geannuleerd.')
+    return code
+
+
+def run_bundle_cli(argv: list[str]) -> int:
+    """List or extract entries of a backup bundle. Returns an EXIT_* code."""
+    import argparse
+    parser = argparse.ArgumentParser(prog='Bit.py bundle', description='Inspect backup bundles written in bundle mode.')
+    sub = parser.add_subparsers(dest='action', required=True)
+    p_list = sub.add_parser('list', help='show the entries of a bundle')
+    p_list.add_argument('bundle', type=Path)
+    p_extract = sub.add_parser('extract', help='write entries to recovery_<drive>.txt files')
+    p_extract.add_argument('bundle', type=Path)
+    p_extract.add_argument('names', nargs='*', help='entries to extract, e.g. C: (default: all)')
+    p_extract.add_argument('--out', type=Path, default=Path('.'), help='target folder (default: current folder)')
+    args = parser.parse_args(argv)
+
+    passphrase = os.environ.get(BUNDLE_PASSPHRASE_ENV)
+    if passphrase is None:
+        import getpass
+        passphrase = getpass.getpass(f'Wachtwoord voor {args.bundle}: ')
+    try:
+        with BundleReader(args.bundle, passphrase) as reader:
+            if args.action == 'list':
+                print(f'{args.bundle} (aangemaakt {reader.created})')
+                for e in reader.entries.values():
+                    print(f"  {e['name']:<12} {e['size']:>8} bytes  ({e['length']} gecomprimeerd)")
+                return EXIT_OK
+            names = args.names or reader.names()
+            missing = [n for n in names if n not in reader.entries]
+            if missing:
+                print(f'Niet in bundel: {missing}')
+                return EXIT_USAGE
+            args.out.mkdir(parents=True, exist_ok=True)
+            for name in names:
+                outp = args.out / f'recovery_{_drive_token(name)}.txt'
+                write_file_atomic(outp, reader.read(name).decode('utf-8'))
+                print(f'{name} -> {outp}')
+            sync_directory(args.out)
+            return EXIT_OK
+    except (BundleError, OSError) as e:
+        print(e)
+        return EXIT_FAILED
+
+
+_RE_LICENSE_ID = re.compile(r'[\w.@+-]+')
+
+
+def _open_input(name: str):
+    return sys.stdin if name == '-' else open(name, encoding='utf-8')
+
+
+def run_license_cli(argv: list[str]) -> int:
+    """Vendor side: generate or verify licenses in bulk, one per input line, streaming to stdout."""
+    import argparse
+    parser = argparse.ArgumentParser(prog='Bit.py license', description='Generate or verify licenses in bulk.')
+    sub = parser.add_subparsers(dest='action', required=True)
+    p_gen = sub.add_parser('generate', help='input lines: <id> [days | ISO expiry]; output: <id><TAB><license>')
+    p_gen.add_argument('input', nargs='?', default='-', help='file, or - for stdin (default)')
+    p_gen.add_argument('--days', type=int, default=365, help='validity when a line gives no expiry (default 365)')
+    p_ver = sub.add_parser('verify', help='input lines: <license> or <id><TAB><license>; output: <status><TAB><expiry><TAB><id>')
+    p_ver.add_argument('input', nargs='?', default='-', help='file, or - for stdin (default)')
+    p_ver.add_argument('--json', action='store_true', help='one JSON object per line instead of tab-separated output')
+    args = parser.parse_args(argv)
+
+    out = sys.stdout
+    now = datetime.now()
+    counts = {}
+    try:
+        src = _open_input(args.input)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return EXIT_USAGE
+    with src:
+        for lineno, line in enumerate(src, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if args.action == 'generate':
+                parts = line.split()
+                try:
+                    if len(parts) > 2 or not _RE_LICENSE_ID.fullmatch(parts[0]):
+                        raise ValueError('verwacht: <id> [dagen | ISO datum]')
+                    when = parts[1] if len(parts) > 1 else str(args.days)
+                    expiry = now + timedelta(days=int(when)) if when.isdigit() else datetime.fromisoformat(when)
+                    if expiry.tzinfo is not None:
+                        raise ValueError(f'{when}: geef de datum zonder tijdzone (lokale tijd)')
+                except ValueError as e:
+                    print(f'regel {lineno}: {e}', file=sys.stderr)
+                    counts['error'] = counts.get('error', 0) + 1
+                    continue
+                out.write(f'{parts[0]}\t{generate_license(expiry, parts[0])}\n')
+                counts['generated'] = counts.get('generated', 0) + 1
+            else:
+                license_id, _, content = line.rpartition('\t')
+                expiry = license_expiry(content)
+                status = 'invalid' if expiry is None else ('valid' if expiry >= now else 'expired')
+                counts[status] = counts.get(status, 0) + 1
+                label = license_id or str(lineno)
+                if args.json:
+                    out.write(json.dumps({'id': label, 'status': status,
+                                          'expiry': expiry.isoformat() if expiry else None}) + '\n')
+                else:
+                    out.write(f"{status}\t{expiry.isoformat() if expiry else '-'}\t{label}\n")
+    out.flush()
+    print(', '.join(f'{k}={v}' for k, v in sorted(counts.items())) or 'geen regels', file=sys.stderr)
+    return EXIT_OK if set(counts) <= {'generated', 'valid'} else EXIT_FAILED
+
+
+def _pop_option(name: str, default: str | None = None) -> str | None:
+    """Remove `name VALUE` from sys.argv and return VALUE, or default when the option is absent."""
+    if name not in sys.argv:
+        return default
+    i = sys.argv.index(name)
+    value = sys.argv[i + 1] if i + 1 < len(sys.argv) else ''
+    del sys.argv[i:i + 2]
+    return value
+
+
 def main():
-    if not is_windows():
+    # --json output must stay machine-readable from the first log line on (backend, profiling, ...)
+    if '--json' in sys.argv:
+        _log_writer.echo = False
+
+    # Volume backend: --backend SPEC or BIT_BACKEND (e.g. sim:volumes=500 to load test without BitLocker)
+    spec = _pop_option('--backend', os.environ.get(BACKEND_ENV))
+    if spec:
+        try:
+            set_backend(make_backend(spec))
+        except ValueError as e:
+            print(f'Ongeldige backend: {e}')
+            sys.exit(EXIT_USAGE)
+
+    # Profiling: cProfile + tracemalloc reports per phase in diagnostics/ (--profile or BIT_PROFILE=1)
+    if '--profile' in sys.argv or os.environ.get(PROFILE_ENV, '') not in ('', '0'):
+        if '--profile' in sys.argv:
+            sys.argv.remove('--profile')
+        enable_profiling()
+
+    # Metrics export for node_exporter's textfile collector: --metrics-dir DIR or BIT_METRICS_DIR
+    metrics_dir = _pop_option('--metrics-dir', os.environ.get(METRICS_DIR_ENV))
+    if metrics_dir:
+        start_metrics_export(Path(metrics_dir))
+
+    # Replay a recorded session: --replay FILE [--speed N] [--budget "manage-bde -status=0.5" ...]
+    replay = _pop_option('--replay')
+    if replay:
+        try:
+            speed = float(_pop_option('--speed', '1'))
+            budgets = {}
+            while '--budget' in sys.argv:
+                op, _, secs = _pop_option('--budget').rpartition('=')
+                budgets[op.strip()] = float(secs)
+        except ValueError as e:
+            print(f'Ongeldige --speed/--budget: {e}')
+            sys.exit(EXIT_USAGE)
+        sys.exit(run_replay(Path(replay), speed, budgets, _dispatch))
+
+    # Record every manage-bde / PowerShell call of this session: --record FILE or BIT_RECORD
+    record = _pop_option('--record', os.environ.get(RECORD_ENV))
+    if not record:
+        _dispatch()
+        return
+    recorder = start_recording(Path(record), sys.argv[1:])
+    code = EXIT_OK
+    try:
+        _dispatch()
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (EXIT_OK if e.code is None else EXIT_FAILED)
+        raise
+    finally:
+        recorder.close(code)
+
+
+def _dispatch():
+    # Benchmarks run anywhere (no manage-bde needed)
+    if '--bench-parser' in sys.argv:
+        sys.exit(run_parser_benchmark(sys.argv))
+    if '--bench-startup' in sys.argv:
+        sys.exit(run_startup_benchmark(sys.argv))
+    if '--bench-license' in sys.argv:
+        sys.exit(run_license_benchmark(sys.argv))
+    if '--bench-cipher' in sys.argv:
+        sys.exit(run_cipher_benchmark(sys.argv))
+    if '--bench-powershell' in sys.argv:
+        sys.exit(run_powershell_benchmark(sys.argv))
+
+    # CLI: headless backup/disable/monitor pipeline (reports its own exit codes, also off Windows)
+    if len(sys.argv) > 1 and sys.argv[1] == 'disable':
+        sys.exit(run_disable_cli(sys.argv[2:]))
+    # CLI: list/extract backup bundles (works on any machine holding the passphrase)
+    if len(sys.argv) > 1 and sys.argv[1] == 'bundle':
+        sys.exit(run_bundle_cli(sys.argv[2:]))
+    # CLI: bulk license generation/verification for the vendor side
+    if len(sys.argv) > 1 and sys.argv[1] == 'license':
+        sys.exit(run_license_cli(sys.argv[2:]))
+
+    if _backend.needs_windows and not is_windows():
         print('Dit script is alleen voor Windows.')
         sys.exit(1)
 
@@ -1170,8 +3450,13 @@ def main():
             print('Kon dev code niet verwijderen')
             sys.exit(1)
 
+    # The GUI lives in bit_gui so headless commands never import tkinter. Register this module under
+    # its import name first, otherwise running `python Bit.py` would load a second copy for bit_gui.
+    sys.modules.setdefault('Bit', sys.modules[__name__])
+    with profile_phase('import_gui'):
+        from bit_gui import BitLockerApp
     app = BitLockerApp()
-    if not is_admin():
+    if not has_backend_privileges():
         app._append_log('LET OP: script draait niet als Administrator; sommige acties zijn uitgeschakeld. Gebruik "Relaunch as Admin" om te verhogen.')
     app.mainloop()
 
@@ -0,0 +1,1147 @@
+"""Tk GUI for Bit.py. Imported only when the GUI starts, so headless commands never load tkinter."""
+
+import ctypes
+import subprocess
+import sys
+import threading
+import base64
+import hashlib
+import os
+import secrets
+import shutil
+import tempfile
+from pathlib import Path
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk, messagebox, filedialog, simpledialog
+
+from Bit import (
+    APP_ID, APP_SCRIPT, COMPANY_NAME, ICON_PNG_B64, LAUNCH_ARGV, LICENSE_FILE, LOGO_PNG_B64_DARK,
+    LOGO_PNG_B64_LIGHT, LOG_PANE_MAX_LINES, LOG_PANE_TRIM_CHUNK, MAX_PARALLEL_JOBS, PRODUCT_NAME,
+    TRIAL_DAYS, VERSION,
+    BACKUP_STAGES, DISABLE_STAGES, CancelEvent, DriveJob, JobExecutor, format_job_timings,
+    decrypt_dev_code, clear_dev_record, load_dev_record, save_dev_record, verify_dev_code,
+    generate_demo_license, load_license, validate_license_content, write_license_file,
+    DriveDetector, has_backend_privileges, is_admin, is_windows, log,
+    backup_still_valid, load_inventory, make_backup_entry, save_inventory,
+    BundleError, BundleReader, BundleWriter, bundle_path_for_session, bundles_available, sync_directory,
+    get_backup_dir, get_drives_with_bitlocker, profile_phase,
+)
+
+
+# ---------- GUI assets ----------
+
+ASSET_CACHE_DIR = APP_SCRIPT.parent / 'asset_cache'
+LOGO_THUMB_SIZE = 40  # header logo height in px
+_ASSET_COMPLETE = 'complete'
+
+
+def _asset_sources(base_dir: Path) -> dict:
+    """name -> PNG bytes. logo_light.png / logo_dark.png / icon.png next to the app win over the embedded defaults."""
+    sources = {}
+    for name, b64 in (('logo_light', LOGO_PNG_B64_LIGHT), ('logo_dark', LOGO_PNG_B64_DARK), ('icon', ICON_PNG_B64)):
+        try:
+            sources[name] = (base_dir / f'{name}.png').read_bytes()
+        except OSError:
+            sources[name] = base64.b64decode(b64)
+    return sources
+
+
+def _render_thumb(src: Path, dst: Path, master: tk.Misc) -> None:
+    """Write a LOGO_THUMB_SIZE square PNG of src; Pillow (LANCZOS) when available, else Tk subsample."""
+    try:
+        from PIL import Image
+    except Exception:
+        Image = None
+    if Image is not None:
+        with Image.open(src) as im:
+            im.convert('RGBA').resize((LOGO_THUMB_SIZE, LOGO_THUMB_SIZE), Image.LANCZOS).save(dst, 'PNG')
+        return
+    img = tk.PhotoImage(master=master, file=str(src))
+    img.subsample(max(1, img.width() // LOGO_THUMB_SIZE)).write(str(dst), format='png')
+
+
+def _build_asset_cache(cache_root: Path, key: str, sources: dict, master: tk.Misc) -> dict:
+    target = cache_root / key
+    paths = {name: target / f'{name}.png' for name in sources}
+    paths.update({f'{name}_thumb': target / f'{name}_thumb.png' for name in ('logo_light', 'logo_dark')})
+    if (target / _ASSET_COMPLETE).exists():
+        return paths
+    target.mkdir(parents=True, exist_ok=True)
+    for name, data in sources.items():
+        paths[name].write_bytes(data)
+    for name in ('logo_light', 'logo_dark'):
+        try:
+            _render_thumb(paths[name], paths[f'{name}_thumb'], master)
+        except Exception as e:
+            log(f"Kan thumbnail voor {name} niet maken: {e}")
+            paths.pop(f'{name}_thumb')
+    (target / _ASSET_COMPLETE).write_text(','.join(sorted(paths)), encoding='utf-8')
+    # only the current set of sources is worth keeping
+    for old in cache_root.iterdir():
+        if old.is_dir() and old.name != key:
+            shutil.rmtree(old, ignore_errors=True)
+    return paths
+
+
+def load_cached_assets(base_dir: Path, master: tk.Misc) -> dict:
+    """Return name -> PNG path for the logos, their header thumbnails and the icon.
+
+    Rendered files are cached under a hash of the source images, so later starts only hash a few
+    small files instead of decoding and resizing them.
+    """
+    sources = _asset_sources(base_dir)
+    digest = hashlib.sha256(str(LOGO_THUMB_SIZE).encode('ascii'))
+    for name in sorted(sources):
+        digest.update(name.encode('ascii') + b'\0' + sources[name])
+    key = digest.hexdigest()[:16]
+    for cache_root in (ASSET_CACHE_DIR, Path(tempfile.gettempdir()) / 'MenthaForceBitLocker' / 'asset_cache'):
+        try:
+            paths = _build_asset_cache(cache_root, key, sources, master)
+            done = (cache_root / key / _ASSET_COMPLETE).read_text(encoding='utf-8').split(',')
+        except OSError:
+            # install folder not writable; try the temp folder
+            continue
+        return {name: path for name, path in paths.items() if name in done and os.path.exists(path)}
+    return {}
+
+
+def _photo(path: Path | None) -> tk.PhotoImage | None:
+    if path is None:
+        return None
+    try:
+        return tk.PhotoImage(file=str(path))
+    except Exception:
+        return None
+
+
+# ---------- GUI Application ----------
+
+class UiDispatcher:
+    """Thread-safe channel into the Tk main loop.
+
+    Other threads queue log lines, per-drive status texts and widget calls under a lock and never
+    touch Tk themselves. The main loop drains the buffers from an after() tick: every BUSY_MS while
+    there is work, every IDLE_MS once the buffers were empty. Status updates are coalesced: only the
+    latest text per drive is drawn.
+    """
+
+    BUSY_MS = 30
+    IDLE_MS = 200
+
+    def __init__(self, root: tk.Misc, on_logs, on_status):
+        self.root = root
+        self.on_logs = on_logs
+        self.on_status = on_status
+        self._lock = threading.Lock()
+        self._logs = []
+        self._status = {}  # drive -> latest text
+        self._calls = []
+        self._after = None
+
+    def log(self, message: str) -> None:
+        with self._lock:
+            self._logs.append(message)
+
+    def status(self, drive: str, text: str) -> None:
+        with self._lock:
+            self._status[drive] = text
+
+    def call(self, func, *args, **kwargs) -> None:
+        with self._lock:
+            self._calls.append((func, args, kwargs))
+
+    def start(self) -> None:
+        """Start the drain tick; call from the Tk thread."""
+        if self._after is None:
+            self._tick()
+
+    def stop(self) -> None:
+        if self._after is not None:
+            try:
+                self.root.after_cancel(self._after)
+            except tk.TclError:
+                pass
+            self._after = None
+
+    def _tick(self) -> None:
+        busy = True
+        try:
+            busy = self._drain()
+        finally:
+            # reschedule even when a callback raised, or the UI would stop updating
+            try:
+                self._after = self.root.after(self.BUSY_MS if busy else self.IDLE_MS, self._tick)
+            except tk.TclError:
+                self._after = None  # window destroyed
+
+    def _drain(self) -> bool:
+        """Apply everything queued so far. Returns False when there was nothing to do."""
+        with self._lock:
+            logs, self._logs = self._logs, []
+            status, self._status = self._status, {}
+            calls, self._calls = self._calls, []
+        if not (logs or status or calls):
+            return False
+        if logs:
+            self._apply(self.on_logs, logs)
+        for drive, text in status.items():
+            self._apply(self.on_status, drive, text)
+        for func, args, kwargs in calls:
+            self._apply(func, *args, **kwargs)
+        return True
+
+    @staticmethod
+    def _apply(func, *args, **kwargs) -> None:
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            log(f"Fout in UI-aanroep {getattr(func, '__name__', func)}: {e}")
+
+
+class DriveList(ttk.Frame):
+    """Scrollable drive list that only keeps widgets for the rows on screen.
+
+    The model is keyed by mount point: set_drives() adds, removes or patches entries in place and
+    keeps each drive's BooleanVar, so selections survive refreshes. Scrolling rebinds the pooled row
+    widgets to other drives, so hundreds of volumes cost the same to draw as a handful.
+    """
+
+    DEFAULT_ROW_HEIGHT = 28
+
+    def __init__(self, master, on_toggle):
+        super().__init__(master)
+        self.on_toggle = on_toggle
+        self.vars = {}  # drive -> tk.BooleanVar
+        self.texts = {}  # drive -> status text
+        self.order = []  # drives in display order
+        self._pos = {}  # drive -> index in order
+        self.first = 0  # index of the top visible row
+        self.rows = []  # pooled (frame, checkbutton, label)
+        self._visible = 0
+        self._capacity = 0  # rows that fit in the current height
+        self._row_height = None
+        self.body = ttk.Frame(self)
+        self.body.pack(side='left', fill='both', expand=True)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        self.empty_label = ttk.Label(self.body, text='Geen BitLocker-geschakelde volumes gevonden')
+        self.body.bind('<Configure>', self._on_resize)
+        self._bind_wheel(self.body)
+
+    def set_drives(self, texts: dict) -> tuple[list, list]:
+        """Reconcile with drive -> status text. Returns (added, removed) drives."""
+        added = [d for d in texts if d not in self.vars]
+        removed = [d for d in self.vars if d not in texts]
+        for d in removed:
+            del self.vars[d]
+            del self.texts[d]
+        for d in added:
+            self.vars[d] = tk.BooleanVar(master=self, value=False)
+        if added or removed:
+            self.texts.update(texts)
+            self.order = sorted(texts)
+            self._pos = {d: i for i, d in enumerate(self.order)}
+            self._scroll_to(self.first)
+        else:
+            for d, text in texts.items():
+                if self.texts.get(d) != text:
+                    self.set_status(d, text)
+        return added, removed
+
+    def set_status(self, drive: str, text: str) -> None:
+        if drive not in self.texts:
+            return
+        self.texts[drive] = text
+        i = self._pos[drive] - self.first
+        if 0 <= i < self._visible:
+            self.rows[i][2].configure(text=text)
+
+    def _bind_wheel(self, widget) -> None:
+        widget.bind('<MouseWheel>', lambda e: self._scroll_to(self.first - int(e.delta / 120) * 3))
+        widget.bind('<Button-4>', lambda e: self._scroll_to(self.first - 3))
+        widget.bind('<Button-5>', lambda e: self._scroll_to(self.first + 3))
+
+    def _add_row(self) -> None:
+        frame = ttk.Frame(self.body)
+        cb = ttk.Checkbutton(frame, command=self.on_toggle)
+        cb.pack(side='left')
+        stat = ttk.Label(frame)
+        stat.pack(side='left', padx=8)
+        for w in (frame, cb, stat):
+            self._bind_wheel(w)
+        self.rows.append((frame, cb, stat))
+
+    def _on_resize(self, event=None) -> None:
+        if self._row_height is None and self.rows:
+            h = self.rows[0][0].winfo_reqheight()
+            if h > 1:
+                self._row_height = h + 4  # grid pady=2 on both sides
+        per_row = self._row_height or self.DEFAULT_ROW_HEIGHT
+        self._scroll_to(self.first, max(1, self.body.winfo_height() // per_row))
+
+    def _on_scrollbar(self, *args) -> None:
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.order)))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (max(1, self._visible - 1) if args[2] == 'pages' else 1)
+            self._scroll_to(self.first + step)
+
+    def _scroll_to(self, first: int, capacity: int | None = None) -> None:
+        if capacity is not None:
+            self._capacity = capacity
+        capacity = self._capacity
+        self.first = max(0, min(first, len(self.order) - capacity))
+        self._visible = min(capacity, len(self.order) - self.first)
+        while len(self.rows) < self._visible:
+            self._add_row()
+        for i, (frame, cb, stat) in enumerate(self.rows):
+            if i < self._visible:
+                d = self.order[self.first + i]
+                cb.configure(text=d, variable=self.vars[d])
+                stat.configure(text=self.texts[d])
+                frame.grid(row=i, column=0, sticky='w', pady=2)
+            else:
+                frame.grid_remove()
+        if self.order:
+            self.empty_label.grid_remove()
+            n = len(self.order)
+            self.scrollbar.set(self.first / n, (self.first + self._visible) / n)
+        else:
+            self.empty_label.grid(row=0, column=0)
+            self.scrollbar.set(0, 1)
+
+
+class BitLockerApp(tk.Tk):
+    @profile_phase('startup')
+    def __init__(self):
+        super().__init__()
+        self.title(f"{PRODUCT_NAME} — {COMPANY_NAME} v{VERSION}")
+        self.geometry("900x600")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Ensure Windows shows the app icon (not Python) by setting AppUserModelID early
+        try:
+            if is_windows() and hasattr(ctypes.windll, 'shell32'):
+                try:
+                    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(APP_ID)
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+        # try load logo/icon (prefer logo.ico, then the cached logo/icon PNGs)
+        self._logo_light_image = None
+        self._logo_dark_image = None
+        self._logo_light_thumb = None
+        self._logo_dark_thumb = None
+        try:
+            base_dir = APP_SCRIPT.parent
+            # prefer .ico for taskbar icon; try logo.ico first
+            for ico_name in ('logo.ico', 'icon.ico'):
+                ico_path = base_dir / ico_name
+                if ico_path.exists():
+                    try:
+                        self.iconbitmap(str(ico_path))
+                    except Exception:
+                        try:
+                            img = tk.PhotoImage(file=str(ico_path))
+                            self.iconphoto(True, img)
+                            self._icon_image = img
+                        except Exception:
+                            pass
+                    break
+
+            # Header logo images (keep references); thumbnails come pre-rendered from the asset cache
+            assets = load_cached_assets(base_dir, self)
+            self._logo_light_image = _photo(assets.get('logo_light'))
+            self._logo_dark_image = _photo(assets.get('logo_dark'))
+            self._logo_light_thumb = _photo(assets.get('logo_light_thumb'))
+            self._logo_dark_thumb = _photo(assets.get('logo_dark_thumb'))
+
+            # If no .ico found, ensure we have an iconphoto from the embedded icon.png or logo_light
+            if not hasattr(self, '_icon_image'):
+                img = _photo(assets.get('icon')) or self._logo_light_image
+                if img is not None:
+                    try:
+                        self.iconphoto(True, img)
+                        self._icon_image = img
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+
+        # Styling & fonts
+        style = ttk.Style(self)
+        try:
+            style.theme_use('vista')
+        except Exception:
+            try:
+                style.theme_use('clam')
+            except Exception:
+                pass
+
+        # Base font sizing
+        self.default_font = tkfont.nametofont("TkDefaultFont")
+        try:
+            self.default_font.configure(size=10)
+        except Exception:
+            pass
+
+        # Theme state
+        self.current_theme = 'default'
+
+        # runtime threading/UI dispatch must exist before theme applies (theme logs)
+        self.task_thread = None
+        self.stop_event = CancelEvent()
+        self.ui = UiDispatcher(self, self._flush_log_lines, self._apply_status)
+
+        self.apply_theme(self.current_theme)
+
+        # Runtime state
+        self.selected = {}  # drive -> tk.BooleanVar (the DriveList model once the UI is built)
+        self.backup_done = {}  # drive -> bool
+        self.volumes = {}  # drive -> VolumeStatus from the last refresh
+        self.known_backups = {}  # drive -> backup entry (see make_backup_entry)
+        self.live = False  # True once live detection has replaced the warm-start list
+        self._backup_checks = {}  # drive -> ((path, sha256, protectors), valid); used on the detector thread
+
+        # Build UI and initialize
+        self._build_ui()
+        # licensing
+        self.licensed = load_license()
+        self.update_license_status()
+        # dev mode
+        self.dev_mode = False
+        rec = load_dev_record()
+        if rec and rec.get('persist_state'):
+            self.dev_mode = True
+            log('Dev Mode active from persisted state')
+        self.update_dev_ui()
+        self.set_app_icon()
+        self.detector = DriveDetector(profile_phase('detect_drives')(self._detect_drives))
+        # warm start: show the last known inventory right away, then replace it with live data
+        inventory = load_inventory()
+        if inventory:
+            self.known_backups = inventory['backups']
+            self._apply_drives(inventory['volumes'], stale_since=inventory['saved'])
+        self.refresh_drives()
+        # drain what threads queued so far, then keep draining from the main loop
+        self.ui.start()
+
+    def apply_theme(self, theme: str) -> None:
+        """Apply a UI theme. Supports 'default' and 'monochrome'."""
+        style = ttk.Style(self)
+        if theme == 'monochrome':
+            # Monochrome (black & white) modern look
+            bg = '#0b0b0b'
+            panel = '#111111'
+            fg = '#ffffff'
+            muted = '#bdbdbd'
+            btn_bg = '#ffffff'
+            btn_fg = '#000000'
+            style.configure('TFrame', background=bg)
+            style.configure('TLabel', background=bg, foreground=fg)
+            style.configure('Header.TLabel', font=('Segoe UI', 18, 'bold'), foreground=fg, background=bg)
+            style.configure('Subtitle.TLabel', font=('Segoe UI', 10), foreground=muted, background=bg)
+            style.configure('TLabelframe.Label', font=('Segoe UI', 11, 'bold'), foreground=muted, background=bg)
+            # Accent button: bold, larger, clear contrast (white bg / black text in monochrome)
+            style.configure('Accent.TButton', foreground=btn_fg, background=btn_bg, font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
+            style.map('Accent.TButton', 
+                background=[('!disabled', btn_bg), ('active', '#e6e6e6'), ('pressed', '#dcdcdc'), ('disabled', '#777777')],
+                foreground=[('!disabled', btn_fg), ('disabled', '#aaaaaa')]
+            )
+            # Danger button: red with clear white text and strong hover
+            style.configure('Danger.TButton', foreground=btn_bg, background='#b32d2e', font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
+            style.map('Danger.TButton', background=[('!disabled', '#b32d2e'), ('active', '#a02828'), ('pressed', '#882222'), ('disabled', '#777777')], foreground=[('!disabled', btn_bg), ('disabled', '#aaaaaa')])
+            # Generic button style: larger font and clear contrast
+            style.configure('TButton', background=panel, foreground=fg, padding=8, font=('Segoe UI', 10))
+            style.map('TButton', background=[('!disabled', panel), ('active', '#2b2b2b')], foreground=[('disabled', '#888888')])
+            style.configure('TCheckbutton', background=bg, foreground=fg, font=('Segoe UI', 9))
+            try:
+                self.configure(bg=bg)
+            except Exception:
+                pass
+            # Text widget colors
+            try:
+                self.log_text.configure(bg='#111111', fg=fg, insertbackground=fg, selectbackground='#333333')
+            except Exception:
+                pass
+            try:
+                self.status_bar.configure(background=bg, foreground=fg)
+            except Exception:
+                pass
+            # header logo (prefer thumbnail)
+            try:
+                if hasattr(self, 'logo_label') and self.logo_label is not None:
+                    if getattr(self, '_logo_dark_thumb', None) is not None:
+                        self.logo_label.configure(image=self._logo_dark_thumb)
+                        self.logo_label.image = self._logo_dark_thumb
+                    elif getattr(self, '_logo_dark_image', None) is not None:
+                        self.logo_label.configure(image=self._logo_dark_image)
+                        self.logo_label.image = self._logo_dark_image
+            except Exception:
+                pass
+            # misc foreground updates
+            try:
+                self.license_status.configure(foreground=fg)
+            except Exception:
+                pass
+            try:
+                self.log_text.configure(fg=fg)
+            except Exception:
+                pass
+            self._append_log('Theme set to Monochrome')
+        else:
+            # Default (green accent) modern look
+            bg = '#ffffff'
+            panel = '#ffffff'
+            fg = '#222222'
+            muted = '#4b4b4b'
+            accent = '#2b7a3a'
+            style.configure('TFrame', background=bg)
+            style.configure('TLabel', background=bg, foreground=fg)
+            style.configure('Header.TLabel', font=('Segoe UI', 18, 'bold'), foreground=accent, background=bg)
+            style.configure('Subtitle.TLabel', font=('Segoe UI', 10), foreground=muted, background=bg)
+            style.configure('TLabelframe.Label', font=('Segoe UI', 11, 'bold'), foreground=muted, background=bg)
+            # Accent button: clear white on green, bolder and responsive
+            style.configure('Accent.TButton', foreground='white', background=accent, font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
+            style.map('Accent.TButton', background=[('!disabled', accent), ('active', '#2f8c30'), ('pressed', '#276d26'), ('disabled', '#999999')], foreground=[('disabled', '#eeeeee')])
+            style.configure('Danger.TButton', foreground='white', background='#b32d2e', font=('Segoe UI', 11, 'bold'), padding=10, relief='raised', borderwidth=1)
+            style.map('Danger.TButton', background=[('!disabled', '#b32d2e'), ('active', '#9b2526'), ('pressed', '#7a1f1f')], foreground=[('disabled', '#dddddd')])
+            style.configure('TButton', background=panel, foreground=fg, padding=8, font=('Segoe UI', 10))
+            style.map('TButton', background=[('!disabled', panel), ('active', '#f0f0f0')], foreground=[('disabled', '#888888')])
+            style.configure('TCheckbutton', background=bg, foreground=fg, font=('Segoe UI', 9))
+            try:
+                self.configure(bg='SystemButtonFace')
+            except Exception:
+                pass
+            try:
+                self.log_text.configure(bg='#fbfbfb', fg=fg, insertbackground=fg, selectbackground='#ececec')
+            except Exception:
+                pass
+            try:
+                self.status_bar.configure(background='#f7f7f7', foreground='#444444')
+            except Exception:
+                pass
+            # header logo (prefer thumbnail)
+            try:
+                if hasattr(self, 'logo_label') and self.logo_label is not None:
+                    if getattr(self, '_logo_light_thumb', None) is not None:
+                        self.logo_label.configure(image=self._logo_light_thumb)
+                        self.logo_label.image = self._logo_light_thumb
+                    elif getattr(self, '_logo_light_image', None) is not None:
+                        self.logo_label.configure(image=self._logo_light_image)
+                        self.logo_label.image = self._logo_light_image
+            except Exception:
+                pass
+            # misc foreground updates
+            try:
+                self.license_status.configure(foreground=fg)
+            except Exception:
+                pass
+            try:
+                self.log_text.configure(fg=fg)
+            except Exception:
+                pass
+            self._append_log('Theme set to Default')
+
+    def set_theme(self, theme: str) -> None:
+        self.current_theme = theme
+        self.apply_theme(theme)
+
+    def set_app_icon(self) -> None:
+        """Ensure the application window and taskbar show the app icon (logo.ico or embedded image)."""
+        try:
+            base_dir = APP_SCRIPT.parent
+            ico = base_dir / 'logo.ico'
+            if ico.exists():
+                try:
+                    self.iconbitmap(str(ico))
+                except Exception:
+                    pass
+            # also ensure iconphoto uses the full logo image if available
+            if hasattr(self, '_logo_light_image') and self._logo_light_image is not None:
+                try:
+                    self.iconphoto(True, self._logo_light_image)
+                except Exception:
+                    pass
+            elif hasattr(self, '_icon_image') and self._icon_image is not None:
+                try:
+                    self.iconphoto(True, self._icon_image)
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+    def toggle_theme(self) -> None:
+        self.set_theme('monochrome' if self.current_theme != 'monochrome' else 'default')
+
+    def _build_ui(self):
+        # Header with app title
+        header = ttk.Frame(self, padding=(12, 10))
+        header.pack(fill='x')
+        # Header logo + title
+        self.logo_label = None
+        # choose thumbnail for header (smaller size)
+        logo_img = getattr(self, '_logo_light_thumb', None) if self.current_theme != 'monochrome' else getattr(self, '_logo_dark_thumb', None)
+        # fallback to full image if thumbnail not available
+        if not logo_img:
+            logo_img = getattr(self, '_logo_light_image', None) if self.current_theme != 'monochrome' else getattr(self, '_logo_dark_image', None)
+        if logo_img:
+            # use a plain tk.Label for image
+            self.logo_label = tk.Label(header, image=logo_img)
+            self.logo_label.image = logo_img
+            self.logo_label.pack(side='left', padx=(0,8))
+        title = ttk.Label(header, text=PRODUCT_NAME, style='Header.TLabel')
+        title.pack(side='left')
+        subtitle = ttk.Label(header, text=f"{COMPANY_NAME} — v{VERSION}", style='Subtitle.TLabel')
+        subtitle.pack(side='left', padx=8)
+
+        # Menus (View: themes + Help docs)
+        menubar = tk.Menu(self)
+        viewmenu = tk.Menu(menubar, tearoff=0)
+        viewmenu.add_radiobutton(label='Default theme', command=lambda: self.set_theme('default'))
+        viewmenu.add_radiobutton(label='Monochrome (zwart/wit)', command=lambda: self.set_theme('monochrome'))
+        menubar.add_cascade(label='View', menu=viewmenu)
+
+        helpmenu = tk.Menu(menubar, tearoff=0)
+        helpmenu.add_command(label='View README', command=self.show_readme)
+        helpmenu.add_command(label='View EULA', command=self.show_eula)
+        helpmenu.add_command(label='View Terms', command=self.show_terms)
+        menubar.add_cascade(label='Help', menu=helpmenu)
+        self.config(menu=menubar)
+
+        top = ttk.Frame(self)
+        top.pack(fill='x', padx=10, pady=6)
+
+        refresh_btn = ttk.Button(top, text='Refresh drives', command=self.refresh_drives, style='TButton')
+        refresh_btn.pack(side='left')
+
+        # License controls
+        self.license_status = ttk.Label(top, text='License: unknown')
+        self.license_status.pack(side='right', padx=6)
+        self.license_btn = ttk.Button(top, text='Enter License', command=self.enter_license, style='Accent.TButton')
+        self.license_btn.pack(side='right')
+        self.demo_btn = ttk.Button(top, text='Demo license', command=self.generate_demo_license_ui, style='Accent.TButton')
+        self.demo_btn.pack(side='right', padx=6)
+
+        self.relaunch_btn = ttk.Button(top, text='Relaunch as Admin', command=self.relaunch_as_admin, style='TButton')
+        self.relaunch_btn.pack(side='right')
+
+        theme_btn = ttk.Button(top, text='Monochrome', command=self.toggle_theme, style='TButton')
+        theme_btn.pack(side='right', padx=6)
+
+        about_btn = ttk.Button(top, text='About', command=self.show_about, style='TButton')
+        about_btn.pack(side='right', padx=6)
+
+        mid = ttk.Frame(self)
+        mid.pack(fill='both', expand=True, padx=10, pady=6)
+
+        left = ttk.LabelFrame(mid, text='Drives (selecteer)')
+        left.pack(side='left', fill='y', padx=6, pady=6)
+
+        self.drive_list = DriveList(left, on_toggle=self._update_start_state)
+        self.drive_list.pack(fill='both', expand=True)
+        self.selected = self.drive_list.vars
+
+        right = ttk.Frame(mid)
+        right.pack(side='right', fill='both', expand=True)
+
+        agree_frame = ttk.Frame(right)
+        agree_frame.pack(fill='x')
+        self.agree_var = tk.BooleanVar(value=False)
+        cb = ttk.Checkbutton(agree_frame, text='Ik begrijp de risico\'s en heb een backup gemaakt van mijn recovery keys', variable=self.agree_var, command=self._update_start_state)
+        cb.pack(side='left', fill='x', expand=True)
+
+        btns = ttk.Frame(right)
+        btns.pack(fill='x', pady=6)
+        self.backup_btn = ttk.Button(btns, text='Backup geselecteerde', command=self.backup_selected, style='Accent.TButton')
+        self.backup_btn.pack(side='left', padx=4)
+        self.start_btn = ttk.Button(btns, text='Start', command=self.start_selected, state='disabled', style='Accent.TButton')
+        self.start_btn.pack(side='left', padx=4)
+        self.cancel_btn = ttk.Button(btns, text='Annuleer', command=self.cancel, state='disabled', style='Danger.TButton')
+        self.cancel_btn.pack(side='left', padx=4)
+        self.bundle_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btns, text='Als bundel (gecomprimeerd, wachtwoord)', variable=self.bundle_var).pack(side='left', padx=4)
+
+        # Dev Mode Controls
+        dev_frame = ttk.LabelFrame(right, text='Dev Mode')
+        dev_frame.pack(fill='x', pady=6)
+        self.dev_label = ttk.Label(dev_frame, text='Dev Mode: Off')
+        self.dev_label.pack(side='left', padx=6)
+        self.dev_unlock_btn = ttk.Button(dev_frame, text='Unlock Dev Mode', command=self.enter_dev_code_ui, style='TButton')
+        self.dev_unlock_btn.pack(side='left', padx=4)
+        self.dev_gen_btn = ttk.Button(dev_frame, text='Set/Generate Code', command=self.generate_dev_code_ui, style='Accent.TButton')
+        self.dev_gen_btn.pack(side='left', padx=4)
+        self.dev_clear_btn = ttk.Button(dev_frame, text='Clear saved code', command=self.clear_dev_code_ui, style='TButton')
+        self.dev_clear_btn.pack(side='left', padx=4)
+        self.dev_reveal_btn = ttk.Button(dev_frame, text='Reveal saved code', command=self.reveal_dev_code_ui, style='TButton')
+        self.dev_reveal_btn.pack(side='left', padx=4)
+
+        self.progress_box = ttk.LabelFrame(right, text='Voortgang / Log')
+        self.progress_box.pack(fill='both', expand=True, pady=6)
+        self.log_text = tk.Text(self.progress_box, height=18, state='disabled')
+        self.log_text.pack(fill='both', expand=True)
+        self.status_bar = ttk.Label(self, text='Ready', relief='sunken', anchor='w')
+        self.status_bar.pack(side='bottom', fill='x')
+
+    def _append_log(self, message: str):
+        log(message)
+        self.ui.log(message)
+
+    def _apply_status(self, drive: str, text: str) -> None:
+        self.drive_list.set_status(drive, text)
+
+    def _flush_log_lines(self, lines: list[str]) -> None:
+        """Append all pending lines in one insert and keep the pane under LOG_PANE_MAX_LINES."""
+        self.log_text.configure(state='normal')
+        self.log_text.insert('end', '\n'.join(lines) + '\n')
+        # 'end' is the empty line after the final newline, so line count is end - 2
+        total = int(self.log_text.index('end').split('.')[0]) - 2
+        if total > LOG_PANE_MAX_LINES:
+            excess = total - LOG_PANE_MAX_LINES
+            # drop in whole chunks so trimming doesn't happen on every tick
+            drop = -(-excess // LOG_PANE_TRIM_CHUNK) * LOG_PANE_TRIM_CHUNK
+            self.log_text.delete('1.0', f'{drop + 1}.0')
+        self.log_text.see('end')
+        self.log_text.configure(state='disabled')
+        try:
+            self.status_bar.configure(text=lines[-1][:120])
+        except Exception:
+            pass
+
+    def update_dev_ui(self):
+        rec = load_dev_record()
+        text = 'Dev Mode: On' if getattr(self, 'dev_mode', False) else 'Dev Mode: Off'
+        if rec:
+            if rec.get('persist'):
+                text += ' (saved)'
+            if rec.get('hide'):
+                text += ' [hidden]'
+        self.dev_label.configure(text=text)
+        # Reveal button only enabled if saved and not hidden
+        if rec and not rec.get('hide'):
+            self.dev_reveal_btn.configure(state='normal')
+        else:
+            self.dev_reveal_btn.configure(state='disabled')
+        self._update_start_state()
+
+    def enter_dev_code_ui(self):
+        # masked input prompt
+        code = simpledialog.askstring('Enter dev code', 'Voer je dev-code in:', show='*', parent=self)
+        if not code:
+            return
+        ok = verify_dev_code(code)
+        if ok:
+            self.dev_mode = True
+            self._append_log('Dev Mode ontgrendeld (sessie).')
+            messagebox.showinfo('Dev Mode', 'Dev Mode is nu actief voor deze sessie.')
+            self.update_dev_ui()
+        else:
+            messagebox.showerror('Dev Mode', 'Onjuiste code of geen dev code ingesteld.')
+
+    def generate_dev_code_ui(self):
+        # ask whether to generate or enter custom
+        if messagebox.askyesno('Generate', 'Wil je een willekeurige code genereren? (Nee = voer eigen code in)'):
+            code = secrets.token_urlsafe(10)
+        else:
+            code = simpledialog.askstring('Custom code', 'Voer gewenste dev-code in:', parent=self)
+            if not code:
+                return
+        hide = messagebox.askyesno('Hide code', 'Wil je dat de code verborgen wordt (niet later zichtbaar)?')
+        persist_state = messagebox.askyesno('Persist dev', 'Moet Dev Mode actief blijven na herstart tot je het wist?')
+        ok = save_dev_record(code, persist=True, hide=hide, persist_state=persist_state)
+        if ok:
+            # show code once if it was generated or if user didn't hide
+            if not hide:
+                messagebox.showinfo('Dev Code', f'De code is opgeslagen en is: {code}\nBewaar deze veilig.')
+            else:
+                # show once and warn
+                messagebox.showinfo('Dev Code', f'De code is opgeslagen en wordt verborgen; sla hem nu op. Code: {code}')
+            self._append_log('Dev code opgeslagen (verborgen: %s; persistent: %s)' % (hide, persist_state))
+            # if user wants to keep dev mode active now, set it
+            if persist_state:
+                self.dev_mode = True
+            self.update_dev_ui()
+        else:
+            messagebox.showerror('Dev', 'Kon dev code niet opslaan.')
+
+    def clear_dev_code_ui(self):
+        if not messagebox.askyesno('Clear', 'Weet je zeker dat je de opgeslagen dev-code wilt verwijderen?'):
+            return
+        ok = clear_dev_record()
+        if ok:
+            self.dev_mode = False
+            self._append_log('Dev code verwijderd.')
+            messagebox.showinfo('Clear', 'Dev code verwijderd.')
+            self.update_dev_ui()
+        else:
+            messagebox.showerror('Clear', 'Kon dev code niet verwijderen.')
+
+    def reveal_dev_code_ui(self):
+        rec = load_dev_record()
+        if not rec:
+            messagebox.showinfo('Reveal', 'Geen opgeslagen dev code gevonden.')
+            return
+        if rec.get('hide'):
+            messagebox.showwarning('Reveal', 'De opgeslagen code is gemarkeerd als verborgen en kan niet worden onthuld via de UI.')
+            return
+        code = decrypt_dev_code(rec)
+        if code is None:
+            messagebox.showerror('Reveal', 'Kon code niet ontcijferen.')
+            return
+        # show code once
+        messagebox.showinfo('Stored dev code', f'De opgeslagen code is: {code}')
+
+    @profile_phase('refresh_drives')
+    def refresh_drives(self):
+        """Start drive detection in the background; clicks while it runs join the running query."""
+        self.status_bar.configure(text='Zoeken naar schijven...')
+        if not self.detector.request(lambda result: self.ui.call(self._apply_drives, *result)):
+            return
+        self._append_log("Drives detecteren...")
+        self.cancel_btn.configure(state='normal')
+
+    def _detect_drives(self) -> tuple[dict, dict]:
+        """Runs on the detector thread: live detection plus the backup file checks, which read and
+        hash files that may sit on a slow share. Returns (drive -> VolumeStatus, drive -> backup valid)."""
+        found = get_drives_with_bitlocker()
+        known = dict(self.known_backups)
+        valid = {}
+        for d, vol in found.items():
+            entry = known.get(d) or {}
+            key = (entry.get('path'), entry.get('sha256'), tuple(sorted(vol.protectors)))
+            cached = self._backup_checks.get(d)
+            if cached is None or cached[0] != key:
+                cached = (key, backup_still_valid(known.get(d), vol))
+                self._backup_checks[d] = cached
+            valid[d] = cached[1]
+        return found, valid
+
+    def _apply_drives(self, found: dict, valid: dict | None = None, stale_since=None):
+        """Reconcile the drive list with a detection result (runs on the Tk thread).
+        valid holds the backup checks from _detect_drives. stale_since marks a list drawn from the saved
+        inventory while live detection runs; it is shown, but its backups are not checked and Start
+        stays disabled until live data arrives."""
+        if stale_since is None:
+            self.live = True
+            # restore status
+            try:
+                self.status_bar.configure(text='Ready')
+                if not (self.task_thread and self.task_thread.is_alive()):
+                    self.cancel_btn.configure(state='disabled')
+            except Exception:
+                pass
+            save_inventory(found, self.known_backups)
+        previous = self.volumes
+        self.volumes = found
+        texts = {}
+        for d, vol in found.items():
+            old = previous.get(d)
+            if stale_since is None and (d not in self.backup_done or old is None
+                                        or sorted(old.protectors) != sorted(vol.protectors)):
+                self.backup_done[d] = (valid or {}).get(d, False)
+            # initialize label with current percentage if available
+            if self.backup_done.get(d, False):
+                text = 'Backup aanwezig'
+            elif vol.percentage is not None:
+                text = f'Encrypted: {vol.percentage:g}%'
+            else:
+                text = 'Status onbekend'
+            if stale_since is not None:
+                text += f" (opgeslagen {stale_since.strftime('%d-%m %H:%M')})"
+            texts[d] = text
+        added, removed = self.drive_list.set_drives(texts)
+        for d in removed:
+            self.backup_done.pop(d, None)
+
+        if not found:
+            self._append_log('Geen schijven met BitLocker gevonden.')
+        elif added or removed:
+            self._append_log(f'Schijflijst bijgewerkt: +{len(added)} -{len(removed)} (totaal {len(found)})')
+        self._update_start_state()
+
+    def _update_start_state(self):
+        # Start is enabled only if: live drive data, at least one drive selected, agree checked, and backups done for all selected drives
+        if not self.live:
+            self.start_btn.configure(state='disabled')
+            return
+        any_selected = any(v.get() for v in self.selected.values())
+        if not any_selected or not self.agree_var.get():
+            self.start_btn.configure(state='disabled')
+            return
+        # ensure backups done
+        for d, v in self.selected.items():
+            if v.get() and not self.backup_done.get(d, False):
+                self.start_btn.configure(state='disabled')
+                return
+        if not has_backend_privileges():
+            self.start_btn.configure(state='disabled')
+            self._append_log('Script is niet als Administrator gestart; Start uitgeschakeld.')
+            return
+        # Require a valid license to perform disabling operations, unless Dev Mode is active
+        if not getattr(self, 'licensed', False) and not getattr(self, 'dev_mode', False):
+            self.start_btn.configure(state='disabled')
+            self._append_log('Geen geldige licentie gevonden; start uitgeschakeld. (Of activeer Dev Mode)')
+            return
+        self.start_btn.configure(state='normal')
+
+    def relaunch_as_admin(self):
+        if is_admin():
+            messagebox.showinfo('Admin', 'Je draait al als Administrator.')
+            return
+        try:
+            # Relaunch this script elevated
+            # the original command line: sys.argv has lost the options main() already handled
+            params = subprocess.list2cmdline(LAUNCH_ARGV)
+            ctypes.windll.shell32.ShellExecuteW(None, 'runas', sys.executable, f'"{APP_SCRIPT}" {params}', None, 1)  # type: ignore
+            self._append_log('Script wordt opnieuw gestart als Administrator...')
+            self.destroy()
+        except Exception as e:
+            messagebox.showerror('Fout', f'Kan niet opnieuw starten als Administrator: {e}')
+
+    def update_license_status(self):
+        self.licensed = load_license()
+        if self.licensed:
+            self.license_status.configure(text=f'License: Licensed')
+            self._append_log('Licentie: actief')
+        else:
+            self.license_status.configure(text=f'License: Demo/Unlicensed')
+            self._append_log('Licentie: niet gevonden of verlopen')
+        self._update_start_state()
+
+    def enter_license(self):
+        key = simpledialog.askstring('Licentie invoeren', 'Plak je licentiesleutel (of inhoud van .lic bestand):', parent=self)
+        if not key:
+            return
+        if validate_license_content(key.strip()):
+            if write_license_file(key.strip()):
+                self._append_log('Licentie opgeslagen en geactiveerd.')
+                messagebox.showinfo('Licentie', 'Licentie geaccepteerd. Herstart de app indien nodig.')
+                self.update_license_status()
+            else:
+                messagebox.showerror('Licentie', 'Kan licentiebestand niet opslaan.')
+        else:
+            messagebox.showerror('Licentie', 'Ongeldige of verlopen licentiesleutel.')
+
+    def generate_demo_license_ui(self):
+        if not messagebox.askyesno('Demo licentie', f'Maak een demo-licentie voor {TRIAL_DAYS} dagen? (alleen voor testen)'):
+            return
+        content = generate_demo_license(TRIAL_DAYS)
+        ok = write_license_file(content)
+        if ok:
+            self._append_log(f'Demo licentie gemaakt (geldigheid {TRIAL_DAYS} dagen).')
+            messagebox.showinfo('Demo', f'Demo licentie aangemaakt: {LICENSE_FILE}')
+            self.update_license_status()
+        else:
+            messagebox.showerror('Demo', 'Kon demo licentie niet schrijven.')
+
+    @profile_phase('backup_selected')
+    def backup_selected(self):
+        if self._task_running():
+            return
+        to_backup = [d for d, v in self.selected.items() if v.get()]
+        if not to_backup:
+            messagebox.showinfo('Backup', 'Selecteer eerst één of meerdere schijven om te backuppen.')
+            return
+        # Ask where to save (optional)
+        target = filedialog.askdirectory(title='Kies map om backups op te slaan (annuleren = default)', initialdir=str(get_backup_dir()))
+        target_dir = Path(target) if target else get_backup_dir()
+        passphrase = None
+        if self.bundle_var.get():
+            if not bundles_available():
+                messagebox.showerror('Bundel', "Bundels vereisen het Python-pakket 'cryptography' (pip install cryptography).")
+                return
+            passphrase = simpledialog.askstring('Bundel', 'Wachtwoord voor de backup-bundel:', show='*', parent=self)
+            if not passphrase:
+                return
+            if simpledialog.askstring('Bundel', 'Herhaal het wachtwoord:', show='*', parent=self) != passphrase:
+                messagebox.showerror('Bundel', 'Wachtwoorden komen niet overeen.')
+                return
+        self.stop_event.clear()
+        self.cancel_btn.configure(state='normal')
+        self._append_log(f'Backup starten voor: {to_backup} -> map: {target_dir}')
+
+        def on_event(drive, stage, state, seconds):
+            # bundle entries only count once the bundle has been closed and read back
+            if state == 'done' and stage == 'verify' and passphrase is None:
+                self.ui.call(self.backup_done.__setitem__, drive, True)
+            elif state == 'failed':
+                self._append_log(f'Backup mislukt voor {drive} (stap: {stage})')
+
+        def do_backup():
+            bundle = None
+            if passphrase is not None:
+                try:
+                    bundle = BundleWriter(bundle_path_for_session(target_dir), passphrase)
+                except (OSError, BundleError) as e:
+                    self._append_log(f'Kan bundel niet aanmaken: {e}')
+                    self.ui.call(self.cancel_btn.configure, state='disabled')
+                    return
+            jobs = [DriveJob(d, BACKUP_STAGES, target_dir, self.volumes.get(d), bundle) for d in to_backup]
+            executor = JobExecutor(MAX_PARALLEL_JOBS, self.stop_event,
+                                   on_status=self.ui.status,
+                                   on_event=on_event)
+            try:
+                executor.run(jobs)
+            finally:
+                if bundle is not None and not self._finish_bundle(bundle, passphrase, jobs):
+                    for job in jobs:
+                        job.failed_stage = job.failed_stage or 'bundle'
+            entries = {}
+            for job in jobs:
+                if job.ok:
+                    self._append_log(f'Backup gelukt: {job.drive} -> {job.backup_path}')
+                    try:
+                        entries[job.drive] = make_backup_entry(job.backup_path, job.volume, bundle is not None)
+                    except OSError as e:
+                        log(f'Kan backup niet registreren voor {job.drive}: {e}')
+                self._append_log('Tijden ' + format_job_timings(job))
+            if entries:
+                self.ui.call(self._record_backups, entries)
+            if self.stop_event.is_set():
+                self._append_log('Backup geannuleerd door gebruiker')
+            self.ui.call(self.cancel_btn.configure, state='disabled')
+            self.ui.call(self._update_start_state)
+
+        self.task_thread = threading.Thread(target=profile_phase('backup_worker')(do_backup), daemon=True)
+        self.task_thread.start()
+
+    def _task_running(self) -> bool:
+        """True (and tells the user) while a backup or disable run is still busy."""
+        if self.task_thread is not None and self.task_thread.is_alive():
+            messagebox.showinfo('Bezig', 'Er loopt al een backup of uitschakelproces; wacht tot het klaar is of annuleer het.')
+            return True
+        return False
+
+    def _finish_bundle(self, bundle, passphrase: str, jobs: list) -> bool:
+        """Close the session bundle and read every entry back before the drives count as backed up."""
+        if not len(bundle):
+            bundle.abort()
+            return False
+        try:
+            path = bundle.close()
+            sync_directory(path.parent)
+            with BundleReader(path, passphrase) as reader:
+                for job in jobs:
+                    if not job.ok:
+                        continue
+                    if reader.read(job.drive).decode('utf-8') == job.backup_text:
+                        self.ui.call(self.backup_done.__setitem__, job.drive, True)
+                    else:
+                        job.failed_stage = 'bundle'
+        except Exception as e:
+            self._append_log(f'Bundel kon niet worden opgeslagen of gecontroleerd: {e}')
+            return False
+        self._append_log(f'Bundel opgeslagen: {path} ({len(bundle)} schijven)')
+        return True
+
+    def _record_backups(self, entries: dict) -> None:
+        self.known_backups.update(entries)
+        save_inventory(self.volumes, self.known_backups)
+
+    @profile_phase('start_selected')
+    def start_selected(self):
+        if self._task_running():
+            return
+        to_start = [d for d, v in self.selected.items() if v.get()]
+        if not to_start:
+            messagebox.showinfo('Start', 'Selecteer eerst één of meerdere schijven om uit te schakelen.')
+            return
+        if not self.agree_var.get():
+            messagebox.showwarning('Overeenkomst', 'Je moet akkoord gaan met de risico\'s en backups hebben gemaakt.')
+            return
+        # Ensure backups done for each
+        missing = [d for d in to_start if not self.backup_done.get(d, False)]
+        if missing:
+            messagebox.showwarning('Backup', f'Make backups first for: {missing}')
+            return
+
+        if not messagebox.askyesno('Bevestig', f'Weet je zeker dat je BitLocker wilt uitschakelen voor: {to_start}? Dit decrypt de schijven.'):
+            return
+
+        self.stop_event.clear()
+        self.start_btn.configure(state='disabled')
+        self.cancel_btn.configure(state='normal')
+        self._append_log(f'Start uitschakelen voor: {to_start}')
+
+        def worker():
+            jobs = [DriveJob(d, DISABLE_STAGES, volume=self.volumes.get(d)) for d in to_start]
+            executor = JobExecutor(MAX_PARALLEL_JOBS, self.stop_event,
+                                   on_status=self.ui.status)
+            executor.run(jobs)
+            if self.stop_event.is_set():
+                self._append_log('Proces geannuleerd door gebruiker')
+            for job in jobs:
+                self._append_log('Tijden ' + format_job_timings(job))
+            self._append_log('Alle geselecteerde schijven verwerkt of proces gestopt.')
+            self.ui.call(self.cancel_btn.configure, state='disabled')
+            self.ui.call(self._update_start_state)
+
+        self.task_thread = threading.Thread(target=profile_phase('start_worker')(worker), daemon=True)
+        self.task_thread.start()
+
+    def cancel(self):
+        if messagebox.askyesno('Annuleer', 'Weet je zeker dat je wilt annuleren?'):
+            if self.detector.busy:
+                self.detector.cancel()
+                self.status_bar.configure(text='Ready')
+                self._append_log('Schijfdetectie geannuleerd.')
+            # always set: every run clears it when it starts, and a backup that is just starting must see it
+            self.stop_event.set()
+            if self.task_thread and self.task_thread.is_alive():
+                self._append_log('Annuleerverzoek ingediend...')
+            self.cancel_btn.configure(state='disabled')
+
+    def on_close(self):
+        self.detector.cancel()
+        if self.task_thread and self.task_thread.is_alive():
+            if not messagebox.askyesno('Afsluiten', 'Er loopt een proces. Wil je echt afsluiten (dit annuleert het proces)?'):
+                return
+            self.stop_event.set()
+        self.ui.stop()
+        self.destroy()
+
+    def show_about(self):
+        info = f"{PRODUCT_NAME} - {COMPANY_NAME}\nVersion: {VERSION}\n\nLicence: see EULA.txt"
+        if messagebox.askyesno('About', info + '\n\nBekijk EULA?'):
+            try:
+                subprocess.Popen(['notepad.exe', str(APP_SCRIPT.with_name('EULA.txt'))])
+            except Exception as e:
+                messagebox.showerror('Fout', f'Kan EULA niet openen: {e}')
+
+    def _show_text_file(self, title: str, file_path: Path) -> None:
+        if not file_path.exists():
+            messagebox.showerror(title, f'Bestand niet gevonden: {file_path}')
+            return
+        try:
+            txt = file_path.read_text(encoding='utf-8')
+        except Exception as e:
+            messagebox.showerror(title, f'Kan bestand niet openen: {e}')
+            return
+        win = tk.Toplevel(self)
+        win.title(title)
+        win.geometry('700x500')
+        frm = ttk.Frame(win, padding=8)
+        frm.pack(fill='both', expand=True)
+        text = tk.Text(frm, wrap='word')
+        text.insert('1.0', txt)
+        text.configure(state='disabled')
+        text.pack(fill='both', expand=True, side='left')
+        sb = ttk.Scrollbar(frm, orient='vertical', command=text.yview)
+        sb.pack(side='right', fill='y')
+        text['yscrollcommand'] = sb.set
+        btn_frame = ttk.Frame(win)
+        btn_frame.pack(fill='x')
+        ttk.Button(btn_frame, text='Open in Notepad', command=lambda: subprocess.Popen(['notepad.exe', str(file_path)])).pack(side='left', padx=4)
+        ttk.Button(btn_frame, text='Close', command=win.destroy).pack(side='right', padx=4)
+
+    def show_eula(self):
+        self._show_text_file('EULA', APP_SCRIPT.with_name('EULA.txt'))
+
+    def show_terms(self):
+        self._show_text_file('Terms of Service', APP_SCRIPT.with_name('TERMS.txt'))
+
+    def show_readme(self):
+        self._show_text_file('README', APP_SCRIPT.with_name('README.md'))
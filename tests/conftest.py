@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import Bit  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _log_to_tmp(tmp_path_factory):
+    """Keep test runs out of Bit.log next to the script."""
+    Bit._log_writer.flush()
+    Bit._log_writer.path = tmp_path_factory.mktemp('log') / 'Bit.log'
+    Bit._log_writer.echo = False
+    yield
@@ -0,0 +1,73 @@
+"""PowerShellWorker against the Python stand-in that speaks the worker protocol (runs on any OS)."""
+import sys
+import threading
+import time
+
+import pytest
+
+import Bit
+
+
+@pytest.fixture
+def worker():
+    w = Bit.PowerShellWorker(Bit.stand_in_worker_argv())
+    yield w
+    w.close()
+
+
+def test_runs_commands_in_one_process(worker):
+    assert worker.run('Get-Date') == (0, 'Get-Date\n')
+    pid = worker._proc.pid
+    assert worker.run('Get-BitLockerVolume') == (0, 'Get-BitLockerVolume\n')
+    assert worker._proc.pid == pid
+    assert worker.restarts == 0
+
+
+def test_worker_exiting_before_ready_line():
+    w = Bit.PowerShellWorker([sys.executable, '-c', 'pass'])
+    rc, out = w.run('Get-Date')
+    assert rc == 1
+    assert 'start mislukt' in out
+
+
+def test_missing_program():
+    rc, out = Bit.PowerShellWorker(['bit-no-such-program']).run('Get-Date')
+    assert rc == 127
+
+
+def test_timeout_kills_and_restarts(worker):
+    t0 = time.monotonic()
+    rc, out = worker.run('sleep 30', timeout=0.5)
+    assert rc == Bit.RC_TIMEOUT
+    assert time.monotonic() - t0 < 10
+    assert worker.run('after') == (0, 'after\n')
+    assert worker.restarts == 1
+
+
+def test_cancel_interrupts_running_command(worker):
+    worker.run('warm-up')
+    cancel = Bit.CancelEvent()
+    threading.Timer(0.3, cancel.set).start()
+    t0 = time.monotonic()
+    with Bit.cancel_scope(cancel):
+        rc, out = worker.run('sleep 30')
+    assert rc == Bit.RC_CANCELLED
+    assert time.monotonic() - t0 < 10
+    assert worker.run('after') == (0, 'after\n')
+    assert worker.restarts == 1
+
+
+def test_already_cancelled_does_not_send(worker):
+    cancel = Bit.CancelEvent()
+    cancel.set()
+    with Bit.cancel_scope(cancel):
+        assert worker.run('Disable-BitLocker')[0] == Bit.RC_CANCELLED
+    assert worker._proc is None
+
+
+def test_worker_dying_mid_command_is_not_retried(worker):
+    rc, out = worker.run('exit')
+    assert rc == 1
+    assert 'worker fout' in out
+    assert worker.run('next') == (0, 'next\n')
+    assert worker.restarts == 1